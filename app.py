@@ -1,7 +1,7 @@
 import streamlit as st
 st.set_page_config(layout="wide", page_title="Job Fit Analyzer", initial_sidebar_state="expanded",page_icon="🤖")
 
-from matcher import calculate_match_score 
+from matcher import calculate_match_score, iter_matches, ResumeMatchProfile
 import json
 import os
 import spacy
@@ -181,10 +181,17 @@ if uploaded_file is not None:
                 logging.error(f"Failed to process resume: {uploaded_file.name} - {error_msg}")
                 if 'parsed_resume_data' in st.session_state:
                     del st.session_state.parsed_resume_data
+                if 'resume_match_profile' in st.session_state:
+                    del st.session_state.resume_match_profile
         
         if processing_successful and 'parsed_resume_data' in st.session_state:
             st.success("✅ Resume processed successfully!")
             data_to_display_resume = st.session_state.parsed_resume_data
+
+            # Matcher features for the resume are kept across reruns and only rebuilt for a different resume
+            if st.session_state.get('resume_match_profile') is None or \
+               st.session_state.resume_match_profile.parsed_resume != data_to_display_resume:
+                st.session_state.resume_match_profile = ResumeMatchProfile(data_to_display_resume)
             
             st.markdown("---")
             st.subheader("📄 Your Parsed Resume Information:")
@@ -273,44 +280,54 @@ if uploaded_file is not None:
                      spinner_text = (f"Calculating job matches against {len(jobs_to_display_and_match)} filtered jobs "
                                 f"(out of {len(ALL_PARSED_JOBS_FULL_LIST)} total)...")
 
-                with st.spinner(spinner_text):
-                    for job_data_from_file in jobs_to_display_and_match: 
-                        match_details = calculate_match_score(data_to_display_resume, job_data_from_file, NLP_MODEL)
-                        
-                        desc_text_source = job_data_from_file.get('job_description_text_raw_kaggle', '')
-                        if not desc_text_source.strip() and job_data_from_file.get('responsibilities'):
-                            desc_text_source = " ".join(job_data_from_file.get('responsibilities', []))
-                        description_snippet = (desc_text_source[:250] + "...") if len(desc_text_source) > 250 else desc_text_source
-                        if not description_snippet.strip(): description_snippet = "No detailed description available."
-
-                        all_job_match_results.append({
-                            "job_title": job_data_from_file.get("job_title", "N/A"), 
-                            "company": job_data_from_file.get("company_name_kaggle", "N/A"),
-                            "location": job_data_from_file.get("location_kaggle", "N/A"),
-                            "date_posted": job_data_from_file.get("job_posting_date_kaggle", "N/A"),
-                            "description_snippet": description_snippet,
-                            "match_details": match_details,
-                            "job_id_for_debug": job_data_from_file.get("job_id_kaggle", "N/A"),
-                            "original_job_data": job_data_from_file 
-                        })
-                
-                sorted_matches = sorted(all_job_match_results, key=lambda x: x['match_details'].get('score', 0), reverse=True)
-                if sorted_matches:
-                    st.write(f"Showing top matches from {len(jobs_to_display_and_match)} currently displayed jobs:")
+                st.write(f"Showing top matches from {len(jobs_to_display_and_match)} currently displayed jobs:")
+                # Only the displayed top matches are fully scored, so the slider is read before matching
+                if len(jobs_to_display_and_match) == 1:
+                    num_matches_to_show = 1
+                else:
+                    num_matches_to_show = st.slider(
+                        "Number of top matches to display:", 
+                        min_value=1, 
+                        max_value=max(2, min(40, len(jobs_to_display_and_match))),
+                        value=min(5, len(jobs_to_display_and_match)), 
+                        key="matches_slider"
+                    )
+
+                # Snapshots of the best matches so far are shown while the rest of the jobs are scored
+                match_progress = st.progress(0.0, text=spinner_text)
+                early_matches_placeholder = st.empty()
+                top_matches = []
+                for snapshot in iter_matches(st.session_state.resume_match_profile, jobs_to_display_and_match, num_matches_to_show, NLP_MODEL):
+                    top_matches = snapshot['matches']
+                    match_progress.progress(snapshot['scored'] / snapshot['total'], text=spinner_text)
+                    if snapshot['scored'] < snapshot['total']:
+                        early_matches_placeholder.caption("Best so far: " + ", ".join(
+                            f"{jobs_to_display_and_match[job_index].get('job_title', 'N/A')} ({match_details.get('score', 0) * 100:.0f}%)"
+                            for job_index, match_details in top_matches))
+                match_progress.empty()
+                early_matches_placeholder.empty()
+                for job_index, match_details in top_matches: 
+                    job_data_from_file = jobs_to_display_and_match[job_index]
                     
-                    if len(sorted_matches) == 1:
-                        num_matches_to_show = 1
-                    elif len(sorted_matches) > 1:
-                        num_matches_to_show = st.slider(
-                            "Number of top matches to display:", 
-                            min_value=1, 
-                            max_value=max(2, min(40, len(sorted_matches))),
-                            value=min(5, len(sorted_matches)), 
-                            key="matches_slider"
-                        )
-                    else: 
-                        num_matches_to_show = 0
-
+                    desc_text_source = job_data_from_file.get('job_description_text_raw_kaggle', '')
+                    if not desc_text_source.strip() and job_data_from_file.get('responsibilities'):
+                        desc_text_source = " ".join(job_data_from_file.get('responsibilities', []))
+                    description_snippet = (desc_text_source[:250] + "...") if len(desc_text_source) > 250 else desc_text_source
+                    if not description_snippet.strip(): description_snippet = "No detailed description available."
+
+                    all_job_match_results.append({
+                        "job_title": job_data_from_file.get("job_title", "N/A"), 
+                        "company": job_data_from_file.get("company_name_kaggle", "N/A"),
+                        "location": job_data_from_file.get("location_kaggle", "N/A"),
+                        "date_posted": job_data_from_file.get("job_posting_date_kaggle", "N/A"),
+                        "description_snippet": description_snippet,
+                        "match_details": match_details,
+                        "job_id_for_debug": job_data_from_file.get("job_id_kaggle", "N/A"),
+                        "original_job_data": job_data_from_file 
+                    })
+            
+                sorted_matches = all_job_match_results # iter_matches snapshots are already best first
+                if sorted_matches:
                     for i, result_entry in enumerate(sorted_matches[:num_matches_to_show]):
                         job_title_display = result_entry["job_title"]
                         company_display = result_entry["company"]
@@ -430,3 +447,5 @@ else:
     st.info("☝️ Upload a resume file to get started.")
     if 'parsed_resume_data' in st.session_state: 
         del st.session_state.parsed_resume_data
+    if 'resume_match_profile' in st.session_state:
+        del st.session_state.resume_match_profile
@@ -0,0 +1,160 @@
+import asyncio
+import functools
+import logging
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from matcher import (calculate_match_score, score_matches, top_k_matches, get_resume_profile,
+                     COMPONENT_SCORE_DTYPE, MATCH_CHUNK_SIZE)
+
+
+DEFAULT_ASYNC_WORKERS = min(8, os.cpu_count() or 1)
+# Matching calls are short and mostly NumPy; parsing runs the whole spaCy pipeline over a document
+DEFAULT_MAX_CONCURRENT_MATCHES = 8
+DEFAULT_MAX_CONCURRENT_PARSES = 2
+
+
+class AsyncMatcher:
+    """
+    asyncio facade over the blocking matcher and parsers. Every call runs on
+    the executor (a thread pool by default; any concurrent.futures executor
+    works as long as the arguments can be sent to it), so spaCy and NumPy
+    work never blocks the event loop. The matcher's shared caches and skill
+    vocabulary are locked, so the default threads can share them. Separate semaphores bound how many
+    match and parse calls run at once. Cancelling an awaiting task cancels
+    the chunks of its batch that have not started yet; a running chunk
+    finishes and its result is dropped.
+    """
+    def __init__(self, executor=None, max_concurrent_matches=DEFAULT_MAX_CONCURRENT_MATCHES,
+                 max_concurrent_parses=DEFAULT_MAX_CONCURRENT_PARSES):
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=DEFAULT_ASYNC_WORKERS, thread_name_prefix='async-matching')
+        self.max_concurrent_matches = max_concurrent_matches
+        self.max_concurrent_parses = max_concurrent_parses
+        # event loop -> (match semaphore, parse semaphore); asyncio semaphores belong to one loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _get_semaphores(self):
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            semaphores = (asyncio.Semaphore(self.max_concurrent_matches), asyncio.Semaphore(self.max_concurrent_parses))
+            self._semaphores[loop] = semaphores
+        return semaphores
+
+    async def _run(self, semaphore, function, *args, **kwargs):
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(function, *args, **kwargs))
+
+    async def match_async(self, parsed_resume, parsed_jd, nlp_model):
+        """calculate_match_score on the executor."""
+        match_semaphore, _ = self._get_semaphores()
+        return await self._run(match_semaphore, calculate_match_score, parsed_resume, parsed_jd, nlp_model)
+
+    async def score_matches_async(self, parsed_resume, parsed_jds, nlp_model, chunk_size=MATCH_CHUNK_SIZE):
+        """
+        score_matches over the JDs, split into chunks that run concurrently
+        (up to the match semaphore). Returns the same COMPONENT_SCORE_DTYPE
+        record array as one score_matches call.
+        """
+        if not parsed_resume or not len(parsed_jds):
+            return np.zeros(len(parsed_jds), dtype=COMPONENT_SCORE_DTYPE)
+        # Built once here instead of once per chunk
+        resume_profile = get_resume_profile(parsed_resume)
+        match_semaphore, _ = self._get_semaphores()
+        chunk_tasks = [asyncio.ensure_future(self._run(match_semaphore, score_matches, resume_profile,
+                                                       parsed_jds[start:start + chunk_size], nlp_model))
+                       for start in range(0, len(parsed_jds), chunk_size)]
+        try:
+            return np.concatenate(await asyncio.gather(*chunk_tasks))
+        except asyncio.CancelledError:
+            unfinished = [task for task in chunk_tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            logging.info(f"ASYNC MATCHING: Batch cancelled, {len(unfinished)} of {len(chunk_tasks)} chunks dropped.")
+            raise
+
+    async def top_k_matches_async(self, parsed_resume, parsed_jds, k, nlp_model, candidate_indexes=None):
+        """top_k_matches on the executor."""
+        match_semaphore, _ = self._get_semaphores()
+        return await self._run(match_semaphore, top_k_matches, parsed_resume, parsed_jds, k, nlp_model,
+                               candidate_indexes=candidate_indexes)
+
+    async def parse_resume_async(self, filepath, nlp_model=None):
+        """
+        resume_parser.parse_resume_file with the parser's global skills,
+        section headers and education levels (and its global model unless
+        nlp_model is given).
+        """
+        _, parse_semaphore = self._get_semaphores()
+        return await self._run(parse_semaphore, _parse_resume_file, filepath, nlp_model)
+
+    async def parse_jd_async(self, filepath):
+        """job_description_parser.parse_jd_file on the executor."""
+        _, parse_semaphore = self._get_semaphores()
+        return await self._run(parse_semaphore, _parse_jd_file, filepath)
+
+    def close(self):
+        if self._owns_executor:
+            self.executor.shutdown(cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _parse_resume_file(filepath, nlp_model=None):
+    # resume_parser loads its model and skills on first access of the globals below
+    import resume_parser
+    return resume_parser.parse_resume_file(
+        filepath, nlp_model or resume_parser.NLP_MODEL_GLOBAL, resume_parser.TECH_SKILLS_LIST_GLOBAL,
+        resume_parser.TECH_SKILLS_SET_GLOBAL, resume_parser.SECTION_HEADERS_GLOBAL, resume_parser.EDUCATION_LEVELS_GLOBAL)
+
+
+def _parse_jd_file(filepath):
+    import job_description_parser
+    return job_description_parser.parse_jd_file(filepath)
+
+
+_DEFAULT_ASYNC_MATCHER = None
+
+
+def configure_async_matching(executor=None, max_concurrent_matches=DEFAULT_MAX_CONCURRENT_MATCHES,
+                             max_concurrent_parses=DEFAULT_MAX_CONCURRENT_PARSES):
+    """Replaces the AsyncMatcher used by the module-level *_async functions and returns it."""
+    global _DEFAULT_ASYNC_MATCHER
+    if _DEFAULT_ASYNC_MATCHER is not None:
+        _DEFAULT_ASYNC_MATCHER.close()
+    _DEFAULT_ASYNC_MATCHER = AsyncMatcher(executor, max_concurrent_matches, max_concurrent_parses)
+    return _DEFAULT_ASYNC_MATCHER
+
+
+def get_async_matcher():
+    if _DEFAULT_ASYNC_MATCHER is None:
+        return configure_async_matching()
+    return _DEFAULT_ASYNC_MATCHER
+
+
+async def match_async(parsed_resume, parsed_jd, nlp_model):
+    return await get_async_matcher().match_async(parsed_resume, parsed_jd, nlp_model)
+
+
+async def score_matches_async(parsed_resume, parsed_jds, nlp_model, chunk_size=MATCH_CHUNK_SIZE):
+    return await get_async_matcher().score_matches_async(parsed_resume, parsed_jds, nlp_model, chunk_size)
+
+
+async def top_k_matches_async(parsed_resume, parsed_jds, k, nlp_model, candidate_indexes=None):
+    return await get_async_matcher().top_k_matches_async(parsed_resume, parsed_jds, k, nlp_model, candidate_indexes)
+
+
+async def parse_resume_async(filepath, nlp_model=None):
+    return await get_async_matcher().parse_resume_async(filepath, nlp_model)
+
+
+async def parse_jd_async(filepath):
+    return await get_async_matcher().parse_jd_async(filepath)
@@ -0,0 +1,102 @@
+"""
+Deviation benchmark for hashed keyword vectors. Scores synthetic resumes
+against a synthetic JD corpus with the exact keyword overlap and with
+HashedKeywordScorer at several widths, and reports how far the hashed
+keyword scores drift (mean / p99 / max absolute error, top-k agreement)
+together with the memory of the hashed JD features. Results go to JSON.
+
+    python benchmark_keyword_hashing.py --jds 10000 --features 4096 65536 1048576
+"""
+import argparse
+import datetime
+import json
+import logging
+import platform
+import numpy as np
+
+from matcher import JDMatchProfile, ResumeMatchProfile, score_matches
+from keyword_index import HashedKeywordScorer, HASHED_KEYWORD_FEATURES
+from synthetic_corpus import CorpusTemplates, generate_jds, generate_resumes
+
+
+DEFAULT_FEATURE_WIDTHS = [2 ** 12, 2 ** 16, HASHED_KEYWORD_FEATURES]
+DEFAULT_OUTPUT_PATH = 'keyword_hashing_results.json'
+
+
+def _top_k_agreement(exact_scores, hashed_scores, k):
+    # Share of the exact top-k JDs that the hashed scores also put in their top-k
+    k = min(k, len(exact_scores))
+    exact_top = set(np.argsort(-exact_scores, kind='stable')[:k].tolist())
+    hashed_top = set(np.argsort(-hashed_scores, kind='stable')[:k].tolist())
+    return len(exact_top & hashed_top) / k if k else 1.0
+
+
+def run_benchmark(n_jds, feature_widths, queries=5, k=10, seed=0):
+    """Returns one result record per hashed width, compared against the exact keyword scores."""
+    templates = CorpusTemplates.load()
+    jd_profiles = [JDMatchProfile(jd) for jd in generate_jds(n_jds, seed, templates)]
+    resume_profiles = [ResumeMatchProfile(resume) for resume in generate_resumes(queries, seed, templates)]
+    exact_scores = [score_matches(resume_profile, jd_profiles, None)['keyword'] for resume_profile in resume_profiles]
+    vocabulary_size = len(set().union(*(p.meaningful_tokens for p in jd_profiles)))
+
+    results = []
+    for n_features in feature_widths:
+        scorer = HashedKeywordScorer(n_features).fit(jd_profiles)
+        jd_matrix = scorer.jd_matrix
+        errors = []
+        agreements = []
+        for resume_profile, exact in zip(resume_profiles, exact_scores):
+            hashed = scorer.score(resume_profile)
+            errors.append(np.abs(hashed - exact))
+            agreements.append(_top_k_agreement(exact, hashed, k))
+        errors = np.concatenate(errors)
+        record = {
+            'n_features': n_features,
+            'corpus_size': n_jds,
+            'vocabulary_size': vocabulary_size,
+            'mean_abs_error': float(errors.mean()),
+            'p99_abs_error': float(np.percentile(errors, 99)),
+            'max_abs_error': float(errors.max()),
+            'exact_pair_share': float((errors == 0).mean()),
+            'top_k_agreement': float(np.mean(agreements)),
+            'jd_feature_bytes': int(jd_matrix.data.nbytes + jd_matrix.indices.nbytes + jd_matrix.indptr.nbytes),
+        }
+        results.append(record)
+        print(f"KEYWORD HASHING: 2^{int(np.log2(n_features)):<3} mean {record['mean_abs_error']:.5f} "
+              f"p99 {record['p99_abs_error']:.5f} max {record['max_abs_error']:.5f} "
+              f"top-{k} {record['top_k_agreement']:.3f} features {record['jd_feature_bytes'] / 1e6:.1f}MB")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure how far hashed keyword scores deviate from exact overlap.")
+    parser.add_argument('--jds', type=int, default=5000, help="Synthetic JD corpus size")
+    parser.add_argument('--features', type=int, nargs='+', default=DEFAULT_FEATURE_WIDTHS, help="Hashed vector widths to compare")
+    parser.add_argument('--queries', type=int, default=5, help="Resumes scored against the corpus")
+    parser.add_argument('--k', type=int, default=10, help="k for top-k agreement")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    results = run_benchmark(args.jds, args.features, args.queries, args.k, args.seed)
+    report = {
+        'metadata': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'queries': args.queries,
+            'k': args.k,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Keyword hashing results written to {args.output}")
+    return report
+
+
+if __name__ == '__main__':
+    main()
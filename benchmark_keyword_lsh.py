@@ -0,0 +1,142 @@
+"""
+Recall benchmark of KeywordLSHIndex against the exact keyword overlap on
+the Kaggle sample (parsed_kaggle_jobs_sample.json) and the RemoteOK sample
+(remoteok_parsed_jds.csv), queried with the parsed test resumes. For every
+bands x rows configuration it reports recall@k of the exact top-k keyword
+scores, the share of the corpus returned as candidates and the query
+latency next to exact scoring. Results are written to JSON.
+
+    python benchmark_keyword_lsh.py --configs 32x1 64x1 32x2 128x2 --k 10
+"""
+import argparse
+import ast
+import datetime
+import glob
+import json
+import logging
+import os
+import platform
+import time
+import numpy as np
+import pandas as pd
+
+from matcher import ResumeMatchProfile
+from keyword_index import KeywordIndex
+from keyword_lsh import KeywordLSHIndex, lsh_threshold
+
+
+DEFAULT_CONFIGS = ['32x1', '64x1', '32x2', '64x2', '128x2']
+DEFAULT_OUTPUT_PATH = 'keyword_lsh_results.json'
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+KAGGLE_SAMPLE_PATH = os.path.join(PROJECT_DIR, 'parsed_kaggle_jobs_sample.json')
+REMOTEOK_SAMPLE_PATH = os.path.join(PROJECT_DIR, 'remoteok_parsed_jds.csv')
+RESUMES_GLOB = os.path.join(PROJECT_DIR, 'tests', 'data', 'resumes', '*.json')
+REMOTEOK_LIST_COLUMNS = ['responsibilities', 'qualifications', 'preferred_qualifications', 'skills', 'education', 'compensation']
+
+
+def load_kaggle_jds(path=KAGGLE_SAMPLE_PATH):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_remoteok_jds(path=REMOTEOK_SAMPLE_PATH):
+    """Parsed RemoteOK JDs as dicts, list columns turned back into lists."""
+    frame = pd.read_csv(path)
+    for column in REMOTEOK_LIST_COLUMNS:
+        if column in frame.columns:
+            frame[column] = [ast.literal_eval(value) if isinstance(value, str) and value.startswith('[') else []
+                             for value in frame[column]]
+    return frame.to_dict(orient='records')
+
+
+def parse_config(config):
+    bands, rows = config.lower().split('x')
+    return int(bands), int(rows)
+
+
+def recall_at_k(exact_scores, candidate_ids, k):
+    # Share of the exact top-k found, counting any candidate that ties the exact k-th score
+    k = min(k, len(exact_scores))
+    kth_score = np.sort(exact_scores)[::-1][k - 1]
+    if kth_score <= 0:
+        return 1.0
+    found = int((exact_scores[candidate_ids] >= kth_score).sum()) if len(candidate_ids) else 0
+    return min(found, k) / k
+
+
+def run_benchmark(datasets, configs, k=10, seed=0):
+    resume_profiles = []
+    for path in sorted(glob.glob(RESUMES_GLOB)):
+        with open(path, 'r', encoding='utf-8') as f:
+            resume_profiles.append(ResumeMatchProfile(json.load(f)))
+    results = []
+    for dataset_name, parsed_jds in datasets.items():
+        exact_index = KeywordIndex('overlap').fit(parsed_jds)
+        exact_latencies, exact_scores = [], []
+        for resume_profile in resume_profiles:
+            start = time.perf_counter()
+            exact_scores.append(exact_index.score(resume_profile))
+            exact_latencies.append(time.perf_counter() - start)
+
+        for bands, rows in configs:
+            start = time.perf_counter()
+            lsh_index = KeywordLSHIndex(bands, rows, seed).fit(parsed_jds)
+            build_seconds = time.perf_counter() - start
+            latencies, recalls, candidate_shares = [], [], []
+            for resume_profile, scores in zip(resume_profiles, exact_scores):
+                start = time.perf_counter()
+                candidate_ids = lsh_index.candidates(resume_profile)
+                latencies.append(time.perf_counter() - start)
+                recalls.append(recall_at_k(scores, candidate_ids, k))
+                candidate_shares.append(len(candidate_ids) / max(len(parsed_jds), 1))
+            record = {
+                'dataset': dataset_name,
+                'corpus_size': len(parsed_jds),
+                'bands': bands,
+                'rows': rows,
+                'jaccard_threshold': lsh_threshold(bands, rows),
+                'recall_at_k': float(np.mean(recalls)),
+                'candidate_share': float(np.mean(candidate_shares)),
+                'build_seconds': build_seconds,
+                'p50_ms': float(np.percentile(latencies, 50)) * 1e3,
+                'exact_p50_ms': float(np.percentile(exact_latencies, 50)) * 1e3,
+            }
+            results.append(record)
+            print(f"KEYWORD LSH: {dataset_name:<8} {bands:>3}x{rows:<2} recall@{k} {record['recall_at_k']:.3f} "
+                  f"candidates {record['candidate_share'] * 100:.1f}% p50 {record['p50_ms']:.2f}ms "
+                  f"(exact {record['exact_p50_ms']:.2f}ms)")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure MinHash LSH candidate recall against exact keyword overlap.")
+    parser.add_argument('--configs', nargs='+', default=DEFAULT_CONFIGS, help="bands x rows configurations, e.g. 32x2")
+    parser.add_argument('--k', type=int, default=10, help="k for recall@k")
+    parser.add_argument('--kaggle', default=KAGGLE_SAMPLE_PATH)
+    parser.add_argument('--remoteok', default=REMOTEOK_SAMPLE_PATH)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    datasets = {'kaggle': load_kaggle_jds(args.kaggle), 'remoteok': load_remoteok_jds(args.remoteok)}
+    results = run_benchmark(datasets, [parse_config(config) for config in args.configs], args.k, args.seed)
+    report = {
+        'metadata': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'k': args.k,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Keyword LSH results written to {args.output}")
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Matcher throughput benchmark. Generates synthetic JD corpora of the given
+sizes and measures single-pair, batch and top-k matching: pairs/sec,
+p50/p99 latency and the process's peak RSS so far (a process-lifetime
+maximum, so later sizes include the memory of earlier ones; run one size
+per invocation to measure a size on its own). Results are written to a
+JSON file so runs can be compared across releases.
+
+    python benchmark_matcher.py --sizes 1000 10000 100000 --output benchmark_results.json
+"""
+import argparse
+import datetime
+import json
+import logging
+import platform
+import random
+import sys
+import time
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+from lazy_loading import get_nlp_model
+from matcher import calculate_match_score, calculate_match_scores, top_k_matches, JDMatchProfile, ResumeMatchProfile
+from synthetic_corpus import CorpusTemplates, generate_jds, generate_resumes
+
+
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_OUTPUT_PATH = 'benchmark_results.json'
+
+
+def process_peak_rss_mb():
+    """Peak RSS of this process since it started, in MB; None when neither resource nor psutil is available."""
+    if resource is not None:
+        # ru_maxrss is in KB on Linux and in bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    memory_info = psutil.Process().memory_info()
+    # peak_wset is the Windows peak working set; other platforms only report the current RSS
+    return getattr(memory_info, 'peak_wset', memory_info.rss) / (1024 * 1024)
+
+
+def summarize(mode, corpus_size, latencies, pairs_per_call):
+    latencies = np.asarray(latencies, dtype=np.float64)
+    total_seconds = float(latencies.sum())
+    total_pairs = pairs_per_call * len(latencies)
+    return {
+        'mode': mode,
+        'corpus_size': corpus_size,
+        'calls': len(latencies),
+        'pairs': total_pairs,
+        'pairs_per_sec': total_pairs / total_seconds if total_seconds > 0 else None,
+        'p50_ms': float(np.percentile(latencies, 50)) * 1e3,
+        'p99_ms': float(np.percentile(latencies, 99)) * 1e3,
+        'process_peak_rss_mb': process_peak_rss_mb(),
+    }
+
+
+def time_calls(function, argument_sets):
+    latencies = []
+    for arguments in argument_sets:
+        start = time.perf_counter()
+        function(*arguments)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_benchmark(sizes, queries=5, pair_samples=1000, k=10, nlp_model=None, seed=0):
+    """Runs every mode for every corpus size and returns the list of result records."""
+    templates = CorpusTemplates.load()
+    resume_profiles = [ResumeMatchProfile(resume) for resume in generate_resumes(queries, seed, templates)]
+    rng = random.Random(seed)
+    results = []
+
+    for corpus_size in sizes:
+        jds = generate_jds(corpus_size, seed, templates)
+        start = time.perf_counter()
+        jd_profiles = [JDMatchProfile(jd) for jd in jds]
+        profile_seconds = time.perf_counter() - start
+        print(f"BENCHMARK: {corpus_size} JDs generated, profiles built in {profile_seconds:.2f}s.")
+        results.append({'mode': 'jd_profile_build', 'corpus_size': corpus_size, 'seconds': profile_seconds,
+                        'process_peak_rss_mb': process_peak_rss_mb()})
+
+        sampled_pairs = [(rng.choice(resume_profiles), rng.choice(jd_profiles), nlp_model) for _ in range(pair_samples)]
+        results.append(summarize('single_pair', corpus_size, time_calls(calculate_match_score, sampled_pairs), 1))
+
+        batch_calls = [(resume_profile, jd_profiles, nlp_model) for resume_profile in resume_profiles]
+        results.append(summarize('batch', corpus_size, time_calls(calculate_match_scores, batch_calls), corpus_size))
+
+        top_k_calls = [(resume_profile, jd_profiles, k, nlp_model) for resume_profile in resume_profiles]
+        results.append(summarize('top_k', corpus_size, time_calls(top_k_matches, top_k_calls), corpus_size))
+
+        for record in results[-3:]:
+            rss = record['process_peak_rss_mb']
+            rss_text = f"{rss:.0f}MB" if rss is not None else "n/a"
+            print(f"BENCHMARK: {record['mode']:<12} n={corpus_size:<8} {record['pairs_per_sec'] or 0:>12.0f} pairs/s "
+                  f"p50 {record['p50_ms']:.2f}ms p99 {record['p99_ms']:.2f}ms peak rss {rss_text}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark matcher throughput on synthetic corpora.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="JD corpus sizes, e.g. 1000 10000 100000 1000000")
+    parser.add_argument('--queries', type=int, default=5, help="Resumes matched against each corpus in batch/top-k mode")
+    parser.add_argument('--pair-samples', type=int, default=1000, help="Random pairs timed in single-pair mode")
+    parser.add_argument('--k', type=int, default=10, help="k for top-k mode")
+    parser.add_argument('--nlp-model', default=None, help="spaCy model name for title vectors (default: no model, Jaccard titles)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    # The matcher logs per pair at INFO/WARNING level; keep that out of the timings
+    logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    nlp_model = get_nlp_model((args.nlp_model,)) if args.nlp_model else None
+    if args.nlp_model and nlp_model is None:
+        parser.error(f"spaCy model '{args.nlp_model}' could not be loaded")
+    results = run_benchmark(args.sizes, args.queries, args.pair_samples, args.k, nlp_model, args.seed)
+    report = {
+        'metadata': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'nlp_model': args.nlp_model,
+            'queries': args.queries,
+            'pair_samples': args.pair_samples,
+            'k': args.k,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Benchmark results written to {args.output}")
+    return report
+
+
+if __name__ == '__main__':
+    main()
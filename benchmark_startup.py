@@ -0,0 +1,140 @@
+"""
+Import-time budget of the project's entry points. Every module is imported
+in a fresh interpreter under `python -X importtime`, and the benchmark
+reports the module's cumulative import time (median of --repeats runs), the
+slowest packages it pulled in and which heavy dependencies (spaCy, pandas,
+scikit-learn, SciPy, Streamlit) were imported. Results are written to JSON;
+--check exits with status 1 when an entry point is over budget.
+
+Target: the matcher and the modules built on it (caches, indexes, async and
+process-pool workers, parsers) import in under 0.25 s, i.e. NumPy plus
+project code, and never import spaCy, pandas or scikit-learn; those and
+the spaCy models are loaded on first use (see lazy_loading.py). Modules that
+need SciPy sparse matrices get 0.6 s and the pandas-backed columnar matcher
+1.0 s.
+
+    python benchmark_startup.py --repeats 5 --check
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import numpy as np
+
+
+DEFAULT_OUTPUT_PATH = 'startup_results.json'
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ('spacy', 'pandas', 'sklearn', 'scipy', 'streamlit')
+
+# entry point -> (budget in seconds, heavy modules it may import)
+STARTUP_BUDGETS = {
+    'matcher': (0.25, ()),
+    'match_cache': (0.25, ()),
+    'async_matching': (0.25, ()),
+    'parallel_matching': (0.25, ()),
+    'resume_parser': (0.25, ()),
+    'job_description_parser': (0.25, ()),
+    'keyword_index': (0.25, ()),
+    'keyword_lsh': (0.25, ()),
+    'title_ann': (0.25, ()),
+    'benchmark_matcher': (0.25, ()),
+    'match_matrix': (0.6, ('scipy',)),
+    'component_store': (0.6, ('scipy',)),
+    'columnar_matcher': (1.0, ('pandas', 'scipy')),
+}
+
+
+def parse_importtime(log):
+    """
+    {module: (self seconds, cumulative seconds)} from `-X importtime` stderr
+    lines such as "import time:       532 |       1234 |   numpy.core".
+    """
+    timings = {}
+    for line in log.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        timings[fields[2].strip()] = (int(fields[0]) / 1e6, int(fields[1]) / 1e6)
+    return timings
+
+
+def measure_import(module_name, python=sys.executable):
+    """Import timings of module_name in a fresh interpreter started in the project directory."""
+    completed = subprocess.run([python, '-X', 'importtime', '-c', f'import {module_name}'],
+                               cwd=PROJECT_DIR, capture_output=True, text=True, check=False)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module_name} failed:\n{completed.stderr[-2000:]}")
+    return parse_importtime(completed.stderr)
+
+
+def heavy_modules_imported(timings):
+    top_level = {name.split('.')[0] for name in timings}
+    return sorted(top_level.intersection(HEAVY_MODULES))
+
+
+def slowest_packages(timings, n=5):
+    """The n top-level packages with the largest summed self time."""
+    totals = {}
+    for name, (self_seconds, _) in timings.items():
+        package = name.split('.')[0]
+        totals[package] = totals.get(package, 0.0) + self_seconds
+    return [{'package': package, 'seconds': seconds}
+            for package, seconds in sorted(totals.items(), key=lambda item: -item[1])[:n]]
+
+
+def run_benchmark(entry_points, repeats=3):
+    results = []
+    for module_name in entry_points:
+        budget, allowed_heavy = STARTUP_BUDGETS.get(module_name, (None, ()))
+        runs = [measure_import(module_name) for _ in range(repeats)]
+        import_seconds = float(np.median([timings[module_name][1] for timings in runs]))
+        heavy = heavy_modules_imported(runs[-1])
+        unexpected_heavy = [name for name in heavy if name not in allowed_heavy]
+        record = {
+            'entry_point': module_name,
+            'import_seconds': import_seconds,
+            'budget_seconds': budget,
+            'heavy_modules': heavy,
+            'unexpected_heavy_modules': unexpected_heavy,
+            'slowest_packages': slowest_packages(runs[-1]),
+            'within_budget': (budget is None or import_seconds <= budget) and not unexpected_heavy,
+        }
+        results.append(record)
+        budget_text = f"{budget:.2f}s" if budget is not None else "none"
+        print(f"STARTUP: {module_name:<24} {import_seconds * 1e3:8.1f}ms (budget {budget_text}) "
+              f"heavy: {', '.join(heavy) or '-'}{'' if record['within_budget'] else '  OVER BUDGET'}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of the project's entry points.")
+    parser.add_argument('--entry-points', nargs='+', default=list(STARTUP_BUDGETS), help="Modules to import")
+    parser.add_argument('--repeats', type=int, default=3, help="Fresh interpreters per entry point (median is reported)")
+    parser.add_argument('--check', action='store_true', help="Exit with status 1 if an entry point is over budget")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.entry_points, args.repeats)
+    report = {
+        'metadata': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'repeats': args.repeats,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Startup results written to {args.output}")
+    if args.check and not all(record['within_budget'] for record in results):
+        sys.exit(1)
+    return report
+
+
+if __name__ == '__main__':
+    main()
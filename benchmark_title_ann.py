@@ -0,0 +1,123 @@
+"""
+Recall / latency benchmark of TitleANNIndex against exact (all lists
+probed) title search on a synthetic JD corpus. For every probe count it
+reports recall@k and p50/p99 query latency next to the exact search, and
+writes the results to JSON.
+
+    python benchmark_title_ann.py --jds 100000 --distinct-titles 50000 --probes 1 4 16 64 --nlp-model en_core_web_md
+
+Without --nlp-model a blank English pipeline with random word vectors is
+used, which is enough to measure the index itself.
+"""
+import argparse
+import datetime
+import json
+import logging
+import platform
+import time
+import numpy as np
+import spacy
+
+from matcher import ResumeMatchProfile
+from synthetic_corpus import CorpusTemplates, generate_jds, generate_resumes, diversify_titles, make_random_vector_model
+from title_ann import TitleANNIndex
+
+
+DEFAULT_PROBES = [1, 2, 4, 8, 16]
+DEFAULT_OUTPUT_PATH = 'title_ann_results.json'
+# Similarity slack when deciding whether an approximate hit ties the exact k-th hit
+RECALL_TOLERANCE = 1e-6
+
+
+def recall_at_k(exact_similarities, approximate_similarities):
+    # Share of the exact top-k found, counting any hit that ties the exact k-th similarity
+    if not len(exact_similarities):
+        return 1.0
+    kth_similarity = exact_similarities[-1]
+    found = int((approximate_similarities >= kth_similarity - RECALL_TOLERANCE).sum())
+    return min(found, len(exact_similarities)) / len(exact_similarities)
+
+
+def run_benchmark(n_jds, probes, queries=20, k=10, n_lists=None, distinct_titles=0, nlp_model=None,
+                  vector_dimension=64, seed=0):
+    templates = CorpusTemplates.load()
+    jds = generate_jds(n_jds, seed, templates)
+    if distinct_titles:
+        jds = diversify_titles(jds, distinct_titles, seed)
+    resume_profiles = [ResumeMatchProfile(resume) for resume in generate_resumes(queries, seed, templates)]
+    query_titles = [p.titles_for_scoring for p in resume_profiles if p.has_experience and p.titles_for_scoring]
+    if nlp_model is None:
+        nlp_model = make_random_vector_model([jd['job_title'] for jd in jds] + [t for titles in query_titles for t in titles],
+                                             vector_dimension, seed)
+
+    start = time.perf_counter()
+    index = TitleANNIndex.from_parsed_jds(jds, nlp_model, n_lists=n_lists, seed=seed)
+    build_seconds = time.perf_counter() - start
+    print(f"TITLE ANN BENCHMARK: {len(index)} distinct titles of {n_jds} JDs in {index.n_lists} lists, built in {build_seconds:.2f}s.")
+
+    def timed_searches(n_probe):
+        latencies, results = [], []
+        for titles in query_titles:
+            start = time.perf_counter()
+            results.append(index.search_titles(titles, nlp_model, k, n_probe))
+            latencies.append(time.perf_counter() - start)
+        return np.array(latencies), results
+
+    exact_latencies, exact_results = timed_searches(index.n_lists)
+    records = [{'mode': 'exact', 'n_probe': index.n_lists, 'recall_at_k': 1.0,
+                'p50_ms': float(np.percentile(exact_latencies, 50)) * 1e3,
+                'p99_ms': float(np.percentile(exact_latencies, 99)) * 1e3}]
+    for n_probe in probes:
+        latencies, results = timed_searches(n_probe)
+        recalls = [recall_at_k(exact_similarities, similarities)
+                   for (_, exact_similarities), (_, similarities) in zip(exact_results, results)]
+        records.append({'mode': 'ivf', 'n_probe': n_probe, 'recall_at_k': float(np.mean(recalls)),
+                        'p50_ms': float(np.percentile(latencies, 50)) * 1e3,
+                        'p99_ms': float(np.percentile(latencies, 99)) * 1e3})
+
+    for record in records:
+        record.update({'corpus_size': n_jds, 'distinct_titles': len(index), 'n_lists': index.n_lists,
+                       'k': k, 'build_seconds': build_seconds})
+        print(f"TITLE ANN BENCHMARK: {record['mode']:<5} n_probe={record['n_probe']:<5} recall@{k} {record['recall_at_k']:.3f} "
+              f"p50 {record['p50_ms']:.2f}ms p99 {record['p99_ms']:.2f}ms")
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the IVF title index against exact title search.")
+    parser.add_argument('--jds', type=int, default=20000, help="Synthetic JD corpus size")
+    parser.add_argument('--distinct-titles', type=int, default=0, help="Rewrite JD titles to this many distinct titles (0: keep the synthetic titles)")
+    parser.add_argument('--probes', type=int, nargs='+', default=DEFAULT_PROBES, help="n_probe values to compare")
+    parser.add_argument('--n-lists', type=int, default=None, help="IVF lists (default: sqrt of the distinct titles)")
+    parser.add_argument('--queries', type=int, default=20, help="Resumes used as queries")
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--nlp-model', default=None, help="spaCy model with vectors (default: random vectors)")
+    parser.add_argument('--vector-dim', type=int, default=64, help="Random vector size when no --nlp-model is given")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    nlp_model = spacy.load(args.nlp_model) if args.nlp_model else None
+    results = run_benchmark(args.jds, args.probes, args.queries, args.k, args.n_lists, args.distinct_titles,
+                            nlp_model, args.vector_dim, args.seed)
+    report = {
+        'metadata': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'nlp_model': args.nlp_model,
+            'queries': args.queries,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Title ANN results written to {args.output}")
+    return report
+
+
+if __name__ == '__main__':
+    main()
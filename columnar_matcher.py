@@ -0,0 +1,205 @@
+import logging
+import numpy as np
+import pandas as pd
+
+import match_timing
+from matcher import (clean_and_tokenize, build_jd_keyword_text, get_resume_profile, explain_match,
+                     _combine_component_scores, _merge_top_k, _explain_snapshot, COMMON_GENERIC_WORDS,
+                     COMPONENT_SCORE_DTYPE, MATCH_CHUNK_SIZE)
+from match_matrix import _binary_csr, _title_score_matrix
+from skill_vocab import skill_scores_from_counts
+
+
+def _column_values(frame, column):
+    # Plain Python list of a column's values, None for every row when the column is missing
+    if column not in frame.columns:
+        return [None] * len(frame)
+    return frame[column].tolist()
+
+
+def _token_columns(token_sets):
+    """Sparse binary (rows, vocabulary) matrix of the token sets plus the token -> column map."""
+    token_ids = {}
+    for tokens in token_sets:
+        for token in tokens:
+            token_ids.setdefault(token, len(token_ids))
+    return _binary_csr(token_sets, token_ids), token_ids
+
+
+def _overlap_counts(token_matrix, token_ids, query_tokens, rows):
+    # Shared tokens between the query and each of the rows: sum of the query's columns. The rows are
+    # sliced out first so a chunk of rows costs its own non-zeros, not the whole corpus's
+    query_columns = [token_ids[token] for token in query_tokens if token in token_ids]
+    if not query_columns:
+        return np.zeros(len(rows), dtype=np.int64)
+    return np.asarray(token_matrix[rows][:, query_columns].sum(axis=1), dtype=np.int64).ravel()
+
+
+def _experience_requirements(frame):
+    """
+    (years, no_requirement) arrays following JDMatchProfile: None or an
+    unparsable value means no requirement (score 0.5). NaN is kept as a
+    requirement nobody meets, same as float(nan) in the per-dict path.
+    """
+    if 'minimum_years_experience' not in frame.columns:
+        return np.full(len(frame), np.nan), np.ones(len(frame), dtype=bool)
+    column = frame['minimum_years_experience']
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=np.float64), np.zeros(len(frame), dtype=bool)
+
+    years = np.full(len(frame), np.nan)
+    no_requirement = np.zeros(len(frame), dtype=bool)
+    for row, value in enumerate(column.tolist()):
+        try:
+            years[row] = float(value)
+        except (ValueError, TypeError):
+            no_requirement[row] = True
+    return years, no_requirement
+
+
+def _education_requirements(frame):
+    # int() of the column value, -1 when missing, NaN or unparsable (as in JDMatchProfile)
+    if 'required_education_level' not in frame.columns:
+        return np.full(len(frame), -1, dtype=np.int64)
+    column = frame['required_education_level']
+    if pd.api.types.is_numeric_dtype(column):
+        values = column.to_numpy(dtype=np.float64)
+        return np.where(np.isnan(values), -1, np.trunc(np.nan_to_num(values, nan=-1.0))).astype(np.int64)
+
+    levels = np.full(len(frame), -1, dtype=np.int64)
+    for row, value in enumerate(column.tolist()):
+        try:
+            levels[row] = int(value)
+        except (ValueError, TypeError):
+            pass
+    return levels
+
+
+class JDColumnarCorpus:
+    """
+    JD corpus kept as columns instead of one dict per job. Built once from a
+    DataFrame (or anything with to_pandas(), e.g. an Arrow table) whose list
+    columns are already real lists: skills and meaningful keyword tokens
+    become sparse binary matrices, experience and education requirements
+    become NumPy arrays and titles a list of strings.
+    """
+    def __init__(self, jd_frame):
+        if hasattr(jd_frame, 'to_pandas'):
+            jd_frame = jd_frame.to_pandas()
+        self.frame = jd_frame.reset_index(drop=True)
+        n_rows = len(self.frame)
+
+        skills_column = [value if isinstance(value, list) else [] for value in _column_values(self.frame, 'skills')]
+        skill_sets = [{str(s).lower() for s in skills if isinstance(s, str)} for skills in skills_column]
+        self.skill_matrix, self.skill_ids = _token_columns(skill_sets)
+        self.required_skill_counts = np.array([len(skills) for skills in skill_sets], dtype=np.int64)
+
+        title_column = _column_values(self.frame, 'job_title')
+        self.title_texts = [str(title) if title is not None and pd.notna(title) else "" for title in title_column]
+
+        # Same text fields as JDMatchProfile.keyword_tokens, read column by column
+        keyword_columns = {column: _column_values(self.frame, column) for column in self.frame.columns}
+        keyword_columns['skills'] = skills_column
+        meaningful_token_sets = []
+        for row in range(n_rows):
+            keyword_text = build_jd_keyword_text(lambda key: keyword_columns[key][row] if key in keyword_columns else None)
+            meaningful_token_sets.append(clean_and_tokenize(keyword_text) - COMMON_GENERIC_WORDS)
+        self.keyword_matrix, self.keyword_ids = _token_columns(meaningful_token_sets)
+        self.meaningful_token_counts = np.array([len(tokens) for tokens in meaningful_token_sets], dtype=np.int64)
+
+        self.experience_years, self.no_experience_requirement = _experience_requirements(self.frame)
+        self.education_levels = _education_requirements(self.frame)
+        logging.info(f"COLUMNAR MATCHER: Built corpus of {n_rows} JDs, {len(self.skill_ids)} skills, {len(self.keyword_ids)} keyword tokens.")
+
+    def __len__(self):
+        return len(self.frame)
+
+    def row_dict(self, row):
+        """The parsed JD dict of one row, only built for rows that are displayed or explained."""
+        return self.frame.iloc[row].to_dict()
+
+
+def score_corpus(parsed_resume, corpus, nlp_model, rows=None):
+    """
+    Scores one resume against the corpus rows (all rows, or the given row
+    positions, e.g. after the page filters) without building any dicts.
+    Returns a COMPONENT_SCORE_DTYPE record array aligned with rows.
+    """
+    rows = np.arange(len(corpus)) if rows is None else np.asarray(rows, dtype=np.int64)
+    component_scores = np.zeros(len(rows), dtype=COMPONENT_SCORE_DTYPE)
+    if not parsed_resume or not len(rows):
+        return component_scores
+    resume_profile = get_resume_profile(parsed_resume)
+    timer = match_timing.StageTimer(pairs=len(rows)) if match_timing.TIMING_ENABLED else None
+
+    skill_counts = _overlap_counts(corpus.skill_matrix, corpus.skill_ids, resume_profile.skills_set, rows)
+    skill_scores = skill_scores_from_counts(skill_counts, corpus.required_skill_counts[rows])
+    if timer: timer.lap('skill')
+
+    jd_years = corpus.experience_years[rows]
+    experience_scores = np.where(corpus.no_experience_requirement[rows], 0.5,
+                                 (resume_profile.experience_years >= jd_years).astype(np.float64))
+    if timer: timer.lap('experience')
+
+    jd_levels = corpus.education_levels[rows]
+    if resume_profile.education_level < 0:
+        education_met = np.zeros(len(rows), dtype=bool)
+    else:
+        education_met = resume_profile.education_level >= jd_levels
+    education_scores = np.where(jd_levels < 0, 0.5, education_met.astype(np.float64))
+    if timer: timer.lap('education')
+
+    title_scores = _title_score_matrix([resume_profile], [corpus.title_texts[row] for row in rows], nlp_model)[0]
+    if timer: timer.lap('title')
+
+    keyword_counts = _overlap_counts(corpus.keyword_matrix, corpus.keyword_ids, resume_profile.keyword_tokens, rows)
+    meaningful_counts = corpus.meaningful_token_counts[rows].astype(np.float64)
+    keyword_scores = np.where(meaningful_counts > 0, keyword_counts / np.where(meaningful_counts > 0, meaningful_counts, 1.0), 0.0)
+    if timer: timer.lap('keyword')
+
+    component_scores['skill'] = skill_scores
+    component_scores['experience'] = experience_scores
+    component_scores['education'] = education_scores
+    component_scores['title'] = title_scores
+    component_scores['keyword'] = keyword_scores
+    component_scores['score'] = _combine_component_scores(skill_scores, experience_scores, education_scores,
+                                                          title_scores, keyword_scores)
+    if timer: timer.finish()
+    return component_scores
+
+
+def top_k_from_corpus(parsed_resume, corpus, k, nlp_model, rows=None):
+    """
+    Returns the k best (row, results) pairs, best first with ties going to
+    the lower row. Only the k winning rows become dicts, for explain_match.
+    """
+    rows = np.arange(len(corpus)) if rows is None else np.asarray(rows, dtype=np.int64)
+    if not parsed_resume or k <= 0 or not len(rows):
+        return []
+    resume_profile = get_resume_profile(parsed_resume)
+    scores = score_corpus(resume_profile, corpus, nlp_model, rows)['score']
+    best_positions = np.lexsort((rows, -scores))[:k]
+    return [(int(rows[position]), explain_match(resume_profile, corpus.row_dict(rows[position]), nlp_model))
+            for position in best_positions]
+
+
+def iter_matches_from_corpus(parsed_resume, corpus, k, nlp_model, rows=None, chunk_size=MATCH_CHUNK_SIZE):
+    """
+    iter_matches over the corpus rows: yields {'scored', 'total', 'matches'}
+    after every chunk of rows, matches being the best k (row, results) pairs
+    so far. The last snapshot has the same matches as top_k_from_corpus.
+    """
+    rows = np.arange(len(corpus)) if rows is None else np.asarray(rows, dtype=np.int64)
+    if not parsed_resume or k <= 0:
+        return
+    resume_profile = get_resume_profile(parsed_resume)
+    best_scores = np.zeros(0, dtype=np.float64)
+    best_rows = np.zeros(0, dtype=np.int64)
+    explained = {}
+    for start in range(0, len(rows), chunk_size):
+        chunk_rows = rows[start:start + chunk_size]
+        chunk_scores = score_corpus(resume_profile, corpus, nlp_model, chunk_rows)['score']
+        best_scores, best_rows = _merge_top_k(best_scores, best_rows, chunk_scores, chunk_rows, k)
+        matches = _explain_snapshot(resume_profile, best_rows, explained, corpus.row_dict, nlp_model)
+        explained = dict(matches)
+        yield {'scored': start + len(chunk_rows), 'total': len(rows), 'matches': matches}
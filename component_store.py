@@ -0,0 +1,74 @@
+import logging
+import numpy as np
+
+from matcher import SKILL_WEIGHT, EXPERIENCE_WEIGHT, EDUCATION_WEIGHT, TITLE_WEIGHT, KEYWORD_WEIGHT
+from match_matrix import calculate_score_matrix, COMPONENT_NAMES
+
+
+# Weights in COMPONENT_NAMES order (skill, experience, education, title, keyword)
+DEFAULT_COMPONENT_WEIGHTS = np.array([SKILL_WEIGHT, EXPERIENCE_WEIGHT, EDUCATION_WEIGHT, TITLE_WEIGHT, KEYWORD_WEIGHT])
+
+
+def make_weight_vector(skill=SKILL_WEIGHT, experience=EXPERIENCE_WEIGHT, education=EDUCATION_WEIGHT,
+                       title=TITLE_WEIGHT, keyword=KEYWORD_WEIGHT):
+    return np.array([skill, experience, education, title, keyword], dtype=np.float64)
+
+
+def _check_weights(weights):
+    if weights is None:
+        return DEFAULT_COMPONENT_WEIGHTS
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.shape != (len(COMPONENT_NAMES),):
+        raise ValueError(f"Expected {len(COMPONENT_NAMES)} weights ({', '.join(COMPONENT_NAMES)}), got shape {weights.shape}")
+    return weights
+
+
+class MatchComponentStore:
+    """
+    Per-pair component scores as one (n_resumes, n_jds, 5) float32 array, in
+    COMPONENT_NAMES order. Any weight vector turns it back into final scores
+    with a single dot product, so re-weighting never reruns the matcher.
+    Scores from the default weights equal the matcher's to float32 precision.
+    """
+    def __init__(self, components):
+        components = np.asarray(components)
+        if components.ndim != 3 or components.shape[2] != len(COMPONENT_NAMES):
+            raise ValueError(f"Component array must have shape (n_resumes, n_jds, {len(COMPONENT_NAMES)}), got {components.shape}")
+        self.components = components
+
+    @classmethod
+    def from_parsed(cls, parsed_resumes, parsed_jds, nlp_model):
+        """Scores every resume x JD pair once with calculate_score_matrix and keeps the components."""
+        _, component_matrices = calculate_score_matrix(parsed_resumes, parsed_jds, nlp_model, return_components=True)
+        return cls(np.stack([component_matrices[name] for name in COMPONENT_NAMES], axis=-1))
+
+    @classmethod
+    def from_component_records(cls, component_records):
+        """Store for one resume from a score_matches / score_corpus record array."""
+        stacked = np.stack([component_records[name] for name in COMPONENT_NAMES], axis=-1).astype(np.float32)
+        return cls(stacked[np.newaxis])
+
+    @property
+    def shape(self):
+        return self.components.shape[:2]
+
+    def scores(self, weights=None):
+        """(n_resumes, n_jds) float32 final scores for the weight vector (default: the matcher's weights)."""
+        weights = _check_weights(weights)
+        return (self.components @ weights).astype(np.float32)
+
+    def rank(self, resume_row, weights=None, k=None):
+        """JD indexes of one resume, best first under the weights, ties going to the lower index."""
+        weights = _check_weights(weights)
+        resume_scores = self.components[resume_row] @ weights
+        order = np.argsort(-resume_scores, kind='stable')
+        return order if k is None else order[:k]
+
+    def save(self, path):
+        """Writes the component array as a .npy file that load() can memory-map."""
+        np.save(path, np.ascontiguousarray(self.components, dtype=np.float32))
+        logging.info(f"COMPONENT STORE: Saved {self.shape[0]}x{self.shape[1]} pair components to {path}")
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        return cls(np.load(path, mmap_mode='r' if mmap else None))
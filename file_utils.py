@@ -1,7 +1,7 @@
 import logging
-from docx import Document 
-import pdfplumber
-import fitz
+
+# python-docx, pdfplumber and PyMuPDF (fitz) are imported by the readers that use them,
+# so importing the parsers doesn't pay for all three
 
 def read_text_file(file_path):
     try:
@@ -17,7 +17,7 @@ def read_text_file(file_path):
         return None
 
 def read_docx_file(file_path):
-    
+    from docx import Document
     full_text = []
     try:
         doc = Document(file_path)
@@ -33,6 +33,7 @@ def read_docx_file(file_path):
         return None
 
 def read_pdf_file(file_path):
+    import fitz
     full_text = []
     try: 
         with fitz.open(file_path) as pdf:
@@ -66,6 +67,7 @@ def get_text_from_txt_object(uploaded_file_object):
         return None
 
 def get_text_from_docx_object(uploaded_file_object):
+    from docx import Document
     try:
         doc = Document(uploaded_file_object) 
         full_text = [para.text for para in doc.paragraphs]
@@ -77,6 +79,7 @@ def get_text_from_docx_object(uploaded_file_object):
         return None
 
 def get_text_from_pdf_object_fitz(uploaded_file_object):
+    import fitz
     full_text = []
     try:
         if hasattr(uploaded_file_object, 'seek') and callable(uploaded_file_object.seek):
@@ -109,6 +112,7 @@ def get_text_from_pdf_object_fitz(uploaded_file_object):
         return None
 
 def get_text_from_pdf_object(uploaded_file_object):
+    import pdfplumber
     try:
         full_text = []
 
@@ -1,20 +1,13 @@
 import re
-import spacy
 import json
 from collections import defaultdict
 from datetime import datetime
-from spacy.matcher import PhraseMatcher
 from dateutil.parser import parse as parse_datetime
 from dateutil.relativedelta import relativedelta
 import logging
 import pprint
 import os
-
-try:
-    nlp = spacy.load("en_core_web_md")
-    logging.info("Model loaded succesfully.")
-except OSError:
-    logging.error("Spacy model not found.")
+from lazy_loading import get_nlp_model, lazy_module_attributes
 
 def read_text_file(file_path):
     try:
@@ -59,8 +52,22 @@ def load_skills(skill_file=None):
         logging.error("Error loading skills.")
         return []
 
-tech_skills = load_skills()
-tech_skills_set = set(tech_skills)
+_TECH_SKILLS = None
+
+def get_tech_skills():
+    """skills.json as (list, set), loaded once on first use."""
+    global _TECH_SKILLS
+    if _TECH_SKILLS is None:
+        skills_list = load_skills()
+        _TECH_SKILLS = (skills_list, set(skills_list))
+    return _TECH_SKILLS
+
+# nlp (the spaCy model shared with resume_parser), tech_skills and tech_skills_set are loaded on first access
+__getattr__ = lazy_module_attributes(globals(), {
+    'nlp': get_nlp_model,
+    'tech_skills': lambda: get_tech_skills()[0],
+    'tech_skills_set': lambda: get_tech_skills()[1],
+})
 
 SECTION_HEADERS = {
     "about": r"(?i)^\s*(about\s*us|about\s*the\s*company|who\s*we\s*are)\s*[:]?\s*$",
@@ -132,6 +139,8 @@ def segment_jd(text):
 
 
 def parse_jd_sections(sections):
+    nlp = get_nlp_model()
+    tech_skills, tech_skills_set = get_tech_skills()
     parsed_jd = {
         "job_title":None,
         "company_name":None,
@@ -325,6 +334,7 @@ def parse_jd_sections(sections):
             skills_doc = nlp(skill_search_text)
             found_skills = set()
 
+            from spacy.matcher import PhraseMatcher
             matcher = PhraseMatcher(nlp.vocab,attr="LOWER")
             pattern = [nlp(skill) for skill in tech_skills]
             matcher.add("TECH_SKILLS", pattern)
@@ -0,0 +1,194 @@
+import logging
+from collections import Counter
+import numpy as np
+
+from matcher import (get_jd_profile, get_resume_profile, build_jd_keyword_text, _normalize_text, COMMON_GENERIC_WORDS,
+                     JDMatchProfile)
+
+
+KEYWORD_SCORING_MODES = ('overlap', 'bm25')
+
+# Usual BM25 defaults: term frequency saturation and document length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Width of hashed keyword vectors; memory depends on tokens per JD, never on the vocabulary size
+HASHED_KEYWORD_FEATURES = 2 ** 20
+
+
+def _identity_analyzer(tokens):
+    # Documents are already tokenized; module-level so fitted vectorizers can be pickled
+    return tokens
+
+
+def jd_term_counts(parsed_jd):
+    """Meaningful JD tokens with their counts in the keyword text (plain tokenizer, used for BM25)."""
+    jd_profile = get_jd_profile(parsed_jd)
+    meaningful_tokens = jd_profile.meaningful_tokens
+    words = _normalize_text(build_jd_keyword_text(jd_profile.parsed_jd.get)).split()
+    term_counts = Counter(word for word in words if word in meaningful_tokens)
+    # Lemmatized tokens that never appear verbatim still count once
+    for token in meaningful_tokens:
+        term_counts.setdefault(token, 1)
+    return term_counts
+
+
+class KeywordIndex:
+    """
+    Keyword engine over a fixed JD corpus. The vocabulary (and IDF for BM25)
+    is fitted once and the JDs are stored as a CSR matrix, so a resume is
+    scored against every JD with one sparse matrix-vector product.
+
+    'overlap' gives the matcher's keyword score: shared meaningful tokens /
+    the JD's meaningful token count. 'bm25' weights each JD token by BM25
+    (IDF, term frequency saturation, length normalization) and scores the
+    share of the JD's BM25 weight the resume covers, also in [0, 1].
+    """
+    def __init__(self, mode='overlap', k1=BM25_K1, b=BM25_B):
+        if mode not in KEYWORD_SCORING_MODES:
+            raise ValueError(f"mode must be one of {KEYWORD_SCORING_MODES}, got '{mode}'")
+        self.mode = mode
+        self.k1 = k1
+        self.b = b
+        self.vectorizer = None
+        self.jd_matrix = None
+        self.row_totals = None
+        self.idf = None
+
+    def fit(self, parsed_jds):
+        # scikit-learn takes about a second to import, so it is only imported once an index is built
+        from sklearn.feature_extraction.text import CountVectorizer
+        jd_profiles = [get_jd_profile(parsed_jd) for parsed_jd in parsed_jds]
+        if self.mode == 'overlap':
+            self.vectorizer = CountVectorizer(analyzer=_identity_analyzer, binary=True)
+            jd_matrix = self.vectorizer.fit_transform([sorted(p.meaningful_tokens) for p in jd_profiles])
+        else:
+            self.vectorizer = CountVectorizer(analyzer=_identity_analyzer)
+            jd_matrix = self.vectorizer.fit_transform([list(jd_term_counts(p).elements()) for p in jd_profiles])
+            jd_matrix = self._bm25_weights(jd_matrix.tocsr().astype(np.float64))
+        self.jd_matrix = jd_matrix.tocsr().astype(np.float64)
+        self.row_totals = np.asarray(self.jd_matrix.sum(axis=1), dtype=np.float64).ravel()
+        logging.info(f"KEYWORD INDEX: Fitted {self.mode} index over {len(jd_profiles)} JDs, {len(self.vectorizer.vocabulary_)} tokens.")
+        return self
+
+    def _bm25_weights(self, term_frequencies):
+        n_docs = term_frequencies.shape[0]
+        document_frequency = np.bincount(term_frequencies.indices, minlength=term_frequencies.shape[1])
+        self.idf = np.log(1.0 + (n_docs - document_frequency + 0.5) / (document_frequency + 0.5))
+
+        doc_lengths = np.asarray(term_frequencies.sum(axis=1), dtype=np.float64).ravel()
+        average_length = doc_lengths.mean() if n_docs and doc_lengths.mean() > 0 else 1.0
+        row_of_entry = np.repeat(np.arange(n_docs), np.diff(term_frequencies.indptr))
+        length_norm = self.k1 * (1.0 - self.b + self.b * doc_lengths[row_of_entry] / average_length)
+        tf = term_frequencies.data
+        term_frequencies.data = self.idf[term_frequencies.indices] * tf * (self.k1 + 1.0) / (tf + length_norm)
+        return term_frequencies
+
+    def _query_vector(self, parsed_resume):
+        resume_tokens = get_resume_profile(parsed_resume).keyword_tokens - COMMON_GENERIC_WORDS
+        vocabulary = self.vectorizer.vocabulary_
+        query = np.zeros(len(vocabulary), dtype=np.float64)
+        query[[vocabulary[token] for token in resume_tokens if token in vocabulary]] = 1.0
+        return query
+
+    def score(self, parsed_resume):
+        """Keyword scores of the resume against every fitted JD, in fit order."""
+        if self.jd_matrix is None:
+            raise RuntimeError("KeywordIndex.score called before fit")
+        covered = self.jd_matrix @ self._query_vector(parsed_resume)
+        safe_totals = np.where(self.row_totals > 0, self.row_totals, 1.0)
+        return np.where(self.row_totals > 0, covered / safe_totals, 0.0)
+
+
+class HashedKeywordScorer:
+    """
+    Approximate keyword overlap with the hashing trick: token sets become
+    fixed-width signed-hash sparse vectors (no stored vocabulary), and
+    shared tokens are estimated with a dot product. Matching tokens always
+    add +1; colliding unrelated tokens add +1 or -1 at random, so the
+    estimate is unbiased and tightens as n_features grows.
+
+    fit(parsed_jds) hashes the JDs once and keeps only their CSR rows and
+    token counts (the JD token sets are not kept), then score(resume) is one
+    sparse product over the fitted JDs. The scorer is also callable as
+    keyword_scorer(resume_profile, jd_profiles) for score_matches: JDs are
+    looked up by content hash, and JDs it has not seen are hashed once and
+    added.
+    """
+    def __init__(self, n_features=HASHED_KEYWORD_FEATURES):
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from scipy import sparse
+        self.n_features = n_features
+        # Token sets have no repeats, so counts are the +1/-1 signs themselves
+        self.vectorizer = HashingVectorizer(analyzer=_identity_analyzer, n_features=n_features,
+                                            alternate_sign=True, norm=None, dtype=np.float32)
+        self.jd_matrix = sparse.csr_matrix((0, n_features), dtype=np.float32)
+        self.meaningful_counts = np.zeros(0, dtype=np.float64)
+        # JD content hash -> row of jd_matrix
+        self.jd_rows = {}
+        # Row of every JD passed to fit, in order (duplicate JDs share a row)
+        self.fitted_rows = np.zeros(0, dtype=np.int64)
+
+    def transform(self, token_sets):
+        """(len(token_sets), n_features) CSR matrix of signed hashed tokens."""
+        return self.vectorizer.transform([sorted(tokens) for tokens in token_sets])
+
+    def _add_rows(self, content_hashes, token_sets):
+        from scipy import sparse
+        self.jd_matrix = sparse.vstack([self.jd_matrix, self.transform(token_sets)], format='csr')
+        self.meaningful_counts = np.concatenate([self.meaningful_counts,
+                                                 np.array([len(tokens) for tokens in token_sets], dtype=np.float64)])
+        for content_hash in content_hashes:
+            self.jd_rows[content_hash] = len(self.jd_rows)
+
+    def fit(self, parsed_jds):
+        # Profiles are built one at a time and dropped, only the hashed rows are kept
+        content_hashes, token_sets = [], []
+        fitted_rows = np.zeros(len(parsed_jds), dtype=np.int64)
+        pending = {}
+        for position, parsed_jd in enumerate(parsed_jds):
+            jd_profile = parsed_jd if isinstance(parsed_jd, JDMatchProfile) else JDMatchProfile(parsed_jd)
+            row = self.jd_rows.get(jd_profile.content_hash, pending.get(jd_profile.content_hash))
+            if row is None:
+                row = len(self.jd_rows) + len(pending)
+                pending[jd_profile.content_hash] = row
+                content_hashes.append(jd_profile.content_hash)
+                token_sets.append(jd_profile.meaningful_tokens)
+            fitted_rows[position] = row
+        if token_sets:
+            self._add_rows(content_hashes, token_sets)
+        self.fitted_rows = fitted_rows
+        logging.info(f"KEYWORD INDEX: Hashed {len(parsed_jds)} JDs into {self.n_features} features "
+                     f"({self.jd_matrix.nnz} non-zeros).")
+        return self
+
+    def _rows_for(self, jd_profiles):
+        """jd_matrix rows of the JD profiles, hashing the ones not seen yet."""
+        new_token_sets = {}
+        for jd_profile in jd_profiles:
+            if jd_profile.content_hash not in self.jd_rows:
+                new_token_sets.setdefault(jd_profile.content_hash, jd_profile.meaningful_tokens)
+        if new_token_sets:
+            # Appending copies the stored matrix, so fit the corpus up front rather than growing it chunk by chunk
+            self._add_rows(list(new_token_sets), list(new_token_sets.values()))
+        return np.array([self.jd_rows[jd_profile.content_hash] for jd_profile in jd_profiles], dtype=np.int64)
+
+    def _scores(self, resume_vector, jd_matrix, meaningful_counts):
+        estimated_counts = np.asarray((jd_matrix @ resume_vector.T).todense(), dtype=np.float64).ravel()
+        safe_counts = np.where(meaningful_counts > 0, meaningful_counts, 1.0)
+        return np.where(meaningful_counts > 0, np.clip(estimated_counts / safe_counts, 0.0, 1.0), 0.0)
+
+    def score(self, parsed_resume):
+        """Estimated keyword scores against every JD passed to fit, in fit order."""
+        resume_vector = self.transform([get_resume_profile(parsed_resume).keyword_tokens])
+        scores = self._scores(resume_vector, self.jd_matrix, self.meaningful_counts)
+        return scores[self.fitted_rows]
+
+    def __call__(self, parsed_resume, jd_profiles):
+        jd_profiles = [get_jd_profile(jd_profile) for jd_profile in jd_profiles]
+        if not jd_profiles:
+            return np.zeros(0, dtype=np.float64)
+        rows = self._rows_for(jd_profiles)
+        resume_vector = self.transform([get_resume_profile(parsed_resume).keyword_tokens])
+        # Only the requested rows are multiplied, so chunked callers pay for their chunk
+        return self._scores(resume_vector, self.jd_matrix[rows], self.meaningful_counts[rows])
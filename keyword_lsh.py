@@ -0,0 +1,127 @@
+import hashlib
+import logging
+from functools import lru_cache
+import numpy as np
+
+from matcher import get_jd_profile, get_resume_profile
+
+
+# Resume token sets are much bigger than JD keyword sets, so even good matches have a low Jaccard
+# similarity; single-row bands (threshold 1/32) gave the best recall / candidate share trade-off on the
+# Kaggle and RemoteOK samples (see benchmark_keyword_lsh.py)
+DEFAULT_LSH_BANDS = 32
+DEFAULT_LSH_ROWS = 1
+
+# Largest prime below 2**32: (a * x + b) mod p stays inside uint64 for 32-bit a, b and x
+MINHASH_PRIME = np.uint64(4294967291)
+MINHASH_EMPTY_VALUE = np.uint32(0xFFFFFFFF)
+
+
+@lru_cache(maxsize=1000000)
+def token_hash(token):
+    """Stable 32-bit hash of a token (Python's str hash changes between processes)."""
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+def lsh_threshold(bands, rows):
+    """Jaccard similarity at which a pair becomes a candidate with probability about 1/2."""
+    return (1.0 / bands) ** (1.0 / rows)
+
+
+class MinHasher:
+    """n_permutations universal hash functions (a * x + b) mod p over 32-bit token hashes."""
+    def __init__(self, n_permutations, seed=0):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, int(MINHASH_PRIME), size=n_permutations, dtype=np.uint64)
+        self.b = rng.integers(0, int(MINHASH_PRIME), size=n_permutations, dtype=np.uint64)
+
+    def signature(self, tokens):
+        """(n_permutations,) uint32 MinHash signature; all MINHASH_EMPTY_VALUE for an empty set."""
+        if not tokens:
+            return np.full(len(self.a), MINHASH_EMPTY_VALUE, dtype=np.uint32)
+        hashes = np.fromiter((token_hash(token) for token in tokens), dtype=np.uint64, count=len(tokens))
+        permuted = (hashes[:, None] * self.a[None, :] + self.b[None, :]) % MINHASH_PRIME
+        return permuted.min(axis=0).astype(np.uint32)
+
+
+class KeywordLSHIndex:
+    """
+    MinHash LSH over the JDs' meaningful keyword tokens. Every JD gets a
+    bands * rows signature; each band of the signature is a bucket key, and a
+    resume's keyword tokens retrieve the JDs sharing at least one bucket
+    with it, without looking at the other JDs. JD IDs are positions in the
+    list the index was built from.
+    """
+    def __init__(self, bands=DEFAULT_LSH_BANDS, rows=DEFAULT_LSH_ROWS, seed=0):
+        self.bands = bands
+        self.rows = rows
+        self.hasher = MinHasher(bands * rows, seed)
+        self.signatures = np.zeros((0, bands * rows), dtype=np.uint32)
+        self.token_counts = np.zeros(0, dtype=np.int64)
+        self.vocabulary = frozenset()
+        # One dict per band: band bytes -> list of JD IDs
+        self.buckets = [{} for _ in range(bands)]
+
+    @property
+    def threshold(self):
+        return lsh_threshold(self.bands, self.rows)
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def _band_keys(self, signature):
+        return [band.tobytes() for band in signature.reshape(self.bands, self.rows)]
+
+    def fit(self, parsed_jds):
+        signatures = np.zeros((len(parsed_jds), self.bands * self.rows), dtype=np.uint32)
+        token_counts = np.zeros(len(parsed_jds), dtype=np.int64)
+        self.buckets = [{} for _ in range(self.bands)]
+        vocabulary = set()
+        for jd_id, parsed_jd in enumerate(parsed_jds):
+            if not parsed_jd:
+                continue
+            meaningful_tokens = get_jd_profile(parsed_jd).meaningful_tokens
+            if not meaningful_tokens:
+                continue
+            signatures[jd_id] = self.hasher.signature(meaningful_tokens)
+            token_counts[jd_id] = len(meaningful_tokens)
+            vocabulary.update(meaningful_tokens)
+            for band_buckets, band_key in zip(self.buckets, self._band_keys(signatures[jd_id])):
+                band_buckets.setdefault(band_key, []).append(jd_id)
+        self.signatures = signatures
+        self.token_counts = token_counts
+        self.vocabulary = frozenset(vocabulary)
+        logging.info(f"KEYWORD LSH: Indexed {len(parsed_jds)} JDs, {self.bands} bands x {self.rows} rows "
+                     f"(Jaccard threshold ~{self.threshold:.2f}).")
+        return self
+
+    def _query_tokens(self, parsed_resume):
+        # Resume tokens no JD uses can't add overlap but would dilute the Jaccard similarity
+        return get_resume_profile(parsed_resume).keyword_tokens & self.vocabulary
+
+    def candidates(self, parsed_resume):
+        """Sorted IDs of the JDs that share at least one LSH bucket with the resume's keyword tokens."""
+        query_tokens = self._query_tokens(parsed_resume)
+        if not query_tokens:
+            return np.zeros(0, dtype=np.int64)
+        matched = [band_buckets.get(band_key, ()) for band_buckets, band_key
+                   in zip(self.buckets, self._band_keys(self.hasher.signature(query_tokens)))]
+        if not any(matched):
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate([np.asarray(jd_ids, dtype=np.int64) for jd_ids in matched if jd_ids]))
+
+    def estimated_keyword_scores(self, parsed_resume, jd_ids):
+        """
+        Keyword score estimates |JD tokens & resume tokens| / |JD tokens| for
+        the given JDs, from the signature Jaccard estimate and the set sizes.
+        """
+        jd_ids = np.asarray(jd_ids, dtype=np.int64)
+        query_tokens = self._query_tokens(parsed_resume)
+        if not query_tokens or not len(jd_ids):
+            return np.zeros(len(jd_ids), dtype=np.float64)
+        query_signature = self.hasher.signature(query_tokens)
+        jaccard = (self.signatures[jd_ids] == query_signature[None, :]).mean(axis=1)
+        jd_sizes = self.token_counts[jd_ids].astype(np.float64)
+        # |A & B| = J * (|A| + |B|) / (1 + J)
+        overlap = jaccard * (jd_sizes + len(query_tokens)) / (1.0 + jaccard)
+        return np.where(jd_sizes > 0, np.minimum(overlap, jd_sizes) / np.where(jd_sizes > 0, jd_sizes, 1.0), 0.0)
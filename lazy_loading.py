@@ -0,0 +1,59 @@
+import logging
+import threading
+
+
+# Tried in order; the parsers share whichever loads first
+DEFAULT_NLP_MODEL_NAMES = ('en_core_web_md', 'en_core_web_sm')
+
+_NLP_MODELS = {}
+_NLP_MODEL_LOCK = threading.Lock()
+
+
+def get_nlp_model(model_names=DEFAULT_NLP_MODEL_NAMES):
+    """
+    The first spaCy model of model_names that loads, or None. spaCy is only
+    imported on the first call, and every caller asking for the same names
+    gets the same model object instead of loading its own copy.
+    """
+    model_names = tuple(model_names)
+    with _NLP_MODEL_LOCK:
+        if model_names in _NLP_MODELS:
+            return _NLP_MODELS[model_names]
+        import spacy
+        nlp_model = None
+        for model_name in model_names:
+            try:
+                nlp_model = spacy.load(model_name)
+                logging.info(f"LAZY LOADING: spaCy model '{model_name}' loaded.")
+                break
+            except OSError:
+                logging.error(f"LAZY LOADING: spaCy model '{model_name}' not found. "
+                              f"Please run 'python -m spacy download {model_name}'")
+        if nlp_model is None:
+            logging.error("LAZY LOADING: No spaCy model could be loaded. NLP features will be unavailable if not passed explicitly.")
+        _NLP_MODELS[model_names] = nlp_model
+        return nlp_model
+
+
+def lazy_module_attributes(module_globals, loaders):
+    """
+    Module __getattr__ (PEP 562) for attributes that are expensive to build:
+    loaders maps an attribute name to a zero-argument function, called on
+    the first access from outside the module; the value is then stored in
+    the module so later lookups are plain attribute reads. Code inside the
+    module has to call the loader itself, bare global names don't go
+    through __getattr__.
+    """
+    lock = threading.RLock()
+
+    def __getattr__(name):
+        loader = loaders.get(name)
+        if loader is None:
+            raise AttributeError(f"module {module_globals['__name__']!r} has no attribute {name!r}")
+        with lock:
+            if name not in module_globals:
+                module_globals[name] = loader()
+        return module_globals[name]
+
+    return __getattr__
+
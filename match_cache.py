@@ -0,0 +1,285 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import matcher
+import skill_vocab
+import title_vectors
+from matcher import calculate_match_score, calculate_match_scores, compute_jd_content_hash, get_jd_profile
+
+
+DEFAULT_MATCH_CACHE_PATH = 'match_cache.sqlite3'
+# Budget of the in-memory tier, counted as the size of the cached results' JSON
+MATCH_CACHE_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+# Keys per SELECT ... IN query of get_or_compute_many, below SQLite's bound parameter limit
+MATCH_CACHE_LOOKUP_BATCH_SIZE = 500
+
+# Modules whose source decides the scores; editing any of them invalidates cached results
+SCORING_MODULES = (matcher, skill_vocab, title_vectors)
+
+
+def _file_digest(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return 'missing'
+
+
+def _model_id(nlp_model):
+    if nlp_model is None:
+        return 'none'
+    meta = nlp_model.meta
+    return f"{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}-{nlp_model.vocab.vectors_length}d"
+
+
+def code_fingerprint():
+    """
+    Hash of MATCHER_VERSION, the source of the scoring modules and
+    skills.json: the part of the fingerprint that only changes between
+    releases or deployments, so cached rows of another value are stale.
+    """
+    parts = {
+        'matcher_version': matcher.MATCHER_VERSION,
+        'sources': [_file_digest(module.__file__) for module in SCORING_MODULES],
+        'skills_json': _file_digest(skill_vocab.SKILLS_JSON_PATH),
+    }
+    return hashlib.sha1(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _runtime_settings(nlp_model):
+    # Everything that can differ between callers sharing one cache file; cheap to read on every lookup
+    store = title_vectors.get_title_vector_store(nlp_model)
+    return (
+        (matcher.SKILL_WEIGHT, matcher.EXPERIENCE_WEIGHT, matcher.EDUCATION_WEIGHT,
+         matcher.TITLE_WEIGHT, matcher.KEYWORD_WEIGHT),
+        title_vectors.TITLE_EMBEDDING_MODE,
+        _model_id(nlp_model),
+        # Stored titles are float16, so scores with a store attached can differ in the last digits
+        'float16' if store is not None else None,
+    )
+
+
+def scoring_fingerprint(nlp_model=None, code_fingerprint_value=None):
+    """
+    Hash of everything besides the two documents that decides a match result:
+    code_fingerprint(), the weights, the title embedding mode, the nlp model
+    and whether a TitleVectorStore is attached to it.
+    """
+    weights, title_embedding_mode, nlp_model_id, title_vector_store = _runtime_settings(nlp_model)
+    parts = {
+        'code': code_fingerprint_value or code_fingerprint(),
+        'weights': list(weights),
+        'title_embedding_mode': title_embedding_mode,
+        'nlp_model': nlp_model_id,
+        'title_vector_store': title_vector_store,
+    }
+    return hashlib.sha1(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _content_hash(document):
+    """Content hash of a parsed dict or of a JD / resume profile."""
+    content_hash = getattr(document, 'content_hash', None)
+    if content_hash is not None:
+        return content_hash
+    return compute_jd_content_hash(getattr(document, 'parsed_resume', document))
+
+
+class MatchCacheStats:
+    """Hit / miss counters of a MatchResultCache."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def lookups(self):
+        return self.memory_hits + self.disk_hits + self.misses
+
+    def as_dict(self):
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.memory_hits + self.disk_hits) / self.lookups if self.lookups else 0.0,
+        }
+
+
+class MatchResultCache:
+    """
+    Two-tier cache of calculate_match_score results. The key combines the
+    resume and JD content hashes with scoring_fingerprint(), so a change in
+    the weights, the scoring code, skills.json, the model or its title
+    vector store never serves an old result. Tier one is an in-memory LRU
+    bounded by the size of the results' JSON; tier two is a SQLite table
+    that survives restarts and can be shared by several models and
+    settings. Rows written by another matcher version, scoring source or
+    skills.json are deleted when the cache is opened.
+    path=None keeps only the memory tier.
+    """
+    def __init__(self, path=DEFAULT_MATCH_CACHE_PATH, max_memory_bytes=MATCH_CACHE_MAX_MEMORY_BYTES):
+        self.path = path
+        self.max_memory_bytes = max_memory_bytes
+        self.stats = MatchCacheStats()
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        # Source and skills.json digests are read once for the lifetime of the cache
+        self.code_fingerprint = code_fingerprint()
+        # _runtime_settings(nlp_model) -> scoring fingerprint
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+        self._connection = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("CREATE TABLE IF NOT EXISTS match_results "
+                                     "(cache_key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, result TEXT NOT NULL)")
+            # The fingerprint column holds the code fingerprint; runtime settings are part of cache_key
+            deleted = self._connection.execute("DELETE FROM match_results WHERE fingerprint != ?",
+                                               (self.code_fingerprint,)).rowcount
+            self._connection.commit()
+            if deleted:
+                logging.info(f"MATCH CACHE: Dropped {deleted} results of an older matcher/skills version.")
+
+    def _fingerprint(self, nlp_model):
+        # Keyed by the model's name and version rather than id(), which Python reuses after a model is freed
+        settings = _runtime_settings(nlp_model)
+        fingerprint = self._fingerprints.get(settings)
+        if fingerprint is None:
+            fingerprint = scoring_fingerprint(nlp_model, self.code_fingerprint)
+            self._fingerprints[settings] = fingerprint
+        return fingerprint
+
+    def _key_prefix(self, parsed_resume, nlp_model):
+        # The resume half of the key, hashed once per call rather than once per JD
+        return f"{self._fingerprint(nlp_model)}:{_content_hash(parsed_resume)}:"
+
+    def cache_key(self, parsed_resume, parsed_jd, nlp_model):
+        return self._key_prefix(parsed_resume, nlp_model) + _content_hash(parsed_jd)
+
+    def _remember(self, cache_key, result_json):
+        self._memory[cache_key] = result_json
+        self._memory.move_to_end(cache_key)
+        self._memory_bytes += len(result_json)
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            _, evicted_json = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted_json)
+
+    def _lookup(self, cache_key):
+        """Cached result JSON, or None, updating the hit / miss counters."""
+        with self._lock:
+            result_json = self._memory.get(cache_key)
+            if result_json is not None:
+                self._memory.move_to_end(cache_key)
+                self.stats.memory_hits += 1
+                return result_json
+            if self._connection is not None:
+                row = self._connection.execute("SELECT result FROM match_results WHERE cache_key = ?", (cache_key,)).fetchone()
+                if row is not None:
+                    self._remember(cache_key, row[0])
+                    self.stats.disk_hits += 1
+                    return row[0]
+            self.stats.misses += 1
+            return None
+
+    def _lookup_many(self, cache_keys):
+        """_lookup for a list of keys (None entries stay misses), with one disk query per batch."""
+        results = [None] * len(cache_keys)
+        with self._lock:
+            disk_positions = {}
+            for i, cache_key in enumerate(cache_keys):
+                if cache_key is None:
+                    continue
+                result_json = self._memory.get(cache_key)
+                if result_json is not None:
+                    self._memory.move_to_end(cache_key)
+                    self.stats.memory_hits += 1
+                    results[i] = result_json
+                else:
+                    disk_positions.setdefault(cache_key, []).append(i)
+            if self._connection is not None and disk_positions:
+                disk_keys = list(disk_positions)
+                for start in range(0, len(disk_keys), MATCH_CACHE_LOOKUP_BATCH_SIZE):
+                    batch = disk_keys[start:start + MATCH_CACHE_LOOKUP_BATCH_SIZE]
+                    rows = self._connection.execute("SELECT cache_key, result FROM match_results WHERE cache_key IN "
+                                                    f"({','.join('?' * len(batch))})", batch).fetchall()
+                    for cache_key, result_json in rows:
+                        self._remember(cache_key, result_json)
+                        for i in disk_positions[cache_key]:
+                            results[i] = result_json
+                            self.stats.disk_hits += 1
+            self.stats.misses += sum(1 for cache_key, result_json in zip(cache_keys, results)
+                                     if cache_key is not None and result_json is None)
+        return results
+
+    def _store(self, entries):
+        """entries: (cache_key, code fingerprint, result_json) tuples."""
+        with self._lock:
+            for cache_key, _, result_json in entries:
+                if cache_key in self._memory:
+                    self._memory_bytes -= len(self._memory[cache_key])
+                self._remember(cache_key, result_json)
+            if self._connection is not None:
+                self._connection.executemany("INSERT OR REPLACE INTO match_results VALUES (?, ?, ?)", entries)
+                self._connection.commit()
+
+    def get_or_compute(self, parsed_resume, parsed_jd, nlp_model):
+        """calculate_match_score, served from the cache when this pair was scored before."""
+        jd_hash = _content_hash(parsed_jd)
+        cache_key = self._key_prefix(parsed_resume, nlp_model) + jd_hash
+        result_json = self._lookup(cache_key)
+        if result_json is not None:
+            return json.loads(result_json)
+        jd_profile = get_jd_profile(parsed_jd, jd_hash) if parsed_jd else parsed_jd
+        result = calculate_match_score(parsed_resume, jd_profile, nlp_model)
+        if result:
+            self._store([(cache_key, self.code_fingerprint, json.dumps(result))])
+        return result
+
+    def get_or_compute_many(self, parsed_resume, parsed_jds, nlp_model):
+        """calculate_match_scores with cached pairs reused and the misses scored in one batch."""
+        key_prefix = self._key_prefix(parsed_resume, nlp_model)
+        jd_hashes = [_content_hash(parsed_jd) if parsed_jd else None for parsed_jd in parsed_jds]
+        cache_keys = [key_prefix + jd_hash if jd_hash is not None else None for jd_hash in jd_hashes]
+        results = [None] * len(parsed_jds)
+        missing = []
+        for i, result_json in enumerate(self._lookup_many(cache_keys)):
+            if result_json is not None:
+                results[i] = json.loads(result_json)
+            else:
+                missing.append(i)
+        if missing:
+            # Profiles are built with the hashes computed for the keys, so the misses are not hashed twice
+            missing_jds = [get_jd_profile(parsed_jds[i], jd_hashes[i]) if parsed_jds[i] else parsed_jds[i] for i in missing]
+            computed = calculate_match_scores(parsed_resume, missing_jds, nlp_model)
+            entries = []
+            for i, result in zip(missing, computed):
+                results[i] = result
+                if result and cache_keys[i] is not None:
+                    entries.append((cache_keys[i], self.code_fingerprint, json.dumps(result)))
+            self._store(entries)
+        return results
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM match_results")
+                self._connection.commit()
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
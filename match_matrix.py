@@ -0,0 +1,168 @@
+import logging
+import numpy as np
+from scipy import sparse
+
+import match_timing
+from matcher import (clean_and_tokenize_many, get_resume_profile, get_jd_profile, _combine_component_scores,
+                     _uses_title_vectors)
+from skill_vocab import skill_scores_from_counts
+from title_vectors import title_similarity_matrix
+
+
+COMPONENT_NAMES = ('skill', 'experience', 'education', 'title', 'keyword')
+
+
+def _binary_csr(token_sets, token_ids):
+    """
+    One row per token set, one column per token in token_ids; tokens not in
+    token_ids are dropped. Entries are 1, so row products count shared tokens.
+    """
+    indptr = [0]
+    indices = []
+    for tokens in token_sets:
+        indices.extend(token_ids[token] for token in tokens if token in token_ids)
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix((data, np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+                             shape=(len(token_sets), len(token_ids)))
+
+
+def _overlap_count_matrix(resume_token_sets, jd_token_sets):
+    # |resume tokens & jd tokens| for every pair, with one sparse product
+    token_ids = {}
+    for tokens in jd_token_sets:
+        for token in tokens:
+            token_ids.setdefault(token, len(token_ids))
+    if not token_ids:
+        return np.zeros((len(resume_token_sets), len(jd_token_sets)), dtype=np.int64)
+    resume_matrix = _binary_csr(resume_token_sets, token_ids)
+    jd_matrix = _binary_csr(jd_token_sets, token_ids)
+    return (resume_matrix @ jd_matrix.T).toarray().astype(np.int64)
+
+
+def _skill_score_matrix(resume_profiles, jd_profiles):
+    match_counts = _overlap_count_matrix([p.skills_set for p in resume_profiles], [p.skills_set for p in jd_profiles])
+    required_counts = np.array([len(p.skills_set) for p in jd_profiles], dtype=np.int64)
+    return skill_scores_from_counts(match_counts, required_counts[None, :])
+
+
+def _keyword_score_matrix(resume_profiles, jd_profiles):
+    # Matching keywords are the JD's meaningful tokens found in the resume tokens
+    match_counts = _overlap_count_matrix([p.keyword_tokens for p in resume_profiles],
+                                         [p.meaningful_tokens for p in jd_profiles])
+    meaningful_counts = np.array([len(p.meaningful_tokens) for p in jd_profiles], dtype=np.float64)
+    safe_counts = np.where(meaningful_counts > 0, meaningful_counts, 1.0)
+    return np.where(meaningful_counts > 0, match_counts / safe_counts, 0.0)
+
+
+def _experience_score_matrix(resume_profiles, jd_profiles):
+    # None means no requirement (0.5); a NaN requirement is never met, as in the per-pair comparison
+    resume_years = np.array([p.experience_years for p in resume_profiles], dtype=np.float64)
+    no_requirement = np.array([p.experience_years is None for p in jd_profiles], dtype=bool)
+    jd_years = np.array([np.nan if p.experience_years is None else p.experience_years for p in jd_profiles],
+                        dtype=np.float64)
+    met = resume_years[:, None] >= jd_years[None, :]
+    return np.where(no_requirement[None, :], 0.5, met.astype(np.float64))
+
+
+def _education_score_matrix(resume_profiles, jd_profiles):
+    resume_levels = np.array([p.education_level for p in resume_profiles], dtype=np.int64)
+    jd_levels = np.array([p.education_level for p in jd_profiles], dtype=np.int64)
+    met = (resume_levels[:, None] >= 0) & (resume_levels[:, None] >= jd_levels[None, :])
+    return np.where(jd_levels[None, :] < 0, 0.5, met.astype(np.float64))
+
+
+def _jaccard_matrix(jd_token_sets, resume_token_sets):
+    intersections = _overlap_count_matrix(jd_token_sets, resume_token_sets).astype(np.float64)
+    jd_sizes = np.array([len(tokens) for tokens in jd_token_sets], dtype=np.float64)
+    resume_sizes = np.array([len(tokens) for tokens in resume_token_sets], dtype=np.float64)
+    unions = jd_sizes[:, None] + resume_sizes[None, :] - intersections
+    return np.where(unions > 0, intersections / np.where(unions > 0, unions, 1.0), 0.0)
+
+
+def _title_score_matrix(resume_profiles, jd_title_texts, nlp_model):
+    """
+    Best title similarity of every JD title against each resume's titles.
+    Distinct JD titles are scored against all resume titles at once (dense
+    vector product, or sparse token Jaccard without vectors) and the columns
+    are then max-reduced per resume.
+    """
+    use_vectors = _uses_title_vectors(nlp_model)
+    title_scores = np.zeros((len(resume_profiles), len(jd_title_texts)), dtype=np.float64)
+
+    jd_title_rows = {}
+    for title_text in jd_title_texts:
+        if title_text.strip():
+            jd_title_rows.setdefault(title_text, len(jd_title_rows))
+    has_title = np.array([bool(title_text.strip()) for title_text in jd_title_texts], dtype=bool)
+    jd_rows = np.array([jd_title_rows.get(title_text, 0) for title_text in jd_title_texts], dtype=np.int64)
+
+    titled_resumes = [row for row, p in enumerate(resume_profiles) if p.has_experience and p.titles_for_scoring]
+    if jd_title_rows and titled_resumes:
+        all_resume_titles = []
+        group_starts = []
+        for row in titled_resumes:
+            group_starts.append(len(all_resume_titles))
+            all_resume_titles.extend(resume_profiles[row].titles_for_scoring)
+
+        if use_vectors:
+            similarities = title_similarity_matrix(list(jd_title_rows), all_resume_titles, nlp_model)
+        else:
+            logging.warning("MATCH MATRIX: Passed NLP model for titles has no vectors or is None. Falling back to Jaccard.")
+            jd_title_tokens = clean_and_tokenize_many(list(jd_title_rows), nlp_model)
+            resume_title_tokens = []
+            for row in titled_resumes:
+                resume_title_tokens.extend(resume_profiles[row].get_title_features(nlp_model, use_vectors=False))
+            similarities = _jaccard_matrix(jd_title_tokens, resume_title_tokens)
+
+        # (distinct JD titles, titled resumes): best title per resume, never below 0
+        best_similarities = np.maximum(np.maximum.reduceat(similarities, group_starts, axis=1), 0.0)
+        title_scores[titled_resumes] = best_similarities.T.astype(np.float64)[:, jd_rows]
+
+    return np.where(has_title[None, :], title_scores, 0.5)
+
+
+def calculate_score_matrix(parsed_resumes, parsed_jds, nlp_model, return_components=False):
+    """
+    Scores every resume against every JD. Features are built once per side:
+    skills and keyword tokens become sparse binary matrices whose products
+    give all the overlap counts, experience and education are broadcast
+    comparisons and titles use one dense vector product.
+    Returns a (len(parsed_resumes), len(parsed_jds)) float32 score matrix,
+    equal to float32 of calculate_match_score for each pair. With
+    return_components=True also returns a dict of float32 matrices, one per
+    name in COMPONENT_NAMES. Missing resumes or JDs get all-zero rows/columns.
+    """
+    scores = np.zeros((len(parsed_resumes), len(parsed_jds)), dtype=np.float32)
+    components = {name: np.zeros_like(scores) for name in COMPONENT_NAMES}
+
+    resume_rows = [i for i, parsed_resume in enumerate(parsed_resumes) if parsed_resume]
+    jd_columns = [j for j, parsed_jd in enumerate(parsed_jds) if parsed_jd]
+    if resume_rows and jd_columns:
+        resume_profiles = [get_resume_profile(parsed_resumes[i]) for i in resume_rows]
+        jd_profiles = [get_jd_profile(parsed_jds[j]) for j in jd_columns]
+
+        timer = match_timing.StageTimer(pairs=len(resume_profiles) * len(jd_profiles)) if match_timing.TIMING_ENABLED else None
+        component_scores = {}
+        component_scores['skill'] = _skill_score_matrix(resume_profiles, jd_profiles)
+        if timer: timer.lap('skill')
+        component_scores['experience'] = _experience_score_matrix(resume_profiles, jd_profiles)
+        if timer: timer.lap('experience')
+        component_scores['education'] = _education_score_matrix(resume_profiles, jd_profiles)
+        if timer: timer.lap('education')
+        component_scores['title'] = _title_score_matrix(resume_profiles, [p.title_text for p in jd_profiles], nlp_model)
+        if timer: timer.lap('title')
+        component_scores['keyword'] = _keyword_score_matrix(resume_profiles, jd_profiles)
+        if timer: timer.lap('keyword')
+        final_scores = _combine_component_scores(*(component_scores[name] for name in COMPONENT_NAMES))
+        if timer: timer.finish()
+
+        pair_index = np.ix_(resume_rows, jd_columns)
+        scores[pair_index] = final_scores
+        for name in COMPONENT_NAMES:
+            components[name][pair_index] = component_scores[name]
+        logging.info(f"MATCH MATRIX: Scored {len(resume_rows)} resumes x {len(jd_columns)} JDs.")
+
+    if return_components:
+        return scores, components
+    return scores
@@ -0,0 +1,99 @@
+import logging
+from time import perf_counter
+
+
+# Stages of the matcher, in the order they run
+MATCH_COMPONENTS = ('skill', 'experience', 'education', 'title', 'keyword', 'total')
+
+# Checked once per scoring call; when False the matcher skips all clock reads
+TIMING_ENABLED = False
+
+
+class MatchTimingStats:
+    """
+    Cumulative wall time and call counts per matcher component, kept across
+    a ranking run until reset(). A call is one scored resume/JD pair, so
+    batch paths add their batch size and mean_seconds stays per pair.
+    """
+    def __init__(self):
+        self.calls = dict.fromkeys(MATCH_COMPONENTS, 0)
+        self.seconds = dict.fromkeys(MATCH_COMPONENTS, 0.0)
+
+    def record(self, timings, pairs=None):
+        """pairs: {component: resume/JD pairs the lap covered}, 1 per component when not given."""
+        for component, elapsed in timings.items():
+            self.calls[component] += 1 if pairs is None else pairs[component]
+            self.seconds[component] += elapsed
+
+    def reset(self):
+        for component in MATCH_COMPONENTS:
+            self.calls[component] = 0
+            self.seconds[component] = 0.0
+
+    def as_dict(self):
+        """{component: {'calls', 'total_seconds', 'mean_seconds'}}"""
+        return {
+            component: {
+                'calls': self.calls[component],
+                'total_seconds': self.seconds[component],
+                'mean_seconds': self.seconds[component] / self.calls[component] if self.calls[component] else 0.0,
+            }
+            for component in MATCH_COMPONENTS
+        }
+
+    def summary(self):
+        lines = [f"{'component':<12}{'calls':>10}{'total ms':>12}{'mean us':>12}"]
+        for component, stats in self.as_dict().items():
+            lines.append(f"{component:<12}{stats['calls']:>10}{stats['total_seconds'] * 1e3:>12.2f}"
+                         f"{stats['mean_seconds'] * 1e6:>12.2f}")
+        return "\n".join(lines)
+
+
+_STATS = MatchTimingStats()
+
+
+def enable_match_timing(reset=True):
+    """Turns on per-component timing; results dicts then get a 'timings' entry (seconds per component)."""
+    global TIMING_ENABLED
+    if reset:
+        _STATS.reset()
+    TIMING_ENABLED = True
+    logging.info("MATCH TIMING: Enabled.")
+
+
+def disable_match_timing():
+    global TIMING_ENABLED
+    TIMING_ENABLED = False
+
+
+def get_match_timing_stats():
+    return _STATS
+
+
+class StageTimer:
+    """
+    Splits one scoring call into per-component laps and adds them to the
+    shared stats. pairs is the number of resume/JD pairs the call scores:
+    1 for the per-pair path, the batch size for the vectorized paths.
+    """
+    def __init__(self, pairs=1):
+        self.timings = {}
+        self.pairs = {}
+        self.default_pairs = pairs
+        self.start = self.lap_start = perf_counter()
+
+    def lap(self, component, pairs=None):
+        now = perf_counter()
+        self.add(component, now - self.lap_start, pairs)
+        self.lap_start = now
+
+    def add(self, component, seconds, pairs=None):
+        """Adds time measured by the caller, e.g. summed over the JDs a pruned search visited."""
+        self.timings[component] = self.timings.get(component, 0.0) + seconds
+        self.pairs[component] = self.pairs.get(component, 0) + (self.default_pairs if pairs is None else pairs)
+
+    def finish(self):
+        self.timings['total'] = perf_counter() - self.start
+        self.pairs['total'] = self.default_pairs
+        _STATS.record(self.timings, self.pairs)
+        return self.timings
@@ -1,8 +1,17 @@
-import spacy
 import logging
 import string
-import re
-import pandas as pd
+import json
+import hashlib
+import heapq
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from time import perf_counter
+import numpy as np
+import match_timing
+from title_vectors import build_title_matrix, title_similarity_matrix
+from skill_vocab import get_skill_vocabulary, pad_skill_bits, stack_skill_bits, skill_overlap_counts, skill_scores_from_counts
 
 
 STOP_WORDS = set([
@@ -22,53 +31,435 @@ STOP_WORDS = set([
 ])
 
 
+# Filter out very common words that might have slipped through basic stop word lists
+COMMON_GENERIC_WORDS = {'role', 'team', 'work', 'experience', 'responsibilities', 'requirements', 'skills', 'job', 'position'}
+
+JD_KEYWORD_TEXT_SOURCES = ['responsibilities', 'qualifications', 'preferred_qualifications', 
+                           'skills_text_raw_kaggle', 'job_description_text_raw_kaggle', 'job_title'] # Added job_title
+
+# Component weights of the final score
+SKILL_WEIGHT = 0.35
+EXPERIENCE_WEIGHT = 0.15
+EDUCATION_WEIGHT = 0.05
+TITLE_WEIGHT = 0.15
+KEYWORD_WEIGHT = 0.30
+
+# Bump when scores change in a way the source hash in match_cache can't see (e.g. a new parser output field)
+MATCHER_VERSION = '1'
+
+# Float32 cosines of near-identical titles can land a few ULPs above 1.0, so top_k_matches
+# bounds the title similarity at 1.0 plus this slack rather than at exactly 1.0
+TITLE_SIMILARITY_BOUND_SLACK = 1e-5
+
+# Max number of JD profiles kept in memory, least recently used ones are dropped first
+JD_PROFILE_CACHE_MAX_SIZE = 50000
+
+# Compact per-JD record returned by score_matches (no explanation lists)
+COMPONENT_SCORE_DTYPE = np.dtype([
+    ('score', np.float64), ('skill', np.float64), ('experience', np.float64),
+    ('education', np.float64), ('title', np.float64), ('keyword', np.float64),
+])
+
+
+# Every punctuation char except '-' becomes a space (same as the old regex substitution)
+PUNCTUATION_TRANSLATION_TABLE = str.maketrans({char: ' ' for char in string.punctuation.replace('-', '')})
+
+# Max number of texts whose tokens are memoized, per nlp model (None = plain split), least recently used dropped first
+TOKEN_CACHE_MAX_SIZE = 100000
+# Texts sent to nlp.pipe at once by clean_and_tokenize_many
+TOKENIZE_BATCH_SIZE = 256
+
+# JDs scored between two iter_matches snapshots
+MATCH_CHUNK_SIZE = 500
+
+_PLAIN_TOKEN_CACHE = OrderedDict()
+_MODEL_TOKEN_CACHES = weakref.WeakKeyDictionary()
+
+# Matchers run in threads (AsyncMatcher, Streamlit sessions): an LRU hit is a get
+# plus move_to_end, and another thread evicting in between would raise KeyError
+_CACHE_LOCK = threading.RLock()
+
+
+def _lru_get(cache, key):
+    with _CACHE_LOCK:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _lru_store(cache, key, value, max_size):
+    with _CACHE_LOCK:
+        cache[key] = value
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+    return value
+
+
+def _token_cache(nlp_model):
+    if nlp_model is None:
+        return _PLAIN_TOKEN_CACHE
+    with _CACHE_LOCK:
+        model_cache = _MODEL_TOKEN_CACHES.get(nlp_model)
+        if model_cache is None:
+            model_cache = OrderedDict()
+            _MODEL_TOKEN_CACHES[nlp_model] = model_cache
+        return model_cache
+
+
+def _store_tokens(token_cache, text, tokens):
+    return _lru_store(token_cache, text, tokens, TOKEN_CACHE_MAX_SIZE)
+
+
+def clear_token_cache():
+    with _CACHE_LOCK:
+        _PLAIN_TOKEN_CACHE.clear()
+        _MODEL_TOKEN_CACHES.clear()
+
+
+def _normalize_text(text):
+    # Lowercase, punctuation to spaces, collapse whitespace
+    return " ".join(text.lower().translate(PUNCTUATION_TRANSLATION_TABLE).split())
+
+
+def _tokens_from_doc(doc):
+    lemmatized_tokens = set()
+    for token in doc:
+        if not token.is_stop and not token.is_punct and not token.is_space:
+            lemma = token.lemma_.strip()
+            if len(lemma) > 1:
+                lemmatized_tokens.add(sys.intern(lemma))
+    return frozenset(lemmatized_tokens)
+
+
+def _tokens_from_split(text):
+    return frozenset(sys.intern(token) for token in text.split() if len(token) > 1 and token not in STOP_WORDS)
+
+
+def _uses_nlp_tokenizer(nlp_model):
+    return bool(nlp_model) and hasattr(nlp_model, '__call__')
+
+
 def clean_and_tokenize(text, nlp_model = None):
     """
     Lowercases, removes punctuation, lemmatizes, removes stop words and short tokens.
     Uses spacy for lemmatization and stop word removal if available.
+    Results are memoized per text and returned as a shared frozenset, do not mutate.
     """
     if not isinstance(text,str) or not text.strip():
-        return set()
-    
-    text = text.lower()
-    text = re.sub(f"[{re.escape(string.punctuation.replace('-', ''))}]", " ", text) 
-    text = re.sub(r'\s+', ' ', text).strip()
+        return frozenset()
+
+    nlp_model = nlp_model if _uses_nlp_tokenizer(nlp_model) else None
+    token_cache = _token_cache(nlp_model)
+    # Keyed by the text itself: str caches its own hash, and equality rules out two texts sharing an entry
+    cached = _lru_get(token_cache, text)
+    if cached is not None:
+        return cached
+
+    normalized_text = _normalize_text(text)
+    if nlp_model is not None:
+        tokens = _tokens_from_doc(nlp_model(normalized_text))
+    else:
+        tokens = _tokens_from_split(normalized_text)
+    return _store_tokens(token_cache, text, tokens)
 
-  
-    lemmatized_tokens = set()
 
-    if nlp_model and hasattr(nlp_model, '__call__'):
-        doc = nlp_model(text)
-        for token in doc:
-            if not token.is_stop and not token.is_punct and not token.is_space:
-                lemma = token.lemma_.strip()
-                if len(lemma) > 1:
-                    lemmatized_tokens.add(lemma)
-    else:
-        tokens = text.split()
-        for token in tokens:
-            cleaned_token = token.strip()
-            if len(cleaned_token)>1 and cleaned_token not in STOP_WORDS:
-                lemmatized_tokens.add(cleaned_token)
+def clean_and_tokenize_many(texts, nlp_model = None, batch_size = TOKENIZE_BATCH_SIZE):
+    """
+    clean_and_tokenize for a list of texts. With a spaCy model the texts that
+    are not memoized yet go through nlp.pipe in batches instead of one
+    nlp() call each. Returns one token set per text, in order.
+    """
+    if not _uses_nlp_tokenizer(nlp_model) or not hasattr(nlp_model, 'pipe'):
+        return [clean_and_tokenize(text, nlp_model) for text in texts]
+
+    token_cache = _token_cache(nlp_model)
+    all_tokens = [None] * len(texts)
+    pending = {}
+    for i, text in enumerate(texts):
+        if not isinstance(text, str) or not text.strip():
+            all_tokens[i] = frozenset()
+            continue
+        cached = _lru_get(token_cache, text)
+        if cached is not None:
+            all_tokens[i] = cached
+        else:
+            pending.setdefault(text, []).append(i)
+
+    pending_items = list(pending.items())
+    docs = nlp_model.pipe((_normalize_text(text) for text, _ in pending_items), batch_size=batch_size)
+    for (text, positions), doc in zip(pending_items, docs):
+        tokens = _store_tokens(token_cache, text, _tokens_from_doc(doc))
+        for i in positions:
+            all_tokens[i] = tokens
+    return all_tokens
+
+def _is_present(value):
+    """pd.notna for a scalar without importing pandas: False for None, NaN, NaT and pd.NA."""
+    if value is None:
+        return False
+    try:
+        # NaN and NaT are the only scalars not equal to themselves; pd.NA == pd.NA can't be made a bool
+        return bool(value == value)
+    except (TypeError, ValueError):
+        return False
+
+def compute_jd_content_hash(parsed_jd):
+    """
+    Returns a stable hash of the parsed JD content. Two JDs with the same
+    fields and values get the same hash, regardless of key order.
+    """
+    jd_json = json.dumps(parsed_jd, sort_keys=True, default=str)
+    return hashlib.sha1(jd_json.encode('utf-8')).hexdigest()
 
-    return lemmatized_tokens
 
-def calculate_match_score(parsed_resume,parsed_jd,nlp_model):
+def build_jd_keyword_text(get_field):
+    """
+    Joins the JD text fields used for keyword matching. get_field(key) returns
+    a field value (None when missing), e.g. parsed_jd.get or a column lookup.
+    """
+    jd_keyword_text_parts = []
+    for key in JD_KEYWORD_TEXT_SOURCES:
+        content = get_field(key)
+        if isinstance(content, list): # e.g responsibilities, qualifications
+            jd_keyword_text_parts.extend([str(item) for item in content if isinstance(item, str)])
+        elif isinstance(content, str): # e.g raw text fields, job_title
+            jd_keyword_text_parts.append(content)
+    # Also add JD skills list as text
+    jd_skills = get_field('skills')
+    if jd_skills:
+        jd_keyword_text_parts.append(" ".join([str(s) for s in jd_skills if isinstance(s,str)]))
+    return " ".join(jd_keyword_text_parts)
 
-    if not parsed_resume or not parsed_jd:
-        logging.warning("Matcher: Received none for parsed_resume or parsed_jd.")
-        return {}
+
+class JDMatchProfile:
+    """
+    Precompiled JD-side data for the matcher: skills, experience/education
+    thresholds, title and keyword tokens. Built once per JD and passed to the
+    matcher in place of the parsed JD dict.
+    """
+    def __init__(self, parsed_jd, content_hash=None):
+        self.parsed_jd = parsed_jd
+        self.content_hash = content_hash if content_hash is not None else compute_jd_content_hash(parsed_jd)
+
+        self.skills_set = {str(s).lower() for s in parsed_jd.get('skills', []) if isinstance(s, str)}
+        # Bit-packed skill IDs for vectorized AND + popcount matching
+        self.skill_bits = get_skill_vocabulary().encode(self.skills_set)
+
+        jd_experience_val = parsed_jd.get('minimum_years_experience',None)
+        self.experience_years = None
+        if jd_experience_val is not None:
+            try:
+                self.experience_years = float(jd_experience_val)
+            except(ValueError,TypeError):
+                logging.warning(f"Matcher: Could not convert JD experience '{jd_experience_val}' to float.")
+                self.experience_years = None
+
+        jd_edu_val = parsed_jd.get('required_education_level', None) 
+        self.education_level = -1 
+        if jd_edu_val is not None:  
+            try:
+                self.education_level = int(jd_edu_val) 
+            except (ValueError, TypeError):
+                logging.warning(f"Matcher: Could not convert JD education level '{jd_edu_val}' to int. Using default -1.")
+
+        jd_title_raw = parsed_jd.get('job_title', '')
+        self.title_text = str(jd_title_raw) if _is_present(jd_title_raw) else ""
+
+        jd_full_keyword_text = build_jd_keyword_text(parsed_jd.get)
+
+        logging.debug(f"MATCHER JD Keyword Text (first 200): {jd_full_keyword_text[:200]}")
+
+        self.keyword_tokens = clean_and_tokenize(jd_full_keyword_text)
+        # Consider only JD tokens that are not too generic for the denominator
+        self.meaningful_tokens = self.keyword_tokens - COMMON_GENERIC_WORDS
+
+        logging.debug(f"MATCHER JD Keyword Tokens (count {len(self.keyword_tokens)}, sample): {list(self.keyword_tokens)[:20]}")
+
+
+_JD_PROFILE_CACHE = OrderedDict()
+
+
+def get_jd_profile(parsed_jd, content_hash=None):
+    """
+    Returns the JDMatchProfile for a parsed JD, building it only if a JD with
+    the same content hash is not already in the LRU cache. Callers that
+    already hashed the JD can pass content_hash to skip hashing it again.
+    """
+    if isinstance(parsed_jd, JDMatchProfile):
+        return parsed_jd
+
+    if content_hash is None:
+        content_hash = compute_jd_content_hash(parsed_jd)
+    jd_profile = _lru_get(_JD_PROFILE_CACHE, content_hash)
+    if jd_profile is not None:
+        return jd_profile
+
+    # Built outside the lock; two threads building the same JD store equal profiles
+    jd_profile = JDMatchProfile(parsed_jd, content_hash)
+    return _lru_store(_JD_PROFILE_CACHE, content_hash, jd_profile, JD_PROFILE_CACHE_MAX_SIZE)
+
+
+def get_jd_profiles(parsed_jds):
+    return [get_jd_profile(parsed_jd) for parsed_jd in parsed_jds]
+
+
+def clear_jd_profile_cache():
+    with _CACHE_LOCK:
+        _JD_PROFILE_CACHE.clear()
+
+
+class ResumeMatchProfile:
+    """
+    Precompiled resume-side data for the matcher: skills, keyword tokens and
+    the flattened list of experience titles. Build it once per parsed resume
+    and pass it to the matcher in place of the dict, e.g. keep it in
+    st.session_state so reruns and filter changes do not re-derive it.
+    """
+    def __init__(self, parsed_resume):
+        self.parsed_resume = parsed_resume
+        self.skills_set = {str(s).lower() for s in parsed_resume.get('skills', []) if isinstance(s, str)}
+        self.skill_bits = get_skill_vocabulary().encode(self.skills_set)
+        self.experience_years = parsed_resume.get('total_years_experience', 0)
+        self.education_level = parsed_resume.get('education_level', -1)
+
+        resume_experience_list = parsed_resume.get('experience', [])
+        self.has_experience = bool(resume_experience_list)
+        self.titles_checked = []
+        # Titles that are actually scored (non-empty strings), in resume order
+        self.titles_for_scoring = []
+
+        resume_keyword_text_parts = []
+        # Key resume sections for keywords
+        if parsed_resume.get('summary_text'):
+            resume_keyword_text_parts.append(str(parsed_resume.get('summary_text')))
+
+        # Single walk over experience for titles and keyword text.
+        # Some parser versions nest experience entries in lists.
+        for exp_entry_outer in resume_experience_list:
+            is_nested = isinstance(exp_entry_outer, list)
+            for entry in (exp_entry_outer if is_nested else [exp_entry_outer]):
+                if not entry or not isinstance(entry, dict): continue
+                job_title = entry.get('job_title')
+                if job_title:
+                    self.titles_checked.append(str(job_title))
+                if isinstance(job_title, str) and job_title.strip():
+                    self.titles_for_scoring.append(job_title)
+                if not is_nested:
+                    if isinstance(entry.get('description'), str):
+                        resume_keyword_text_parts.append(entry.get('description'))
+                    if isinstance(job_title, str): # Add job titles from experience
+                        resume_keyword_text_parts.append(job_title)
+
+        # Also add resume skills list as text
+        if parsed_resume.get('skills'):
+            resume_keyword_text_parts.append(" ".join([str(s) for s in parsed_resume.get('skills',[]) if isinstance(s,str)]))
+        resume_full_keyword_text = " ".join(resume_keyword_text_parts)
+
+        logging.debug(f"MATCHER Resume Keyword Text (first 200): {resume_full_keyword_text[:200]}")
+        self.keyword_tokens = clean_and_tokenize(resume_full_keyword_text)
+        self.meaningful_token_count = len(self.keyword_tokens - COMMON_GENERIC_WORDS)
+        logging.debug(f"MATCHER Resume Keyword Tokens (count {len(self.keyword_tokens)}, sample): {list(self.keyword_tokens)[:20]}")
+
+        # Title vectors/tokens depend on the nlp model, so they are filled lazily
+        self._title_features_key = None
+        self._title_features = None
+
+    def get_title_features(self, nlp_model, use_vectors):
+        """
+        Returns the title matrix from build_title_matrix (vector mode) or the
+        token sets (Jaccard mode) for titles_for_scoring, computed only once.
+        """
+        cache_key = (id(nlp_model), use_vectors)
+        if self._title_features_key != cache_key:
+            if use_vectors:
+                self._title_features = build_title_matrix(self.titles_for_scoring, nlp_model)
+            else:
+                self._title_features = clean_and_tokenize_many(self.titles_for_scoring, nlp_model)
+            self._title_features_key = cache_key
+        return self._title_features
+
+
+def _uses_title_vectors(nlp_model):
+    return not (nlp_model is None or not hasattr(nlp_model, 'vocab') or not nlp_model.vocab.has_vector)
+
+
+def get_resume_profile(parsed_resume):
+    if isinstance(parsed_resume, ResumeMatchProfile):
+        return parsed_resume
+    return ResumeMatchProfile(parsed_resume)
+
+
+def _combine_component_scores(skill_score, experience_score, education_score, title_score, keyword_score):
+    # Works on floats and on NumPy arrays of component scores
+    return (skill_score * SKILL_WEIGHT) + (experience_score * EXPERIENCE_WEIGHT) + \
+           (education_score * EDUCATION_WEIGHT) + (title_score * TITLE_WEIGHT)+ \
+           (keyword_score * KEYWORD_WEIGHT)
+
+
+def _title_score_and_matches(resume_profile, jd_title_text, nlp_model, title_similarities=None):
+    """
+    Best title similarity of a (non-empty) JD title against the resume titles,
+    plus the resume titles that reach it. Uses vector cosine when the model
+    has vectors, otherwise token Jaccard.
+    """
+    title_score = 0.0
+    matching_resume_titles_found = []
+    resume_titles_for_scoring = resume_profile.titles_for_scoring
+
+    if not _uses_title_vectors(nlp_model):
+        logging.warning("MATCHER: Passed NLP model for titles has no vectors or is None. Falling back to Jaccard.")
+        jd_title_tokens = clean_and_tokenize(jd_title_text, nlp_model) 
+        max_jaccard_score = 0.0
+        if jd_title_tokens and resume_profile.has_experience:
+            resume_title_token_sets = resume_profile.get_title_features(nlp_model, use_vectors=False)
+            for resume_title_text, resume_title_tokens in zip(resume_titles_for_scoring, resume_title_token_sets):
+                if resume_title_tokens:
+                    common = jd_title_tokens.intersection(resume_title_tokens)
+                    union = jd_title_tokens.union(resume_title_tokens)
+                    jaccard = len(common) / len(union) if union else 0.0
+                    if jaccard > max_jaccard_score: max_jaccard_score, matching_resume_titles_found = jaccard, [resume_title_text]
+                    elif jaccard == max_jaccard_score and max_jaccard_score > 0 and resume_title_text not in matching_resume_titles_found:
+                        matching_resume_titles_found.append(resume_title_text)
+            title_score = max_jaccard_score
+    else: 
+        max_similarity_score = 0.0
+        if resume_profile.has_experience and resume_titles_for_scoring:
+            # Cosine similarities of this JD title against every resume title (cached unit vectors)
+            if title_similarities is None:
+                resume_title_matrix = resume_profile.get_title_features(nlp_model, use_vectors=True)
+                title_similarities = title_similarity_matrix([jd_title_text], resume_titles_for_scoring, nlp_model, resume_title_matrix)[0]
+            best_similarity = title_similarities.max()
+            if best_similarity > max_similarity_score:
+                max_similarity_score = float(best_similarity)
+                for resume_title_text, similarity in zip(resume_titles_for_scoring, title_similarities):
+                    if similarity == best_similarity and resume_title_text not in matching_resume_titles_found:
+                        matching_resume_titles_found.append(resume_title_text)
+            title_score = max_similarity_score
+    return title_score, matching_resume_titles_found
+
+
+def _score_with_profiles(resume_profile, parsed_jd, nlp_model, title_similarities=None, skill_match=None):
+
+    jd_profile = get_jd_profile(parsed_jd)
+    # Opt-in profiling; when off this is one attribute read per pair
+    timer = match_timing.StageTimer() if match_timing.TIMING_ENABLED else None
+    debug_enabled = logging.root.isEnabledFor(logging.DEBUG)
+    # The per-pair INFO lines below are only formatted when someone will see them
+    info_enabled = logging.root.isEnabledFor(logging.INFO)
 
     skill_score = 0.0
     final_score = 0.0
 
     #---Skill Matching---
-    resume_skills_list = [str(s).lower() for s in parsed_resume.get('skills', []) if isinstance(s, str)]
-    jd_skills_list = [str(s).lower() for s in parsed_jd.get('skills', []) if isinstance(s, str)]
-
-    resume_skills_set = set(resume_skills_list)
-    jd_skills_set = set(jd_skills_list)
-    matching_skills_set = resume_skills_set.intersection(jd_skills_set)
+    resume_skills_set = resume_profile.skills_set
+    jd_skills_set = jd_profile.skills_set
+    if skill_match is not None:
+        # Batch path: score and count already came from the popcount, only decode the names here
+        precomputed_skill_score, _ = skill_match
+        matching_skills_set = set(_decode_matching_skills(resume_profile, jd_profile))
+    else:
+        matching_skills_set = resume_skills_set.intersection(jd_skills_set)
 
     raw_skill_score = 0.0
     if jd_skills_set: 
@@ -91,191 +482,111 @@ def calculate_match_score(parsed_resume,parsed_jd,nlp_model):
         skill_score_confidence = 0.0 
 
     skill_score = raw_skill_score * skill_score_confidence
+    if skill_match is not None:
+        skill_score = precomputed_skill_score
     # --- End of Tempering Logic ---
     
-    logging.debug(f"MATCHER Skill Score: {skill_score:.2f} (Raw: {raw_skill_score:.2f}, Confidence: {skill_score_confidence:.2f}), "
-                  f"Matching: {matching_skills_set}, Resume: {resume_skills_set}, JD: {jd_skills_set}")
+    if debug_enabled:
+        logging.debug(f"MATCHER Skill Score: {skill_score:.2f} (Raw: {raw_skill_score:.2f}, Confidence: {skill_score_confidence:.2f}), "
+                      f"Matching: {matching_skills_set}, Resume: {resume_skills_set}, JD: {jd_skills_set}")
+    if timer: timer.lap('skill')
 
 
     #---Experience Years Matching---
-    resume_experience_years = parsed_resume.get('total_years_experience',0)
-    jd_experience_val = parsed_jd.get('minimum_years_experience',None)
-    jd_experience_years = None
+    resume_experience_years = resume_profile.experience_years
+    jd_experience_years = jd_profile.experience_years
     experience_score = 0.0
 
-    if jd_experience_val is not None:
-        try:
-            jd_experience_years = float(jd_experience_val)
-        except(ValueError,TypeError):
-            logging.warning(f"Matcher: Could not convert JD experience '{jd_experience_val}' to float.")
-            jd_experience_years = None
-
     if jd_experience_years is None: 
         experience_score = 0.5 
     elif resume_experience_years >= jd_experience_years:
         experience_score = 1.0
     else: 
         experience_score = 0.0
-    logging.debug(f"MATCHER Experience Score: {experience_score}, ResumeYrs: {resume_experience_years}, JDYrs: {jd_experience_years}")
+    if debug_enabled:
+        logging.debug(f"MATCHER Experience Score: {experience_score}, ResumeYrs: {resume_experience_years}, JDYrs: {jd_experience_years}")
+    if timer: timer.lap('experience')
 
 
     # ---Education Matching---
-    resume_edu_level = parsed_resume.get('education_level', -1)  
-    jd_edu_val = parsed_jd.get('required_education_level', None) 
-
-    jd_edu_level = -1 
+    resume_edu_level = resume_profile.education_level
+    jd_edu_level = jd_profile.education_level
     education_score = 0.0
 
-    if jd_edu_val is not None:  
-        try:
-            jd_edu_level = int(jd_edu_val) 
-        except (ValueError, TypeError):
-            logging.warning(f"Matcher: Could not convert JD education level '{jd_edu_val}' to int. Using default -1.")
-
-    
     if jd_edu_level < 0:  
         education_score = 0.5
-        logging.info(f"JD requires no specific education level (level code: {jd_edu_level}) or requirement is invalid.")
+        if info_enabled:
+            logging.info(f"JD requires no specific education level (level code: {jd_edu_level}) or requirement is invalid.")
     elif resume_edu_level < 0:  
         education_score = 0.0
-        logging.info("Resume education level unknown, cannot meet requirement.")
+        if info_enabled:
+            logging.info("Resume education level unknown, cannot meet requirement.")
     elif resume_edu_level >= jd_edu_level:
         education_score = 1.0
-        logging.info(f"Resume level ({resume_edu_level}) meets/exceeds JD requirement ({jd_edu_level}).")
+        if info_enabled:
+            logging.info(f"Resume level ({resume_edu_level}) meets/exceeds JD requirement ({jd_edu_level}).")
     else:  
         education_score = 0.0
-        logging.info(f"Resume level ({resume_edu_level}) is below JD requirement ({jd_edu_level}).")
+        if info_enabled:
+            logging.info(f"Resume level ({resume_edu_level}) is below JD requirement ({jd_edu_level}).")
     
-    logging.debug(f"MATCHER Education Score: {education_score}, ResumeLvl: {resume_edu_level}, JDLvl: {jd_edu_level}")
+    if debug_enabled:
+        logging.debug(f"MATCHER Education Score: {education_score}, ResumeLvl: {resume_edu_level}, JDLvl: {jd_edu_level}")
+    if timer: timer.lap('education')
    
 
     # Job Title Matching
-    jd_title_raw = parsed_jd.get('job_title', '')
-    jd_title_text = str(jd_title_raw) if pd.notna(jd_title_raw) else ""
+    jd_title_text = jd_profile.title_text
 
-    resume_experience_list = parsed_resume.get('experience', [])
     title_score = 0.0
     matching_resume_titles_found = []
-    all_resume_titles_checked_raw = [
-        str(entry.get('job_title', '')) for exp_entry_outer in resume_experience_list
-        for entry in (exp_entry_outer if isinstance(exp_entry_outer, list) else [exp_entry_outer])
-        if entry and isinstance(entry,dict) and entry.get('job_title')
-    ]
+    all_resume_titles_checked_raw = list(resume_profile.titles_checked)
 
     if not jd_title_text.strip(): title_score = 0.5
-    elif nlp_model is None or not hasattr(nlp_model, 'vocab') or not nlp_model.vocab.has_vector:
-        logging.warning("MATCHER: Passed NLP model for titles has no vectors or is None. Falling back to Jaccard.")
-        jd_title_tokens = clean_and_tokenize(jd_title_text, nlp_model) 
-        max_jaccard_score = 0.0
-        if jd_title_tokens and resume_experience_list:
-            for exp_entry_outer in resume_experience_list:
-                for exp_entry in (exp_entry_outer if isinstance(exp_entry_outer, list) else [exp_entry_outer]):
-                    if not exp_entry or not isinstance(exp_entry, dict): continue
-                    resume_title_text = exp_entry.get('job_title')
-                    if resume_title_text and isinstance(resume_title_text, str) and resume_title_text.strip():
-                        resume_title_tokens = clean_and_tokenize(resume_title_text, nlp_model)
-                        if resume_title_tokens:
-                            common = jd_title_tokens.intersection(resume_title_tokens)
-                            union = jd_title_tokens.union(resume_title_tokens)
-                            jaccard = len(common) / len(union) if union else 0.0
-                            if jaccard > max_jaccard_score: max_jaccard_score, matching_resume_titles_found = jaccard, [resume_title_text]
-                            elif jaccard == max_jaccard_score and max_jaccard_score > 0 and resume_title_text not in matching_resume_titles_found:
-                                matching_resume_titles_found.append(resume_title_text)
-            title_score = max_jaccard_score
-    else: 
-        jd_doc = nlp_model(jd_title_text)
-        max_similarity_score = 0.0
-        if resume_experience_list:
-            for exp_entry_outer in resume_experience_list:
-                for exp_entry in (exp_entry_outer if isinstance(exp_entry_outer, list) else [exp_entry_outer]):
-                    if not exp_entry or not isinstance(exp_entry, dict): continue
-                    resume_title_text = exp_entry.get('job_title')
-                    if resume_title_text and isinstance(resume_title_text, str) and resume_title_text.strip():
-                        resume_doc = nlp_model(resume_title_text)
-                        similarity = 0.0
-                        if jd_doc.has_vector and resume_doc.has_vector and jd_doc.vector_norm and resume_doc.vector_norm:
-                            similarity = jd_doc.similarity(resume_doc)
-                        else: logging.warning(f"MATCHER: Missing/zero vectors for title: '{jd_title_text}' vs '{resume_title_text}'")
-                        if similarity > max_similarity_score:
-                            max_similarity_score, matching_resume_titles_found = similarity, [resume_title_text]
-                        elif similarity == max_similarity_score and max_similarity_score > 0 and resume_title_text not in matching_resume_titles_found:
-                            matching_resume_titles_found.append(resume_title_text)
-            title_score = max_similarity_score
-    logging.debug(f"MATCHER Final Title Score: {title_score}")
+    else:
+        title_score, matching_resume_titles_found = _title_score_and_matches(resume_profile, jd_title_text, nlp_model, title_similarities)
+    if debug_enabled:
+        logging.debug(f"MATCHER Final Title Score: {title_score}")
+    if timer: timer.lap('title')
 
 
     # --- Keyword Matching
-    jd_keyword_text_parts = []
-    jd_text_sources = ['responsibilities', 'qualifications', 'preferred_qualifications', 
-                       'skills_text_raw_kaggle', 'job_description_text_raw_kaggle', 'job_title'] # Added job_title
-    for key in jd_text_sources:
-        content = parsed_jd.get(key)
-        if isinstance(content, list): # e.g responsibilities, qualifications
-            jd_keyword_text_parts.extend([str(item) for item in content if isinstance(item, str)])
-        elif isinstance(content, str): # e.g raw text fields, job_title
-            jd_keyword_text_parts.append(content)
-    # Also add JD skills list as text
-    if parsed_jd.get('skills'):
-        jd_keyword_text_parts.append(" ".join([str(s) for s in parsed_jd.get('skills', []) if isinstance(s,str)]))
-    jd_full_keyword_text = " ".join(jd_keyword_text_parts)
-
-    resume_keyword_text_parts = []
-    # Key resume sections for keywords
-    if parsed_resume.get('summary_text'):
-        resume_keyword_text_parts.append(str(parsed_resume.get('summary_text')))
-    for entry in parsed_resume.get('experience', []):
-        if isinstance(entry.get('description'), str):
-            resume_keyword_text_parts.append(entry.get('description'))
-        if isinstance(entry.get('job_title'), str): # Add job titles from experience
-             resume_keyword_text_parts.append(entry.get('job_title'))
-    # Also add resume skills list as text
-    if parsed_resume.get('skills'):
-        resume_keyword_text_parts.append(" ".join([str(s) for s in parsed_resume.get('skills',[]) if isinstance(s,str)]))
-    resume_full_keyword_text = " ".join(resume_keyword_text_parts)
-
-    logging.debug(f"MATCHER JD Keyword Text (first 200): {jd_full_keyword_text[:200]}")
-    logging.debug(f"MATCHER Resume Keyword Text (first 200): {resume_full_keyword_text[:200]}")
-
-    jd_keyword_tokens = clean_and_tokenize(jd_full_keyword_text)
-    resume_keyword_tokens = clean_and_tokenize(resume_full_keyword_text)
+    jd_keyword_tokens = jd_profile.keyword_tokens
+    resume_keyword_tokens = resume_profile.keyword_tokens
     
-    logging.debug(f"MATCHER JD Keyword Tokens (count {len(jd_keyword_tokens)}, sample): {list(jd_keyword_tokens)[:20]}")
-    logging.debug(f"MATCHER Resume Keyword Tokens (count {len(resume_keyword_tokens)}, sample): {list(resume_keyword_tokens)[:20]}")
-
     matching_keyword_tokens_set = jd_keyword_tokens.intersection(resume_keyword_tokens)
     # Filter out very common words that might have slipped through basic stop word lists if NLP_TOKENIZER failed
-    common_generic_words = {'role', 'team', 'work', 'experience', 'responsibilities', 'requirements', 'skills', 'job', 'position'}
-    final_matching_keywords = matching_keyword_tokens_set - common_generic_words
+    final_matching_keywords = matching_keyword_tokens_set - COMMON_GENERIC_WORDS
     matching_keywords_list = sorted(list(final_matching_keywords))
 
 
     keyword_score = 0.0
     # Score based on overlap with JD's non-generic keywords
-    # Consider only JD tokens that are not too generic for the denominator
-    jd_meaningful_tokens = jd_keyword_tokens - common_generic_words
+    jd_meaningful_tokens = jd_profile.meaningful_tokens
     if jd_meaningful_tokens:
         keyword_score = len(final_matching_keywords) / len(jd_meaningful_tokens)
     elif jd_keyword_tokens: # If all JD tokens were generic, but some existed
         keyword_score = len(final_matching_keywords) / len(jd_keyword_tokens) # Fallback to original denominator
 
-    logging.debug(f"MATCHER Keyword Score: {keyword_score}, Matching count: {len(final_matching_keywords)}, Meaningful JD Kwd Count: {len(jd_meaningful_tokens)}")
+    if debug_enabled:
+        logging.debug(f"MATCHER Keyword Score: {keyword_score}, Matching count: {len(final_matching_keywords)}, Meaningful JD Kwd Count: {len(jd_meaningful_tokens)}")
+    if timer: timer.lap('keyword')
 
 
     #---Final Score Logic---
-    skill_weight = 0.35
-    experience_weight = 0.15
-    education_weight = 0.05
-    title_weight = 0.15
-    keyword_weight = 0.30
-
-    final_score = (skill_score * skill_weight) + (experience_score * experience_weight) + \
-                 (education_score * education_weight) + (title_score * title_weight)+ \
-                 (keyword_score * keyword_weight)
+    skill_weight = SKILL_WEIGHT
+    experience_weight = EXPERIENCE_WEIGHT
+    education_weight = EDUCATION_WEIGHT
+    title_weight = TITLE_WEIGHT
+    keyword_weight = KEYWORD_WEIGHT
+
+    final_score = _combine_component_scores(skill_score, experience_score, education_score, title_score, keyword_score)
                  
-    logging.info(f"MATCHER FINAL SCORE: {final_score:.4f} "
-                 f"[Skills: {skill_score:.2f} (w:{skill_weight}), Exp: {experience_score:.2f} (w:{experience_weight}), "
-                 f"Edu: {education_score:.2f} (w:{education_weight}), Title: {title_score:.2f} (w:{title_weight}), "
-                 f"Keyword: {keyword_score:.2f} (w:{keyword_weight})]")
+    if info_enabled:
+        logging.info(f"MATCHER FINAL SCORE: {final_score:.4f} "
+                     f"[Skills: {skill_score:.2f} (w:{skill_weight}), Exp: {experience_score:.2f} (w:{experience_weight}), "
+                     f"Edu: {education_score:.2f} (w:{education_weight}), Title: {title_score:.2f} (w:{title_weight}), "
+                     f"Keyword: {keyword_score:.2f} (w:{keyword_weight})]")
     
     results = {
         'score':final_score,
@@ -317,5 +628,347 @@ def calculate_match_score(parsed_resume,parsed_jd,nlp_model):
        
         }
     }  
+    if timer:
+        results['timings'] = timer.finish()
     return results
 
+
+def calculate_match_score(parsed_resume,parsed_jd,nlp_model):
+    """
+    Scores one resume against one JD. Both sides can be given as parsed dicts
+    or as prebuilt ResumeMatchProfile / JDMatchProfile objects.
+    """
+
+    if not parsed_resume or not parsed_jd:
+        logging.warning("Matcher: Received none for parsed_resume or parsed_jd.")
+        return {}
+
+    resume_profile = get_resume_profile(parsed_resume)
+    return _score_with_profiles(resume_profile, parsed_jd, nlp_model)
+
+
+def calculate_match_scores(parsed_resume, parsed_jds, nlp_model):
+    """
+    Scores one resume against a list of parsed JDs in a single call.
+    The resume-side work (skills, titles, keyword tokens) is done once and
+    reused for every JD. parsed_resume can also be a ResumeMatchProfile. Returns one results dict per JD, in the same order
+    and with the same content calculate_match_score would give for each pair.
+    """
+    if not parsed_resume:
+        logging.warning("Matcher: Received none for parsed_resume.")
+        return [{} for _ in parsed_jds]
+
+    resume_profile = get_resume_profile(parsed_resume)
+    jd_profiles = [get_jd_profile(parsed_jd) if parsed_jd else None for parsed_jd in parsed_jds]
+    # The batch work is timed as extra title / skill time; the pairs are counted by the per-pair laps below
+    timer = match_timing.StageTimer(pairs=0) if match_timing.TIMING_ENABLED else None
+    title_similarity_rows = _batch_title_similarities(resume_profile, jd_profiles, nlp_model)
+    if timer: timer.lap('title')
+    skill_matches = _batch_skill_matches(resume_profile, jd_profiles)
+    if timer: timer.lap('skill')
+    if timer: timer.finish()
+
+    all_results = []
+    for jd_profile, title_similarities, skill_match in zip(jd_profiles, title_similarity_rows, skill_matches):
+        if jd_profile is None:
+            logging.warning("Matcher: Received none for parsed_jd.")
+            all_results.append({})
+            continue
+        all_results.append(_score_with_profiles(resume_profile, jd_profile, nlp_model, title_similarities, skill_match))
+    return all_results
+
+
+def _decode_matching_skills(resume_profile, jd_profile):
+    n_words = max(len(resume_profile.skill_bits), len(jd_profile.skill_bits))
+    shared_bits = pad_skill_bits(resume_profile.skill_bits, n_words) & pad_skill_bits(jd_profile.skill_bits, n_words)
+    return get_skill_vocabulary().decode(shared_bits)
+
+
+def _batch_skill_matches(resume_profile, jd_profiles):
+    """
+    Skill scores and match counts for all JDs at once: the JD skill bitsets
+    are stacked into one matrix and AND-ed with the resume bitset.
+    Returns one (skill_score, match_count) pair per JD, None for missing JDs.
+    """
+    valid_rows = [i for i, jd_profile in enumerate(jd_profiles) if jd_profile is not None]
+    skill_matches = [None] * len(jd_profiles)
+    if not valid_rows:
+        return skill_matches
+
+    n_words = get_skill_vocabulary().n_words
+    jd_skill_matrix = stack_skill_bits([jd_profiles[i].skill_bits for i in valid_rows], n_words)
+    match_counts = skill_overlap_counts(resume_profile.skill_bits, jd_skill_matrix)
+    required_counts = np.array([len(jd_profiles[i].skills_set) for i in valid_rows])
+    skill_scores = skill_scores_from_counts(match_counts, required_counts)
+    for row, i in enumerate(valid_rows):
+        skill_matches[i] = (float(skill_scores[row]), int(match_counts[row]))
+    return skill_matches
+
+
+def _batch_title_similarities(resume_profile, jd_profiles, nlp_model):
+    """
+    Computes the title similarity rows for all JDs with one matrix product
+    (distinct JD titles x resume titles). Returns one row per JD, or None
+    where the title stage does not use vectors for that JD.
+    """
+    title_similarity_rows = [None] * len(jd_profiles)
+    if not _uses_title_vectors(nlp_model) or not resume_profile.titles_for_scoring:
+        return title_similarity_rows
+
+    jd_title_rows = {}
+    for jd_profile in jd_profiles:
+        if jd_profile is not None and jd_profile.title_text.strip():
+            jd_title_rows.setdefault(jd_profile.title_text, len(jd_title_rows))
+    if not jd_title_rows:
+        return title_similarity_rows
+
+    resume_title_matrix = resume_profile.get_title_features(nlp_model, use_vectors=True)
+    similarities = title_similarity_matrix(list(jd_title_rows), resume_profile.titles_for_scoring, nlp_model, resume_title_matrix)
+    for i, jd_profile in enumerate(jd_profiles):
+        if jd_profile is not None and jd_profile.title_text in jd_title_rows:
+            title_similarity_rows[i] = similarities[jd_title_rows[jd_profile.title_text]]
+    return title_similarity_rows
+
+
+def _batch_experience_scores(resume_profile, jd_profiles):
+    # None means no requirement (0.5); a NaN requirement is never met, as in the per-pair comparison
+    no_requirement = np.array([jd_profile.experience_years is None for jd_profile in jd_profiles], dtype=bool)
+    jd_years = np.array([np.nan if jd_profile.experience_years is None else jd_profile.experience_years
+                         for jd_profile in jd_profiles], dtype=np.float64)
+    met = resume_profile.experience_years >= jd_years
+    return np.where(no_requirement, 0.5, met.astype(np.float64))
+
+
+def _batch_education_scores(resume_profile, jd_profiles):
+    jd_levels = np.array([jd_profile.education_level for jd_profile in jd_profiles], dtype=np.int64)
+    if resume_profile.education_level < 0:
+        met = np.zeros(len(jd_profiles), dtype=bool)
+    else:
+        met = resume_profile.education_level >= jd_levels
+    return np.where(jd_levels < 0, 0.5, met.astype(np.float64))
+
+
+def _title_score_upper_bounds(resume_profile, jd_profiles):
+    # Title similarity is at most 1.0 up to float32 rounding; a JD without a title always gets exactly 0.5
+    has_title = np.array([bool(jd_profile.title_text.strip()) for jd_profile in jd_profiles])
+    best_case = 1.0 + TITLE_SIMILARITY_BOUND_SLACK if resume_profile.titles_for_scoring else 0.0
+    return np.where(has_title, best_case, 0.5)
+
+
+def _keyword_score_upper_bounds(resume_profile, jd_profiles):
+    # At most every meaningful resume token can match a meaningful JD token
+    meaningful_counts = np.array([len(jd_profile.meaningful_tokens) for jd_profile in jd_profiles], dtype=np.float64)
+    safe_counts = np.where(meaningful_counts > 0, meaningful_counts, 1.0)
+    upper_bounds = np.minimum(1.0, resume_profile.meaningful_token_count / safe_counts)
+    return np.where(meaningful_counts > 0, upper_bounds, 0.0)
+
+
+def _keyword_score_only(resume_profile, jd_profile):
+    # Same value as the keyword stage of _score_with_profiles, without building the keyword lists
+    if not jd_profile.meaningful_tokens:
+        return 0.0
+    matching_count = len(jd_profile.meaningful_tokens.intersection(resume_profile.keyword_tokens))
+    return matching_count / len(jd_profile.meaningful_tokens)
+
+
+def _title_score_only(resume_profile, jd_profile, nlp_model, title_similarities=None):
+    # Same value as the title stage of _score_with_profiles, without collecting the matching titles
+    if not jd_profile.title_text.strip():
+        return 0.5
+    if title_similarities is None:
+        return _title_score_and_matches(resume_profile, jd_profile.title_text, nlp_model)[0]
+    best_similarity = title_similarities.max()
+    return float(best_similarity) if best_similarity > 0.0 else 0.0
+
+
+def score_matches(parsed_resume, parsed_jds, nlp_model, keyword_scorer=None):
+    """
+    Score-only version of calculate_match_scores: returns a NumPy record
+    array (COMPONENT_SCORE_DTYPE) with the final and component scores of
+    every JD, and builds none of the explanation lists. Missing JDs get an
+    all-zero row. Use explain_match for the detailed breakdown of the rows
+    that are actually shown. keyword_scorer(resume_profile, jd_profiles) can
+    replace the exact keyword overlap, e.g. keyword_index.HashedKeywordScorer.
+    """
+    component_scores = np.zeros(len(parsed_jds), dtype=COMPONENT_SCORE_DTYPE)
+    if not parsed_resume:
+        logging.warning("Matcher: Received none for parsed_resume.")
+        return component_scores
+
+    resume_profile = get_resume_profile(parsed_resume)
+    valid_rows = [i for i, parsed_jd in enumerate(parsed_jds) if parsed_jd]
+    if not valid_rows:
+        return component_scores
+    jd_profiles = [get_jd_profile(parsed_jds[i]) for i in valid_rows]
+    timer = match_timing.StageTimer(pairs=len(jd_profiles)) if match_timing.TIMING_ENABLED else None
+
+    skill_scores = np.array([skill_score for skill_score, _ in _batch_skill_matches(resume_profile, jd_profiles)])
+    if timer: timer.lap('skill')
+    experience_scores = _batch_experience_scores(resume_profile, jd_profiles)
+    if timer: timer.lap('experience')
+    education_scores = _batch_education_scores(resume_profile, jd_profiles)
+    if timer: timer.lap('education')
+    title_similarity_rows = _batch_title_similarities(resume_profile, jd_profiles, nlp_model)
+    title_scores = np.array([_title_score_only(resume_profile, jd_profile, nlp_model, title_similarities)
+                             for jd_profile, title_similarities in zip(jd_profiles, title_similarity_rows)])
+    if timer: timer.lap('title')
+    if keyword_scorer is None:
+        keyword_scores = np.array([_keyword_score_only(resume_profile, jd_profile) for jd_profile in jd_profiles])
+    else:
+        keyword_scores = np.asarray(keyword_scorer(resume_profile, jd_profiles), dtype=np.float64)
+    if timer: timer.lap('keyword')
+
+    component_scores['skill'][valid_rows] = skill_scores
+    component_scores['experience'][valid_rows] = experience_scores
+    component_scores['education'][valid_rows] = education_scores
+    component_scores['title'][valid_rows] = title_scores
+    component_scores['keyword'][valid_rows] = keyword_scores
+    component_scores['score'][valid_rows] = _combine_component_scores(
+        skill_scores, experience_scores, education_scores, title_scores, keyword_scores)
+    if timer: timer.finish()
+    return component_scores
+
+
+def explain_match(parsed_resume, parsed_jd, nlp_model):
+    """
+    Full results dict (matching skills, titles, keywords...) for one pair,
+    meant for the few rows the UI actually displays after score-only ranking.
+    """
+    return calculate_match_score(parsed_resume, parsed_jd, nlp_model)
+
+
+def top_k_matches(parsed_resume, parsed_jds, k, nlp_model, candidate_indexes=None):
+    """
+    Returns the k best (jd_index, results) pairs for one resume, best first,
+    in the same order sorted(...)[:k] over calculate_match_scores would give.
+    Skills, experience and education are scored for every JD at once and,
+    with the title and keyword components at their best case, give an upper
+    bound on each JD's score. JDs are visited in upper bound order and the
+    rest are skipped once no upper bound can beat the current k-th score.
+    For a visited JD the keyword overlap is counted first to tighten its
+    bound, and the title stage only runs if it still can. Visited JDs are
+    scored without explanations; explain_match builds the results dicts of
+    the k winners only. candidate_indexes (e.g. from SkillIndex or
+    TitleANNIndex) limits the search to those positions of parsed_jds.
+    """
+    if not parsed_resume:
+        logging.warning("Matcher: Received none for parsed_resume.")
+        return []
+    if k <= 0:
+        return []
+
+    resume_profile = get_resume_profile(parsed_resume)
+    if candidate_indexes is None:
+        candidate_indexes = range(len(parsed_jds))
+    jd_indexes = [int(i) for i in candidate_indexes if parsed_jds[i]]
+    jd_profiles = [get_jd_profile(parsed_jds[i]) for i in jd_indexes]
+    if not jd_profiles:
+        return []
+
+    # Skills, experience and education are timed for every JD; keyword and title only for the JDs visited
+    timer = match_timing.StageTimer(pairs=len(jd_profiles)) if match_timing.TIMING_ENABLED else None
+    skill_matches = _batch_skill_matches(resume_profile, jd_profiles)
+    skill_scores = np.array([skill_score for skill_score, _ in skill_matches])
+    if timer: timer.lap('skill')
+    experience_scores = _batch_experience_scores(resume_profile, jd_profiles)
+    if timer: timer.lap('experience')
+    education_scores = _batch_education_scores(resume_profile, jd_profiles)
+    if timer: timer.lap('education')
+    title_upper_bounds = _title_score_upper_bounds(resume_profile, jd_profiles)
+    upper_bounds = _combine_component_scores(
+        skill_scores, experience_scores, education_scores, title_upper_bounds,
+        _keyword_score_upper_bounds(resume_profile, jd_profiles),
+    )
+
+    # Min-heap of the best k so far; (score, -jd_index) so ties keep the earlier JD
+    best_matches = []
+    fully_scored = 0
+    keyword_seconds = title_seconds = 0.0
+    keyword_pairs = 0
+    for position in np.argsort(-upper_bounds, kind='stable'):
+        if len(best_matches) == k and upper_bounds[position] < best_matches[0][0]:
+            break
+        if timer:
+            keyword_start = perf_counter()
+        keyword_score = _keyword_score_only(resume_profile, jd_profiles[position])
+        if timer:
+            title_start = perf_counter()
+            keyword_seconds += title_start - keyword_start
+            keyword_pairs += 1
+        if len(best_matches) == k:
+            tightened_upper_bound = _combine_component_scores(
+                skill_scores[position], experience_scores[position], education_scores[position],
+                title_upper_bounds[position], keyword_score)
+            if tightened_upper_bound < best_matches[0][0]:
+                continue
+        title_score = _title_score_only(resume_profile, jd_profiles[position], nlp_model,
+                                        _batch_title_similarities(resume_profile, [jd_profiles[position]], nlp_model)[0])
+        if timer:
+            title_seconds += perf_counter() - title_start
+        score = _combine_component_scores(skill_scores[position], experience_scores[position],
+                                          education_scores[position], title_score, keyword_score)
+        fully_scored += 1
+        heap_entry = (float(score), -jd_indexes[position], position)
+        if len(best_matches) < k:
+            heapq.heappush(best_matches, heap_entry)
+        elif heap_entry[:2] > best_matches[0][:2]:
+            heapq.heapreplace(best_matches, heap_entry)
+
+    if timer:
+        timer.add('keyword', keyword_seconds, pairs=keyword_pairs)
+        timer.add('title', title_seconds, pairs=fully_scored)
+        timer.finish()
+    logging.info(f"MATCHER top_k: fully scored {fully_scored} of {len(jd_profiles)} JDs for k={k}.")
+    best_matches.sort(key=lambda entry: entry[:2], reverse=True)
+    return [(-neg_jd_index, _score_with_profiles(resume_profile, jd_profiles[position], nlp_model,
+                                                 skill_match=skill_matches[position]))
+            for _, neg_jd_index, position in best_matches]
+
+
+
+def _merge_top_k(best_scores, best_indexes, scores, indexes, k):
+    # Keeps the k best (score, index) pairs, best first, ties going to the lower index
+    all_scores = np.concatenate([best_scores, scores])
+    all_indexes = np.concatenate([best_indexes, indexes])
+    order = np.lexsort((all_indexes, -all_scores))[:k]
+    return all_scores[order], all_indexes[order]
+
+
+def _explain_snapshot(resume_profile, best_indexes, explained, get_jd, nlp_model):
+    """(index, results) pairs of the current top k; only entries new to the top k are explained."""
+    matches = []
+    for index in best_indexes.tolist():
+        results = explained.get(index)
+        if results is None:
+            results = explain_match(resume_profile, get_jd(index), nlp_model)
+        matches.append((index, results))
+    return matches
+
+
+def iter_matches(parsed_resume, parsed_jds, k, nlp_model, chunk_size=MATCH_CHUNK_SIZE):
+    """
+    Scores the JDs chunk by chunk and yields a snapshot after every chunk:
+    {'scored': JDs scored so far, 'total': len(parsed_jds), 'matches': the
+    best k (jd_index, results) pairs so far, best first}. Callers can render
+    each snapshot and stop iterating whenever they like; the last snapshot
+    has the same matches as top_k_matches.
+    """
+    if not parsed_resume:
+        logging.warning("Matcher: Received none for parsed_resume.")
+        return
+    if k <= 0:
+        return
+
+    resume_profile = get_resume_profile(parsed_resume)
+    best_scores = np.zeros(0, dtype=np.float64)
+    best_indexes = np.zeros(0, dtype=np.int64)
+    explained = {}
+    for start in range(0, len(parsed_jds), chunk_size):
+        chunk = parsed_jds[start:start + chunk_size]
+        chunk_scores = score_matches(resume_profile, chunk, nlp_model)['score']
+        present = np.array([bool(parsed_jd) for parsed_jd in chunk], dtype=bool)
+        best_scores, best_indexes = _merge_top_k(best_scores, best_indexes, chunk_scores[present],
+                                                 start + np.flatnonzero(present), k)
+        matches = _explain_snapshot(resume_profile, best_indexes, explained, parsed_jds.__getitem__, nlp_model)
+        explained = dict(matches)
+        yield {'scored': start + len(chunk), 'total': len(parsed_jds), 'matches': matches}
@@ -7,7 +7,7 @@ import logging
 import re 
 import spacy 
 
-from matcher import calculate_match_score 
+from matcher import calculate_match_score, get_jd_profile, ResumeMatchProfile
 
 PAGE_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 APP_ROOT_DIR = os.path.dirname(PAGE_BASE_DIR) 
@@ -65,8 +65,15 @@ def load_all_parsed_resumes_from_folder(folder_path):
         logging.error(f"FindCandidatesPage: Failed to list or load PARSED RESUMES from folder '{folder_path}': {e_oslistdir}")
         return []
 
+@st.cache_resource
+def build_resume_match_profiles(folder_path):
+    # One ResumeMatchProfile per loaded resume (None for invalid entries), reused for every submitted JD
+    all_resumes = load_all_parsed_resumes_from_folder(folder_path)
+    return [ResumeMatchProfile(resume_data) if isinstance(resume_data, dict) else None for resume_data in all_resumes]
+
 NLP_MODEL_PAGE = get_nlp_model_for_page()
 ALL_PARSED_RESUMES = load_all_parsed_resumes_from_folder(PARSED_RESUMES_FOLDER_PATH)
+ALL_RESUME_PROFILES = build_resume_match_profiles(PARSED_RESUMES_FOLDER_PATH)
 
 
 # --- Streamlit App UI ---
@@ -126,6 +133,8 @@ if submitted:
             "preferred_qualifications": [], "skills_text_raw_kaggle": skills_input 
         }
         logging.info(f"Manual JD prepared for matching: {manual_parsed_jd.get('job_title')}")
+        # JD-side features are built once and reused for every candidate resume
+        manual_jd_profile = get_jd_profile(manual_parsed_jd)
 
         all_resume_match_results = []
         with st.spinner(f"Comparing against {len(ALL_PARSED_RESUMES)} candidate resumes..."):
@@ -133,7 +142,7 @@ if submitted:
                 if not isinstance(resume_data_from_file, dict):
                     logging.warning(f"Skipping resume at index {idx} as it's not a dictionary.")
                     continue
-                match_details = calculate_match_score(resume_data_from_file, manual_parsed_jd, NLP_MODEL_PAGE) 
+                match_details = calculate_match_score(ALL_RESUME_PROFILES[idx], manual_jd_profile, NLP_MODEL_PAGE) 
                 
                 resume_identifier = f"Resume (Index {idx})" 
                 if resume_data_from_file.get('contact_info'):
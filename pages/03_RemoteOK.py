@@ -10,16 +10,33 @@ import logging
 
 # --- Import your custom modules ---
 try:
-    from matcher import calculate_match_score
+    from matcher import calculate_match_score, ResumeMatchProfile
+    from columnar_matcher import JDColumnarCorpus, iter_matches_from_corpus
     logging.info("Successfully imported 'matcher.py'")
 except ImportError:
     st.error("CRITICAL ERROR: Could not import 'matcher.py'. Ensure it's in the correct path.")
     logging.error("Could not import 'matcher.py'.")
     calculate_match_score = None 
+    ResumeMatchProfile = None
+    iter_matches_from_corpus = None
+    JDColumnarCorpus = None
 except Exception as e:
     st.error(f"CRITICAL ERROR: Error importing 'matcher.py': {e}")
     logging.error(f"Error importing 'matcher.py': {e}")
     calculate_match_score = None
+    ResumeMatchProfile = None
+    iter_matches_from_corpus = None
+    JDColumnarCorpus = None
+
+# Optional: without the store, title embeddings are just recomputed
+try:
+    from title_vectors import attach_title_vector_store
+    from title_vector_store import TitleVectorStore, DEFAULT_TITLE_VECTOR_STORE_DIR
+except Exception as e:
+    logging.warning(f"Title vector store unavailable, title embeddings will not be persisted: {e}")
+    attach_title_vector_store = None
+    TitleVectorStore = None
+    DEFAULT_TITLE_VECTOR_STORE_DIR = None
 
 try:
     from resume_parser import (
@@ -117,25 +134,34 @@ def load_and_preprocess_parsed_jds(csv_filepath):
             # else:
                 # logging.warning(f"Expected list-like column '{col}' not found in DataFrame.")
         
-        # Convert DataFrame to list of dictionaries
-        job_list = df.to_dict(orient='records')
-        logging.info(f"Converted DataFrame to {len(job_list)} job dictionaries.")
-        return job_list
+        # Kept as a DataFrame: the columnar matcher scores straight from the columns
+        return df
         
     except FileNotFoundError:
         st.error(f"ERROR: Parsed job descriptions file not found: {csv_filepath}. Please run scraper and parser scripts.")
         logging.error(f"Parsed job descriptions file not found at {csv_filepath}")
-        return []
+        return pd.DataFrame()
     except Exception as e:
         st.error(f"ERROR: Failed to load or process parsed JDs from {csv_filepath}: {e}")
         logging.error(f"Failed to load or process parsed JDs: {e}")
-        return []
+        return pd.DataFrame()
+
+@st.cache_resource
+def build_jd_corpus(csv_filepath):
+    # Column features (skill/keyword matrices, experience/education arrays) built once per CSV
+    jd_frame = load_and_preprocess_parsed_jds(csv_filepath)
+    if jd_frame.empty or JDColumnarCorpus is None:
+        return None
+    return JDColumnarCorpus(jd_frame)
 
 @st.cache_resource 
 def get_nlp_model():
     try:
         model = spacy.load("en_core_web_md")
         logging.info("spaCy NLP model 'en_core_web_md' loaded successfully for the app.")
+        # Title embeddings from earlier runs are read from disk instead of recomputed
+        if TitleVectorStore is not None:
+            attach_title_vector_store(model, TitleVectorStore(DEFAULT_TITLE_VECTOR_STORE_DIR, model))
         return model
     except OSError:
         st.error("App Error: spaCy model 'en_core_web_md' not found. Please run: python -m spacy download en_core_web_md")
@@ -152,7 +178,8 @@ def get_skills_data_for_resume_parser_cached(skill_file_path=None):
 # --- Load Global Resources ---
 NLP_MODEL = get_nlp_model()
 TECH_SKILLS_LIST_APP, TECH_SKILLS_SET_APP = get_skills_data_for_resume_parser_cached(SKILLS_JSON_PATH_FOR_RESUME_PARSER)
-ALL_PARSED_JOBS_FULL_LIST = load_and_preprocess_parsed_jds(PARSED_JOBS_CSV_PATH) # Load RemoteOK jobs
+JD_CORPUS = build_jd_corpus(PARSED_JOBS_CSV_PATH) # Load RemoteOK jobs
+ALL_PARSED_JOBS_FRAME = JD_CORPUS.frame if JD_CORPUS is not None else pd.DataFrame()
 
 # --- Initialize Session State for Filters ---
 if 'selected_locations' not in st.session_state:
@@ -162,10 +189,9 @@ if 'selected_locations' not in st.session_state:
 
 # --- Prepare Filter Options ---
 unique_locations = []
-if ALL_PARSED_JOBS_FULL_LIST:
+if not ALL_PARSED_JOBS_FRAME.empty and 'location' in ALL_PARSED_JOBS_FRAME.columns:
     locations_set = set()
-    for job in ALL_PARSED_JOBS_FULL_LIST:
-        loc = job.get('location') # Use 'location' from RemoteOK data
+    for loc in ALL_PARSED_JOBS_FRAME['location'].tolist(): # Use 'location' from RemoteOK data
         if loc and isinstance(loc, str) and loc.strip():
             locations_set.add(loc.strip())
     unique_locations = sorted(list(locations_set))
@@ -176,7 +202,7 @@ st.write("Upload your resume (TXT, DOCX, PDF) to find suitable job openings from
 
 with st.sidebar:
     st.header("🔍 Job Filters")
-    if not ALL_PARSED_JOBS_FULL_LIST:
+    if ALL_PARSED_JOBS_FRAME.empty:
         st.caption("Job data not loaded, filters unavailable.")
     else:
         if unique_locations:
@@ -193,18 +219,18 @@ with st.sidebar:
             st.rerun()
 
 # --- Apply Filters ---
-jobs_to_display_and_match = ALL_PARSED_JOBS_FULL_LIST
-if ALL_PARSED_JOBS_FULL_LIST:
+# Row positions of the jobs left after the filters
+rows_to_display_and_match = list(range(len(ALL_PARSED_JOBS_FRAME)))
+if not ALL_PARSED_JOBS_FRAME.empty:
     if st.session_state.selected_locations:
         selected_locs_normalized = {loc.strip().lower() for loc in st.session_state.selected_locations}
-        jobs_to_display_and_match = [
-            job for job in jobs_to_display_and_match 
-            if job.get('location') and isinstance(job.get('location'), str) and \
-               job.get('location').strip().lower() in selected_locs_normalized
+        rows_to_display_and_match = [
+            row for row, loc in enumerate(ALL_PARSED_JOBS_FRAME['location'].tolist())
+            if loc and isinstance(loc, str) and loc.strip().lower() in selected_locs_normalized
         ]
-        logging.info(f"After location filter, count: {len(jobs_to_display_and_match)}")
+        logging.info(f"After location filter, count: {len(rows_to_display_and_match)}")
     # Add work type filter logic here if you re-implement it
-logging.info(f"Final job count for matching after filters: {len(jobs_to_display_and_match)}")
+logging.info(f"Final job count for matching after filters: {len(rows_to_display_and_match)}")
 
 
 # --- Resume Upload and Processing ---
@@ -213,7 +239,7 @@ if NLP_MODEL is None:
     # Error already shown by get_nlp_model()
     critical_error_occurred = True
 
-if not ALL_PARSED_JOBS_FULL_LIST and not critical_error_occurred: 
+if ALL_PARSED_JOBS_FRAME.empty and not critical_error_occurred: 
     st.warning(f"Job descriptions could not be loaded from '{PARSED_JOBS_CSV_PATH}'. Matching may be limited or unavailable.")
 
 uploaded_file = st.file_uploader("Choose a resume file", type=['txt', 'docx', 'pdf'], key="resume_uploader_remoteok")
@@ -247,10 +273,17 @@ if uploaded_file is not None:
                 logging.error(f"Failed to process resume: {uploaded_file.name} - {error_msg}")
                 if 'parsed_resume_data' in st.session_state:
                     del st.session_state.parsed_resume_data
+                if 'resume_match_profile' in st.session_state:
+                    del st.session_state.resume_match_profile
         
         if processing_successful and 'parsed_resume_data' in st.session_state:
             st.success("✅ Resume processed successfully!")
             data_to_display_resume = st.session_state.parsed_resume_data
+
+            # Matcher features for the resume are kept across reruns and only rebuilt for a different resume
+            if st.session_state.get('resume_match_profile') is None or \
+               st.session_state.resume_match_profile.parsed_resume != data_to_display_resume:
+                st.session_state.resume_match_profile = ResumeMatchProfile(data_to_display_resume)
             
             st.markdown("---")
             st.subheader("📄 Your Parsed Resume Information:")
@@ -326,50 +359,64 @@ if uploaded_file is not None:
             st.markdown("---")
             st.subheader("📊 Job Matching Results (RemoteOK Data):")
             
-            if not jobs_to_display_and_match and (st.session_state.selected_locations): # Only location filter active now
+            if not rows_to_display_and_match and (st.session_state.selected_locations): # Only location filter active now
                 st.info("No jobs match your current filter selections. Try adjusting the filters in the sidebar.")
-            elif not jobs_to_display_and_match and not ALL_PARSED_JOBS_FULL_LIST: # No jobs loaded at all
+            elif not rows_to_display_and_match and ALL_PARSED_JOBS_FRAME.empty: # No jobs loaded at all
                  st.warning("Job data is not loaded. Cannot perform matching.")
-            elif jobs_to_display_and_match and data_to_display_resume:
+            elif rows_to_display_and_match and data_to_display_resume:
                 all_job_match_results = []
                 
-                spinner_text = f"Calculating job matches against {len(jobs_to_display_and_match)} RemoteOK jobs..."
-                if len(jobs_to_display_and_match) != len(ALL_PARSED_JOBS_FULL_LIST):
-                     spinner_text = (f"Calculating job matches against {len(jobs_to_display_and_match)} filtered RemoteOK jobs "
-                                     f"(out of {len(ALL_PARSED_JOBS_FULL_LIST)} total)...")
-
-                with st.spinner(spinner_text):
-                    for parsed_jd_dict_from_csv in jobs_to_display_and_match: # This is a dict from the loaded CSV
-                        # The parsed_jd_dict_from_csv already has the structure your matcher expects
-                        # because it was created by your job_description_parser.py
-                        match_details = calculate_match_score(data_to_display_resume, parsed_jd_dict_from_csv,NLP_MODEL)
-                        
-                        all_job_match_results.append({
-                            "job_title": parsed_jd_dict_from_csv.get("job_title", "N/A"), 
-                            "company": parsed_jd_dict_from_csv.get("company_name", "N/A"), # Use company_name
-                            "location": parsed_jd_dict_from_csv.get("location", "N/A"),
-                            "url": parsed_jd_dict_from_csv.get("original_url", "#"), # Use original_url
-                            "date_posted": parsed_jd_dict_from_csv.get("date_posted", "N/A"),
-                            "description_snippet": str(parsed_jd_dict_from_csv.get("description_text", ""))[:250] + "...",
-                            "match_details": match_details,
-                            "original_job_data": parsed_jd_dict_from_csv # Keep the full parsed JD for detailed display
-                        })
+                spinner_text = f"Calculating job matches against {len(rows_to_display_and_match)} RemoteOK jobs..."
+                if len(rows_to_display_and_match) != len(ALL_PARSED_JOBS_FRAME):
+                     spinner_text = (f"Calculating job matches against {len(rows_to_display_and_match)} filtered RemoteOK jobs "
+                                     f"(out of {len(ALL_PARSED_JOBS_FRAME)} total)...")
+
+                st.write(f"Showing top matches from {len(rows_to_display_and_match)} currently displayed RemoteOK jobs:")
                 
-                sorted_matches = sorted(all_job_match_results, key=lambda x: x['match_details'].get('score', 0), reverse=True)
+                # Slider is read before matching so only the displayed top matches are fully scored
+                slider_max = max(1, min(20, len(rows_to_display_and_match)))
+                slider_default = min(5, slider_max) # Default to 5 or less if fewer matches
+                num_matches_to_show = st.slider(
+                    "Number of top matches to display:", 
+                    min_value=1, 
+                    max_value=slider_max,
+                    value=slider_default, 
+                    key="matches_slider_remoteok"
+                )
+
+                # Snapshots of the best matches so far are shown while the rest of the jobs are scored
+                match_progress = st.progress(0.0, text=spinner_text)
+                early_matches_placeholder = st.empty()
+                top_matches = []
+                for snapshot in iter_matches_from_corpus(st.session_state.resume_match_profile, JD_CORPUS, num_matches_to_show,
+                                                         NLP_MODEL, rows=rows_to_display_and_match):
+                    top_matches = snapshot['matches']
+                    match_progress.progress(snapshot['scored'] / snapshot['total'], text=spinner_text)
+                    if snapshot['scored'] < snapshot['total']:
+                        early_matches_placeholder.caption("Best so far: " + ", ".join(
+                            f"{JD_CORPUS.title_texts[job_row] or 'N/A'} ({match_details.get('score', 0) * 100:.0f}%)"
+                            for job_row, match_details in top_matches))
+                match_progress.empty()
+                early_matches_placeholder.empty()
+                for job_row, match_details in top_matches:
+                    parsed_jd_dict_from_csv = JD_CORPUS.row_dict(job_row) # Only the displayed rows become dicts
+                    # The parsed_jd_dict_from_csv already has the structure your matcher expects
+                    # because it was created by your job_description_parser.py
+                    
+                    all_job_match_results.append({
+                        "job_title": parsed_jd_dict_from_csv.get("job_title", "N/A"), 
+                        "company": parsed_jd_dict_from_csv.get("company_name", "N/A"), # Use company_name
+                        "location": parsed_jd_dict_from_csv.get("location", "N/A"),
+                        "url": parsed_jd_dict_from_csv.get("original_url", "#"), # Use original_url
+                        "date_posted": parsed_jd_dict_from_csv.get("date_posted", "N/A"),
+                        "description_snippet": str(parsed_jd_dict_from_csv.get("description_text", ""))[:250] + "...",
+                        "match_details": match_details,
+                        "original_job_data": parsed_jd_dict_from_csv # Keep the full parsed JD for detailed display
+                    })
+            
+                sorted_matches = all_job_match_results # iter_matches_from_corpus snapshots are already best first
                 
                 if sorted_matches:
-                    st.write(f"Showing top matches from {len(jobs_to_display_and_match)} currently displayed RemoteOK jobs:")
-                    
-                    # Adjust slider max_value based on available sorted_matches
-                    slider_max = max(1, min(20, len(sorted_matches)))
-                    slider_default = min(5, slider_max) # Default to 5 or less if fewer matches
-                    num_matches_to_show = st.slider(
-                        "Number of top matches to display:", 
-                        min_value=1, 
-                        max_value=slider_max,
-                        value=slider_default, 
-                        key="matches_slider_remoteok"
-                    )
 
                     for i, result_entry in enumerate(sorted_matches[:num_matches_to_show]):
                         job_title_display = result_entry["job_title"]
@@ -466,7 +513,7 @@ if uploaded_file is not None:
                 else:
                     st.info("No job matches found for this resume within the current filter criteria.")
             else: 
-                if not ALL_PARSED_JOBS_FULL_LIST: 
+                if ALL_PARSED_JOBS_FRAME.empty: 
                     # Warning already shown if file not loaded
                     pass
                 elif not ('parsed_resume_data' in st.session_state and st.session_state.parsed_resume_data):
@@ -475,4 +522,6 @@ else:
     st.info("☝️ Upload a resume file to get started.")
     if 'parsed_resume_data' in st.session_state: 
         del st.session_state.parsed_resume_data
+    if 'resume_match_profile' in st.session_state:
+        del st.session_state.resume_match_profile
 
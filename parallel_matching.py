@@ -0,0 +1,119 @@
+import heapq
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from lazy_loading import get_nlp_model
+from matcher import top_k_matches, calculate_match_score, get_jd_profile, ResumeMatchProfile
+
+
+# Shards per worker, so a slow shard does not leave the other workers idle at the end
+SHARDS_PER_WORKER = 4
+
+# Per-process state, set once by _init_worker
+_WORKER_NLP_MODEL = None
+_WORKER_CORPUS_SIDE = None
+_WORKER_PROFILES = None
+
+
+def _load_nlp_model(model_name):
+    # spaCy is only imported in workers that were given a model
+    if model_name is None:
+        return None
+    nlp_model = get_nlp_model((model_name,))
+    if nlp_model is None:
+        logging.error(f"SHARDED MATCHING: spaCy model '{model_name}' not found in worker {os.getpid()}.")
+    return nlp_model
+
+
+def _init_worker(corpus, corpus_side, model_name):
+    """Loads the spaCy model and precomputes the corpus features once per worker process."""
+    global _WORKER_NLP_MODEL, _WORKER_CORPUS_SIDE, _WORKER_PROFILES
+    _WORKER_NLP_MODEL = _load_nlp_model(model_name)
+    _WORKER_CORPUS_SIDE = corpus_side
+    if corpus_side == 'jd':
+        _WORKER_PROFILES = [get_jd_profile(item) if item else None for item in corpus]
+    else:
+        _WORKER_PROFILES = [ResumeMatchProfile(item) if isinstance(item, dict) and item else None for item in corpus]
+    logging.info(f"SHARDED MATCHING: Worker {os.getpid()} ready with {len(corpus)} {corpus_side} profiles.")
+
+
+def _top_k_in_shard(query, corpus_indexes, k):
+    """Best k (corpus_index, results) pairs of one shard for the query."""
+    shard_profiles = [_WORKER_PROFILES[i] for i in corpus_indexes]
+    if _WORKER_CORPUS_SIDE == 'jd':
+        return [(corpus_indexes[i], results) for i, results in top_k_matches(query, shard_profiles, k, _WORKER_NLP_MODEL)]
+
+    # Resume corpus: score each resume of the shard against the query JD
+    best_matches = []
+    for corpus_index, resume_profile in zip(corpus_indexes, shard_profiles):
+        if resume_profile is None:
+            continue
+        results = calculate_match_score(resume_profile, query, _WORKER_NLP_MODEL)
+        heap_entry = (results.get('score', 0), -corpus_index, results)
+        if len(best_matches) < k:
+            heapq.heappush(best_matches, heap_entry)
+        elif heap_entry[:2] > best_matches[0][:2]:
+            heapq.heapreplace(best_matches, heap_entry)
+    return [(-neg_index, results) for _, neg_index, results in best_matches]
+
+
+def merge_top_k(shard_results, k):
+    """
+    Merges per-shard [(corpus_index, results)] lists into the global top k,
+    best first, ties going to the lower corpus index.
+    """
+    all_matches = [match for shard in shard_results for match in shard]
+    all_matches.sort(key=lambda match: (-match[1].get('score', 0), match[0]))
+    return all_matches[:k]
+
+
+class ShardedMatcher:
+    """
+    Process pool holding one corpus (parsed JDs, or parsed resumes with
+    corpus_side='resume'). Every worker loads the spaCy model and builds the
+    corpus profiles once at startup; each query is then split into shards
+    of corpus indexes, scored in parallel and merged into a global top-k.
+    Use as a context manager or call close() when done.
+    """
+    def __init__(self, corpus, corpus_side='jd', model_name=None, n_workers=None):
+        if corpus_side not in ('jd', 'resume'):
+            raise ValueError(f"corpus_side must be 'jd' or 'resume', got '{corpus_side}'")
+        self.corpus_size = len(corpus)
+        self.corpus_side = corpus_side
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=self.n_workers, initializer=_init_worker,
+                                             initargs=(list(corpus), corpus_side, model_name))
+        logging.info(f"SHARDED MATCHING: Started {self.n_workers} workers for {self.corpus_size} {corpus_side}s.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(cancel_futures=True)
+
+    def top_k(self, query, k, corpus_indexes=None):
+        """
+        Returns the k best (corpus_index, results) pairs for the query (a
+        parsed resume against a JD corpus, or a parsed JD against a resume
+        corpus), best first. corpus_indexes restricts the search to a subset
+        of the corpus, e.g. the JDs left after the page filters.
+        """
+        if not query or k <= 0:
+            return []
+        if corpus_indexes is None:
+            corpus_indexes = range(self.corpus_size)
+        corpus_indexes = np.asarray(corpus_indexes, dtype=np.int64)
+        if not len(corpus_indexes):
+            return []
+        # Workers build the query profile themselves; profiles hold per-process model caches
+        query = getattr(query, 'parsed_resume', None) or getattr(query, 'parsed_jd', None) or query
+
+        n_shards = min(len(corpus_indexes), self.n_workers * SHARDS_PER_WORKER)
+        shards = [shard.tolist() for shard in np.array_split(corpus_indexes, n_shards)]
+        futures = [self._executor.submit(_top_k_in_shard, query, shard, k) for shard in shards]
+        return merge_top_k([future.result() for future in futures], k)
@@ -1,29 +1,13 @@
 import re
-import spacy
 import json
 from collections import defaultdict
 import datetime
-from spacy.matcher import PhraseMatcher
 from dateutil.parser import parse as parse_datetime
 from dateutil.relativedelta import relativedelta
 import logging
 import os
 from file_utils import read_docx_file,read_pdf_file,read_text_file,get_text_from_txt_object,get_text_from_docx_object,get_text_from_pdf_object
-
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
-
-NLP_MODEL_GLOBAL = None 
-try:
-    NLP_MODEL_GLOBAL = spacy.load("en_core_web_md") 
-    logging.info("Global NLP Model ('en_core_web_md') loaded successfully.")
-except OSError:
-    logging.error("Spacy model 'en_core_web_md' not found. Please run 'python -m spacy download en_core_web_md'")
-    logging.info("Attempting to load 'en_core_web_sm' as a fallback...")
-    try:
-        NLP_MODEL_GLOBAL = spacy.load("en_core_web_sm")
-        logging.info("Global NLP Model ('en_core_web_sm') loaded successfully as fallback.")
-    except OSError:
-        logging.error("Spacy model 'en_core_web_sm' also not found. NLP features will be unavailable if not passed explicitly.")
+from lazy_loading import get_nlp_model, lazy_module_attributes
 
 
 def clean_text(text):
@@ -62,8 +46,23 @@ def load_skills(skill_file=None):
         logging.error(f"General error loading skills from {skill_file}: {e}") 
         return []
 
-TECH_SKILLS_LIST_GLOBAL = load_skills()
-TECH_SKILLS_SET_GLOBAL = set(TECH_SKILLS_LIST_GLOBAL)
+_TECH_SKILLS = None
+
+def get_tech_skills():
+    """skills.json as (list, set), loaded once on first use."""
+    global _TECH_SKILLS
+    if _TECH_SKILLS is None:
+        skills_list = load_skills()
+        _TECH_SKILLS = (skills_list, set(skills_list))
+    return _TECH_SKILLS
+
+# NLP_MODEL_GLOBAL, TECH_SKILLS_LIST_GLOBAL and TECH_SKILLS_SET_GLOBAL are loaded on first access,
+# so importing the parser doesn't load spaCy or the skills file
+__getattr__ = lazy_module_attributes(globals(), {
+    'NLP_MODEL_GLOBAL': get_nlp_model,
+    'TECH_SKILLS_LIST_GLOBAL': lambda: get_tech_skills()[0],
+    'TECH_SKILLS_SET_GLOBAL': lambda: get_tech_skills()[1],
+})
 
 # do NOT use \\s
 SECTION_HEADERS_GLOBAL = {
@@ -278,6 +277,7 @@ def parse_resume_sections(sections, kit: ParsingKit):
         skills_doc = kit.nlp(skills_text)
         found_skills = set() 
 
+        from spacy.matcher import PhraseMatcher
         matcher = PhraseMatcher(kit.nlp.vocab, attr="LOWER")
         patterns = [kit.nlp.make_doc(skill) for skill in kit.tech_skills]
         matcher.add("TECH_SKILLS",patterns)
@@ -898,6 +898,8 @@ def process_streamlit_file(
 
 """
 if __name__ == '__main__':
+    # Configured here rather than at import so importing the parser leaves the caller's logging alone
+    logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
     SECTION_HEADERS_CONFIG_MAIN = {
         "summary": r"^\s*(summary|profile|objective|about\s*me)\s*[:\n]",
@@ -917,13 +919,12 @@ if __name__ == '__main__':
     }
     
      
-    nlp_model_main = NLP_MODEL_GLOBAL 
+    nlp_model_main = get_nlp_model()
     if nlp_model_main is None:
         logging.critical("NLP Model (NLP_MODEL_GLOBAL) is None. Cannot proceed with parsing in main. Exiting.")
         exit()
  
-    skills_list = TECH_SKILLS_LIST_GLOBAL
-    skills_set = TECH_SKILLS_SET_GLOBAL
+    skills_list, skills_set = get_tech_skills()
     SECTION_HEADERS_CONFIG = SECTION_HEADERS_GLOBAL 
     EDUCATION_LEVELS_CONFIG = EDUCATION_LEVELS_GLOBAL
 
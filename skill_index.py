@@ -0,0 +1,83 @@
+import logging
+import numpy as np
+
+
+# Default minimum number of shared skills for a JD to be kept as a candidate
+DEFAULT_MIN_SKILL_OVERLAP = 1
+
+
+def _normalize_skills(skills):
+    # Same normalization as the matcher's skills_set
+    return {str(s).lower() for s in skills if isinstance(s, str)}
+
+
+def _resume_skills_set(resume):
+    """Accepts a ResumeMatchProfile, a parsed resume dict or an iterable of skill names."""
+    skills_set = getattr(resume, 'skills_set', None)
+    if skills_set is not None:
+        return skills_set
+    if isinstance(resume, dict):
+        return _normalize_skills(resume.get('skills', []))
+    return _normalize_skills(resume)
+
+
+class SkillIndex:
+    """
+    Inverted index skill -> posting list of JD IDs (positions in the list
+    the index was built from), built from the parsed JD 'skills' field.
+    Used to narrow a resume query down to the JDs sharing at least
+    min_overlap skills with it before full scoring runs.
+    """
+    def __init__(self, n_jds=0, postings=None):
+        self.n_jds = n_jds
+        # skill -> sorted int32 array of JD IDs
+        self.postings = postings if postings is not None else {}
+
+    @classmethod
+    def from_parsed_jds(cls, parsed_jds):
+        posting_lists = {}
+        for jd_id, parsed_jd in enumerate(parsed_jds):
+            if not parsed_jd:
+                continue
+            for skill in _normalize_skills(parsed_jd.get('skills', []) or []):
+                posting_lists.setdefault(skill, []).append(jd_id)
+        postings = {skill: np.array(jd_ids, dtype=np.int32) for skill, jd_ids in posting_lists.items()}
+        logging.info(f"SKILL INDEX: Indexed {len(parsed_jds)} JDs with {len(postings)} distinct skills.")
+        return cls(len(parsed_jds), postings)
+
+    def __len__(self):
+        return len(self.postings)
+
+    def overlap_counts(self, resume):
+        """Number of skills every JD shares with the resume, as an int array of length n_jds."""
+        matched_postings = [self.postings[skill] for skill in _resume_skills_set(resume) if skill in self.postings]
+        if not matched_postings:
+            return np.zeros(self.n_jds, dtype=np.int64)
+        return np.bincount(np.concatenate(matched_postings), minlength=self.n_jds)
+
+    def candidates(self, resume, min_overlap=DEFAULT_MIN_SKILL_OVERLAP):
+        """Sorted JD IDs sharing at least min_overlap skills with the resume."""
+        if min_overlap <= 0:
+            return np.arange(self.n_jds)
+        return np.flatnonzero(self.overlap_counts(resume) >= min_overlap)
+
+    def save(self, path):
+        """
+        Writes the index as a .npz file: skill names plus all posting lists
+        concatenated with their offsets (CSR layout), no pickling.
+        """
+        skills = list(self.postings)
+        lengths = [len(self.postings[skill]) for skill in skills]
+        offsets = np.zeros(len(skills) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        jd_ids = np.concatenate([self.postings[skill] for skill in skills]) if skills else np.zeros(0, dtype=np.int32)
+        np.savez_compressed(path, skills=np.array(skills, dtype=str), offsets=offsets,
+                            jd_ids=jd_ids.astype(np.int32), n_jds=np.array(self.n_jds))
+        logging.info(f"SKILL INDEX: Saved {len(skills)} posting lists to {path}")
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            skills, offsets, jd_ids = data['skills'], data['offsets'], data['jd_ids']
+            postings = {str(skill): jd_ids[offsets[i]:offsets[i + 1]] for i, skill in enumerate(skills)}
+            return cls(int(data['n_jds']), postings)
@@ -0,0 +1,167 @@
+import json
+import logging
+import os
+import threading
+import numpy as np
+
+
+SKILLS_JSON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'data', 'skills.json')
+
+# Skills are packed 64 per word so overlaps can be counted with AND + popcount
+BITS_PER_WORD = 64
+
+# Same tempering rule as calculate_match_score: need at least 4 JD skills for full confidence
+MIN_SKILLS_FOR_FULL_CONFIDENCE = 4
+
+
+class SkillVocabulary:
+    """
+    Maps lowercased skill names to dense integer IDs. IDs never change once
+    assigned, so bitsets encoded earlier stay valid when new skills (e.g. API
+    tags merged into a JD's skills) are added later. Adding is locked, so
+    threads sharing the vocabulary never give two skills the same ID.
+    """
+    def __init__(self, skills=()):
+        self.skill_to_id = {}
+        self.id_to_skill = []
+        self._lock = threading.Lock()
+        self.add_skills(skills)
+
+    def __len__(self):
+        return len(self.id_to_skill)
+
+    @property
+    def n_words(self):
+        return max(1, -(-len(self.id_to_skill) // BITS_PER_WORD))
+
+    def add_skill(self, skill):
+        skill = str(skill).lower()
+        skill_id = self.skill_to_id.get(skill)
+        if skill_id is None:
+            with self._lock:
+                # Another thread may have added it while this one waited
+                skill_id = self.skill_to_id.get(skill)
+                if skill_id is None:
+                    skill_id = len(self.id_to_skill)
+                    self.id_to_skill.append(skill)
+                    self.skill_to_id[skill] = skill_id
+        return skill_id
+
+    def add_skills(self, skills):
+        for skill in skills:
+            if isinstance(skill, str):
+                self.add_skill(skill)
+
+    def encode_ids(self, skills, add_missing=True):
+        """
+        Returns the sorted unique IDs of the skills. Unknown skills are added
+        to the vocabulary unless add_missing is False, then they are dropped.
+        """
+        skill_ids = set()
+        for skill in skills:
+            if not isinstance(skill, str):
+                continue
+            if add_missing:
+                skill_ids.add(self.add_skill(skill))
+            else:
+                skill_id = self.skill_to_id.get(skill.lower())
+                if skill_id is not None:
+                    skill_ids.add(skill_id)
+        return np.array(sorted(skill_ids), dtype=np.int64)
+
+    def encode(self, skills, add_missing=True):
+        return pack_skill_ids(self.encode_ids(skills, add_missing), self.n_words)
+
+    def decode(self, skill_bits):
+        """Returns the skill names set in a packed bitset, in ID order."""
+        return [self.id_to_skill[skill_id] for skill_id in unpack_skill_ids(skill_bits)]
+
+
+def pack_skill_ids(skill_ids, n_words):
+    skill_bits = np.zeros(n_words, dtype=np.uint64)
+    if len(skill_ids):
+        skill_ids = np.asarray(skill_ids, dtype=np.int64)
+        np.bitwise_or.at(skill_bits, skill_ids // BITS_PER_WORD,
+                         np.left_shift(np.uint64(1), (skill_ids % BITS_PER_WORD).astype(np.uint64)))
+    return skill_bits
+
+
+def unpack_skill_ids(skill_bits):
+    # Little-endian bit order so bit i of word w is skill ID w * 64 + i
+    bit_flags = np.unpackbits(np.ascontiguousarray(skill_bits, dtype='<u8').view(np.uint8), bitorder='little')
+    return np.flatnonzero(bit_flags)
+
+
+def pad_skill_bits(skill_bits, n_words):
+    if len(skill_bits) >= n_words:
+        return skill_bits
+    padded = np.zeros(n_words, dtype=np.uint64)
+    padded[:len(skill_bits)] = skill_bits
+    return padded
+
+
+def stack_skill_bits(skill_bits_rows, n_words):
+    """Stacks packed bitsets (encoded at possibly smaller vocab sizes) into a (rows, n_words) matrix."""
+    skill_matrix = np.zeros((len(skill_bits_rows), n_words), dtype=np.uint64)
+    for row, skill_bits in enumerate(skill_bits_rows):
+        skill_matrix[row, :len(skill_bits)] = skill_bits
+    return skill_matrix
+
+
+def skill_overlap_counts(resume_skill_bits, jd_skill_matrix):
+    """Number of shared skills between one resume and every JD row, via AND + popcount."""
+    resume_skill_bits = pad_skill_bits(resume_skill_bits, jd_skill_matrix.shape[1])[:jd_skill_matrix.shape[1]]
+    return np.bitwise_count(jd_skill_matrix & resume_skill_bits).sum(axis=1, dtype=np.int64)
+
+
+def skill_scores_from_counts(match_counts, required_counts):
+    """
+    Vectorized version of the matcher's skill score: match ratio tempered by
+    confidence when a JD lists fewer than MIN_SKILLS_FOR_FULL_CONFIDENCE skills.
+    """
+    match_counts = np.asarray(match_counts, dtype=np.float64)
+    required_counts = np.asarray(required_counts, dtype=np.float64)
+    has_skills = required_counts > 0
+    safe_required = np.where(has_skills, required_counts, 1.0)
+    raw_scores = np.where(has_skills, match_counts / safe_required, 0.0)
+    confidence = np.where(required_counts < MIN_SKILLS_FOR_FULL_CONFIDENCE,
+                          required_counts / MIN_SKILLS_FOR_FULL_CONFIDENCE, 1.0)
+    return raw_scores * confidence
+
+
+def load_skill_vocabulary(skill_file=None, extra_skills=None):
+    """
+    Builds a vocabulary from skills.json plus any extra skills (for example
+    tags collected from the RemoteOK API).
+    """
+    if skill_file is None:
+        skill_file = SKILLS_JSON_PATH
+    skills_data = []
+    try:
+        with open(skill_file, "r", encoding="utf-8") as f:
+            skills_data = json.load(f)
+    except FileNotFoundError:
+        logging.error(f"Skill file not found at {skill_file}")
+    except json.JSONDecodeError:
+        logging.error(f"Error decoding JSON from skill file: {skill_file}")
+
+    vocabulary = SkillVocabulary(skills_data)
+    if extra_skills:
+        vocabulary.add_skills(extra_skills)
+    logging.info(f"Skill vocabulary built with {len(vocabulary)} skills.")
+    return vocabulary
+
+
+_DEFAULT_VOCABULARY = None
+_DEFAULT_VOCABULARY_LOCK = threading.Lock()
+
+
+def get_skill_vocabulary():
+    """Shared vocabulary used by the matcher, loaded from skills.json on first use."""
+    global _DEFAULT_VOCABULARY
+    if _DEFAULT_VOCABULARY is None:
+        with _DEFAULT_VOCABULARY_LOCK:
+            # Threads that waited here must get the instance the first one built, not a second one
+            if _DEFAULT_VOCABULARY is None:
+                _DEFAULT_VOCABULARY = load_skill_vocabulary()
+    return _DEFAULT_VOCABULARY
@@ -0,0 +1,158 @@
+"""
+Synthetic resume / JD generator for benchmarks. The parsed test data,
+parsed_kaggle_jobs_sample.json and skills.json are used as templates, so
+generated documents keep realistic skill counts, titles, text and
+experience/education distributions, just at any corpus size.
+diversify_titles and make_random_vector_model build title corpora and a
+vector model for the title search benchmarks and tests.
+"""
+import glob
+import json
+import logging
+import os
+import random
+
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+TEST_DATA_DIR = os.path.join(PROJECT_ROOT, 'tests', 'data')
+KAGGLE_JOBS_SAMPLE_PATH = os.path.join(PROJECT_ROOT, 'parsed_kaggle_jobs_sample.json')
+SKILLS_JSON_PATH = os.path.join(TEST_DATA_DIR, 'skills.json')
+
+# Chance that a generated skill comes from the whole skills.json instead of the template skill frequencies
+RARE_SKILL_PROBABILITY = 0.2
+SENIORITY_PREFIXES = ['Junior', 'Senior', 'Lead', 'Principal', 'Staff']
+
+
+def _load_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logging.error(f"SYNTHETIC CORPUS: Could not load template file {path}: {e}")
+        return default
+
+
+def _load_folder(folder):
+    return [data for data in (_load_json(path, None) for path in sorted(glob.glob(os.path.join(folder, '*.json'))))
+            if isinstance(data, dict)]
+
+
+def _strings(values):
+    return [value for value in values or [] if isinstance(value, str) and value.strip()]
+
+
+class CorpusTemplates:
+    """Pools of skills, titles, sentences and numeric values collected from the template files."""
+    def __init__(self, jd_templates, resume_templates, all_skills):
+        self.all_skills = _strings(all_skills)
+        self.jd_skill_pool = [skill for jd in jd_templates for skill in _strings(jd.get('skills'))]
+        self.resume_skill_pool = [skill for resume in resume_templates for skill in _strings(resume.get('skills'))]
+        self.jd_skill_counts = [len(_strings(jd.get('skills'))) for jd in jd_templates] or [3]
+        self.resume_skill_counts = [len(_strings(resume.get('skills'))) for resume in resume_templates] or [5]
+
+        self.jd_titles = _strings(jd.get('job_title') for jd in jd_templates)
+        self.responsibilities = [line for jd in jd_templates for line in _strings(jd.get('responsibilities'))]
+        self.qualifications = [line for jd in jd_templates for line in _strings(jd.get('qualifications'))]
+        self.jd_experience_years = [jd.get('minimum_years_experience') for jd in jd_templates]
+        self.jd_education_levels = [jd.get('required_education_level') for jd in jd_templates]
+
+        experience_entries = [entry for resume in resume_templates for entry in resume.get('experience', []) or []
+                              if isinstance(entry, dict)]
+        self.resume_titles = _strings(entry.get('job_title') for entry in experience_entries) or self.jd_titles
+        self.experience_descriptions = _strings(entry.get('description') for entry in experience_entries) or self.responsibilities
+        self.summaries = _strings(resume.get('summary_text') for resume in resume_templates)
+        self.resume_experience_years = [resume.get('total_years_experience', 0) or 0 for resume in resume_templates] or [0]
+        self.resume_education_levels = [resume.get('education_level', -1) for resume in resume_templates] or [-1]
+
+    @classmethod
+    def load(cls):
+        jd_templates = _load_folder(os.path.join(TEST_DATA_DIR, 'job_descriptions'))
+        jd_templates += [jd for jd in _load_json(KAGGLE_JOBS_SAMPLE_PATH, []) if isinstance(jd, dict)]
+        resume_templates = _load_folder(os.path.join(TEST_DATA_DIR, 'resumes'))
+        templates = cls(jd_templates, resume_templates, _load_json(SKILLS_JSON_PATH, []))
+        logging.info(f"SYNTHETIC CORPUS: Loaded {len(jd_templates)} JD and {len(resume_templates)} resume templates.")
+        return templates
+
+    def sample_skills(self, rng, count, skill_pool):
+        skills = set()
+        for _ in range(count * 3):
+            if len(skills) >= count:
+                break
+            pool = self.all_skills if (rng.random() < RARE_SKILL_PROBABILITY or not skill_pool) else skill_pool
+            if pool:
+                skills.add(rng.choice(pool))
+        return sorted(skills)
+
+    def sample_title(self, rng, titles):
+        title = rng.choice(titles) if titles else "Software Engineer"
+        if rng.random() < 0.3:
+            title = f"{rng.choice(SENIORITY_PREFIXES)} {title}"
+        return title
+
+
+def generate_jd(rng, templates):
+    return {
+        'job_title': templates.sample_title(rng, templates.jd_titles),
+        'skills': templates.sample_skills(rng, rng.choice(templates.jd_skill_counts), templates.jd_skill_pool),
+        'minimum_years_experience': rng.choice(templates.jd_experience_years),
+        'required_education_level': rng.choice(templates.jd_education_levels),
+        'responsibilities': rng.sample(templates.responsibilities, min(len(templates.responsibilities), rng.randint(1, 5))),
+        'qualifications': rng.sample(templates.qualifications, min(len(templates.qualifications), rng.randint(1, 5))),
+        'preferred_qualifications': [],
+    }
+
+
+def generate_resume(rng, templates):
+    experience = []
+    for _ in range(rng.randint(0, 4)):
+        experience.append({
+            'job_title': templates.sample_title(rng, templates.resume_titles),
+            'company': None,
+            'description': rng.choice(templates.experience_descriptions) if templates.experience_descriptions else "",
+        })
+    return {
+        'summary_text': rng.choice(templates.summaries) if templates.summaries else "",
+        'skills': templates.sample_skills(rng, rng.choice(templates.resume_skill_counts), templates.resume_skill_pool),
+        'experience': experience,
+        'total_years_experience': round(max(0.0, rng.choice(templates.resume_experience_years) + rng.uniform(-1.5, 1.5)), 1),
+        'education_level': rng.choice(templates.resume_education_levels),
+    }
+
+
+def generate_jds(n, seed=0, templates=None):
+    """n synthetic parsed JDs; the same seed always gives the same corpus."""
+    templates = templates or CorpusTemplates.load()
+    rng = random.Random(seed)
+    return [generate_jd(rng, templates) for _ in range(n)]
+
+
+def generate_resumes(n, seed=0, templates=None):
+    """n synthetic parsed resumes; the same seed always gives the same corpus."""
+    templates = templates or CorpusTemplates.load()
+    rng = random.Random(seed)
+    return [generate_resume(rng, templates) for _ in range(n)]
+
+
+def diversify_titles(jds, n_titles, seed=0):
+    """Gives the JDs n_titles distinct titles made from the words of the template titles."""
+    rng = random.Random(seed)
+    words = sorted({word for jd in jds for word in jd['job_title'].split()})
+    titles = set()
+    while len(titles) < min(n_titles, len(words) ** 3):
+        titles.add(" ".join(rng.sample(words, rng.randint(2, 3))))
+    titles = sorted(titles)
+    for jd in jds:
+        jd['job_title'] = rng.choice(titles)
+    return jds
+
+
+def make_random_vector_model(texts, dimension, seed=0):
+    """Blank English pipeline with a random vector for every token of the texts."""
+    # Only the title benchmarks need spaCy, so the corpus generator stays cheap to import
+    import numpy as np
+    import spacy
+    nlp = spacy.blank("en")
+    rng = np.random.default_rng(seed)
+    for token_text in sorted({token.text for text in texts for token in nlp.make_doc(text)}):
+        nlp.vocab.set_vector(token_text, rng.normal(size=dimension).astype(np.float32))
+    return nlp
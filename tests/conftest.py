@@ -0,0 +1,20 @@
+import json
+import os
+import sys
+import pytest
+
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(tests_dir)
+sys.path.insert(0, project_root)
+
+
+def _load_data(filename, subfolder):
+    with open(os.path.join(tests_dir, 'data', subfolder, filename), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def load_data():
+    """load_data(filename, subfolder) reads a parsed JSON file from tests/data/<subfolder>."""
+    return _load_data
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import numpy as np
+
+import async_matching
+from async_matching import AsyncMatcher
+from matcher import calculate_match_score, score_matches, top_k_matches
+
+
+def test_async_facade_matches_sync_results(load_data):
+    """
+    Tests that the async match, chunked score and top-k calls give the same
+    results as the blocking matcher functions.
+    """
+    print("\n--- Testing AsyncMatcher results ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_01.json', 'resumes')
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 12)]
+
+    async def run_all(matcher):
+        return await asyncio.gather(matcher.match_async(resume_data, jd_list[0], None),
+                                    matcher.score_matches_async(resume_data, jd_list, None, chunk_size=3),
+                                    matcher.top_k_matches_async(resume_data, jd_list, 3, None))
+
+    # --- Act ---
+    with AsyncMatcher(max_concurrent_matches=2) as matcher:
+        single, component_scores, top_matches = asyncio.run(run_all(matcher))
+
+    # --- Assert ---
+    assert single == calculate_match_score(resume_data, jd_list[0], None)
+    assert np.array_equal(component_scores, score_matches(resume_data, jd_list, None)), "Chunked scores should equal one call"
+    assert top_matches == top_k_matches(resume_data, jd_list, 3, None)
+
+    print("Assert: Checks passed!")
+
+
+def test_cancelling_a_batch_drops_chunks_not_started(load_data, monkeypatch):
+    """
+    Tests that with one match at a time, cancelling a batch while its first
+    chunk runs keeps every other chunk from ever reaching the executor.
+    """
+    print("\n--- Testing AsyncMatcher batch cancellation ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_01.json', 'resumes')
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 7)]
+    chunk_started = threading.Event()
+    release_chunk = threading.Event()
+    chunk_calls = []
+
+    def blocking_score_matches(parsed_resume, parsed_jds, nlp_model):
+        chunk_calls.append(len(parsed_jds))
+        chunk_started.set()
+        release_chunk.wait(5)
+        return score_matches(parsed_resume, parsed_jds, nlp_model)
+
+    monkeypatch.setattr(async_matching, 'score_matches', blocking_score_matches)
+
+    async def cancel_mid_batch(matcher):
+        batch = asyncio.ensure_future(matcher.score_matches_async(resume_data, jd_list, None, chunk_size=1))
+        await asyncio.get_running_loop().run_in_executor(None, chunk_started.wait, 5)
+        batch.cancel()
+        release_chunk.set()
+        try:
+            await batch
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    # --- Act ---
+    with AsyncMatcher(max_concurrent_matches=1) as matcher:
+        was_cancelled = asyncio.run(cancel_mid_batch(matcher))
+
+    # --- Assert ---
+    assert was_cancelled
+    assert chunk_calls == [1], "Only the chunk already running should have been scored"
+
+    print("Assert: Checks passed!")
@@ -0,0 +1,60 @@
+import json
+
+from synthetic_corpus import CorpusTemplates, generate_jds, generate_resumes
+import benchmark_matcher
+from benchmark_matcher import main as run_benchmark_cli
+
+
+def test_synthetic_corpus_is_deterministic_and_well_formed():
+    """
+    Tests that the generator gives the requested number of parsed-looking
+    documents and the same corpus for the same seed.
+    """
+    print("\n--- Testing synthetic corpus generator ---")
+
+    #---Arrange---
+    templates = CorpusTemplates.load()
+
+    # --- Act ---
+    jds = generate_jds(50, seed=7, templates=templates)
+    resumes = generate_resumes(20, seed=7, templates=templates)
+
+    # --- Assert ---
+    assert len(jds) == 50 and len(resumes) == 20
+    assert jds == generate_jds(50, seed=7, templates=templates), "Same seed should give the same JDs"
+    assert jds != generate_jds(50, seed=8, templates=templates), "Different seeds should give different JDs"
+    for jd in jds:
+        assert jd['job_title'] and isinstance(jd['skills'], list) and jd['responsibilities']
+    assert any(resume['experience'] for resume in resumes), "Some resumes should have experience entries"
+
+    print("Assert: Checks passed!")
+
+
+def test_benchmark_writes_json_report(tmp_path):
+    """
+    Tests a tiny benchmark run end to end: every mode is reported with
+    throughput, latency percentiles and peak RSS.
+    """
+    print("\n--- Testing benchmark JSON report ---")
+
+    #---Arrange---
+    output_path = tmp_path / 'benchmark_results.json'
+
+    # --- Act ---
+    run_benchmark_cli(['--sizes', '30', '--queries', '2', '--pair-samples', '10', '--k', '3', '--output', str(output_path)])
+
+    # --- Assert ---
+    with open(output_path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    modes = {record['mode'] for record in report['results']}
+    assert modes == {'jd_profile_build', 'single_pair', 'batch', 'top_k'}
+    peak_rss_values = [record['process_peak_rss_mb'] for record in report['results']]
+    for record in report['results']:
+        if benchmark_matcher.resource is not None:
+            assert record['process_peak_rss_mb'] > 0
+        if record['mode'] != 'jd_profile_build':
+            assert record['pairs_per_sec'] > 0 and record['p99_ms'] >= record['p50_ms']
+    if benchmark_matcher.resource is not None:
+        assert peak_rss_values == sorted(peak_rss_values), "Process peak RSS is cumulative and never decreases"
+
+    print("Assert: Checks passed!")
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from matcher import calculate_match_scores, top_k_matches
+from columnar_matcher import JDColumnarCorpus, score_corpus, top_k_from_corpus, iter_matches_from_corpus
+
+
+def test_columnar_scores_equal_per_dict_scores(load_data):
+    """
+    Tests that scoring straight from DataFrame columns gives the same scores
+    and top-k as the per-dict matcher over df.to_dict(orient='records'),
+    including rows with a missing (NaN) experience requirement.
+    """
+    print("\n--- Testing columnar matcher for resume_04 vs job_01..job_11 ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_04.json', 'resumes')
+    jd_frame = pd.DataFrame([load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 12)])
+    jd_frame.loc[2, 'minimum_years_experience'] = np.nan
+    jd_records = jd_frame.to_dict(orient='records')
+    expected_results = calculate_match_scores(resume_data, jd_records, None)
+    filtered_rows = [0, 2, 5, 9]
+
+    # --- Act ---
+    corpus = JDColumnarCorpus(jd_frame)
+    component_scores = score_corpus(resume_data, corpus, None)
+    top_matches = top_k_from_corpus(resume_data, corpus, 3, None, rows=filtered_rows)
+    snapshots = list(iter_matches_from_corpus(resume_data, corpus, 3, None, rows=filtered_rows, chunk_size=3))
+
+    # --- Assert ---
+    for row, results in zip(component_scores, expected_results):
+        assert row['score'] == results['score'], "Final score mismatch"
+        assert row['experience'] == results['experience_details']['score']
+        assert row['keyword'] == results['keyword_details']['score']
+    expected_top = top_k_matches(resume_data, [jd_records[row] for row in filtered_rows], 3, None)
+    assert [row for row, _ in top_matches] == [filtered_rows[i] for i, _ in expected_top], "Filtered top-k order mismatch"
+    assert [results['score'] for _, results in top_matches] == [results['score'] for _, results in expected_top]
+    assert [snapshot['scored'] for snapshot in snapshots] == [3, 4]
+    assert snapshots[-1]['matches'] == top_matches, "Last streamed snapshot should equal top_k_from_corpus"
+
+    print("Assert: Checks passed!")
@@ -0,0 +1,41 @@
+import numpy as np
+
+from matcher import calculate_match_scores, score_matches
+from component_store import MatchComponentStore, make_weight_vector
+
+
+def test_reweighting_matches_rescoring_and_survives_save_load(load_data, tmp_path):
+    """
+    Tests that default weights reproduce the matcher scores, that new
+    weights give the weighted component sum, and that a saved store
+    loads back (memory-mapped) with the same rankings.
+    """
+    print("\n--- Testing MatchComponentStore re-weighting ---")
+
+    #---Arrange---
+    resume_list = [load_data(f'resume_{i:02d}.json', 'resumes') for i in range(1, 5)]
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 12)]
+    skills_only = make_weight_vector(skill=1.0, experience=0.0, education=0.0, title=0.0, keyword=0.0)
+    store_path = str(tmp_path / 'components.npy')
+
+    # --- Act ---
+    store = MatchComponentStore.from_parsed(resume_list, jd_list, None)
+    default_scores = store.scores()
+    skill_scores = store.scores(skills_only)
+    store.save(store_path)
+    loaded_store = MatchComponentStore.load(store_path)
+
+    # --- Assert ---
+    assert store.shape == (len(resume_list), len(jd_list))
+    for i, resume_data in enumerate(resume_list):
+        all_results = calculate_match_scores(resume_data, jd_list, None)
+        expected_scores = np.array([results['score'] for results in all_results])
+        expected_skills = np.array([results['skill_details']['score'] for results in all_results])
+        assert np.allclose(default_scores[i], expected_scores, atol=1e-6), "Default weights should reproduce the matcher scores"
+        assert np.allclose(skill_scores[i], expected_skills, atol=1e-6), "Skills-only weights should give the skill scores"
+        assert list(loaded_store.rank(i, skills_only)) == list(store.rank(i, skills_only))
+
+    single_store = MatchComponentStore.from_component_records(score_matches(resume_list[0], jd_list, None))
+    assert np.allclose(single_store.scores()[0], default_scores[0], atol=1e-6)
+
+    print("Assert: Checks passed!")
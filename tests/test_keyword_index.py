@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from matcher import score_matches, build_jd_keyword_text
+from keyword_index import KeywordIndex, HashedKeywordScorer
+
+
+def test_overlap_mode_equals_matcher_and_bm25_is_bounded(load_data):
+    """
+    Tests that the sparse overlap index reproduces the matcher's keyword
+    scores exactly and that BM25 scores stay in [0, 1], reaching 1 for a
+    resume that contains every JD token.
+    """
+    print("\n--- Testing KeywordIndex overlap and BM25 modes ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_01.json', 'resumes')
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 12)]
+    full_coverage_resume = {'summary_text': " ".join(build_jd_keyword_text(jd.get) for jd in jd_list)}
+
+    # --- Act ---
+    overlap_scores = KeywordIndex('overlap').fit(jd_list).score(resume_data)
+    bm25_index = KeywordIndex('bm25').fit(jd_list)
+    bm25_scores = bm25_index.score(resume_data)
+
+    # --- Assert ---
+    assert np.array_equal(overlap_scores, score_matches(resume_data, jd_list, None)['keyword']), "Overlap mode should equal the matcher"
+    assert ((bm25_scores >= 0.0) & (bm25_scores <= 1.0)).all()
+    assert bm25_index.score(full_coverage_resume) == pytest.approx(np.ones(len(jd_list))), "Covering every token should score 1"
+    assert (bm25_index.idf > 0).all()
+    with pytest.raises(ValueError):
+        KeywordIndex('tfidf-cosine')
+
+    print("Assert: Checks passed!")
+
+
+def test_hashed_keyword_scorer_approximates_exact_overlap(load_data):
+    """
+    Tests that wide hashed keyword vectors reproduce the exact keyword
+    scores, that narrow ones stay within [0, 1], and that the scorer plugs
+    into score_matches as the keyword component.
+    """
+    print("\n--- Testing HashedKeywordScorer ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_01.json', 'resumes')
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 12)]
+    exact_scores = score_matches(resume_data, jd_list, None)
+
+    # --- Act ---
+    wide_scores = HashedKeywordScorer()(resume_data, jd_list)
+    narrow_scores = HashedKeywordScorer(n_features=16)(resume_data, jd_list)
+    plugged_scores = score_matches(resume_data, jd_list, None, keyword_scorer=HashedKeywordScorer())
+    fitted_scorer = HashedKeywordScorer().fit(jd_list + jd_list[:2])
+    fitted_rows_before = fitted_scorer.jd_matrix.shape[0]
+    fitted_scores = fitted_scorer.score(resume_data)
+    chunk_scores = fitted_scorer(resume_data, jd_list[3:6])
+
+    # --- Assert ---
+    assert wide_scores == pytest.approx(exact_scores['keyword'], abs=0.02), "2^20 buckets should be near exact"
+    assert ((narrow_scores >= 0.0) & (narrow_scores <= 1.0)).all()
+    assert plugged_scores['keyword'] == pytest.approx(wide_scores)
+    assert np.array_equal(plugged_scores['skill'], exact_scores['skill']), "Other components should be untouched"
+    assert HashedKeywordScorer().transform([{'a', 'b'}]).shape == (1, 2 ** 20)
+    assert fitted_rows_before == len(jd_list), "Duplicate JDs should share one hashed row"
+    assert np.array_equal(fitted_scores, np.concatenate([wide_scores, wide_scores[:2]]))
+    assert np.array_equal(chunk_scores, wide_scores[3:6]), "Fitted JDs should be looked up, not rehashed"
+    assert fitted_scorer.jd_matrix.shape[0] == fitted_rows_before
+
+    print("Assert: Checks passed!")
@@ -0,0 +1,60 @@
+import json
+import numpy as np
+
+from matcher import build_jd_keyword_text, get_jd_profile
+from keyword_lsh import KeywordLSHIndex, MinHasher
+from benchmark_keyword_lsh import main as run_lsh_benchmark_cli
+
+
+def test_lsh_retrieves_covering_jd_and_estimates_overlap(load_data):
+    """
+    Tests that MinHash signatures estimate Jaccard similarity, and that a
+    resume containing all of a JD's keywords gets that JD back as an LSH
+    candidate with an estimated keyword score near 1.
+    """
+    print("\n--- Testing KeywordLSHIndex ---")
+
+    #---Arrange---
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 12)]
+    covering_resume = {'summary_text': build_jd_keyword_text(jd_list[4].get)}
+    hasher = MinHasher(512, seed=1)
+    left = {f"token{i}" for i in range(0, 300)}
+    right = {f"token{i}" for i in range(100, 400)}
+
+    # --- Act ---
+    index = KeywordLSHIndex(bands=32, rows=2).fit(jd_list)
+    candidate_ids = index.candidates(covering_resume)
+    estimates = index.estimated_keyword_scores(covering_resume, [4])
+    estimated_jaccard = (hasher.signature(left) == hasher.signature(right)).mean()
+
+    # --- Assert ---
+    assert abs(estimated_jaccard - 0.5) < 0.08, "Signature agreement should estimate Jaccard (0.5 here)"
+    assert 4 in candidate_ids.tolist(), "A JD fully covered by the resume should be a candidate"
+    assert estimates[0] > 0.8
+    assert len(index) == len(jd_list) and index.signatures.shape == (len(jd_list), 64)
+    assert len(index.candidates({'summary_text': ''})) == 0
+    assert get_jd_profile(jd_list[4]).meaningful_tokens <= index.vocabulary
+
+    print("Assert: Checks passed!")
+
+
+def test_lsh_benchmark_writes_json_report(tmp_path):
+    """
+    Tests the recall benchmark end to end on the Kaggle and RemoteOK samples.
+    """
+    print("\n--- Testing keyword LSH benchmark report ---")
+
+    #---Arrange---
+    output_path = tmp_path / 'keyword_lsh_results.json'
+
+    # --- Act ---
+    run_lsh_benchmark_cli(['--configs', '32x1', '--k', '5', '--output', str(output_path)])
+
+    # --- Assert ---
+    with open(output_path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    assert {record['dataset'] for record in report['results']} == {'kaggle', 'remoteok'}
+    for record in report['results']:
+        assert 0.0 <= record['recall_at_k'] <= 1.0 and 0.0 <= record['candidate_share'] <= 1.0
+
+    print("Assert: Checks passed!")
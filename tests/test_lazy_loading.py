@@ -0,0 +1,61 @@
+import spacy
+
+import lazy_loading
+import job_description_parser
+import resume_parser
+from benchmark_startup import measure_import, heavy_modules_imported
+
+
+def test_entry_points_import_without_heavy_dependencies():
+    """
+    Tests that importing the matcher and both parsers in a fresh interpreter
+    loads neither spaCy, pandas nor scikit-learn.
+    """
+    print("\n--- Testing import-time dependencies ---")
+
+    #---Arrange---
+    entry_points = ['matcher', 'resume_parser', 'job_description_parser', 'keyword_index']
+
+    # --- Act ---
+    heavy = {module_name: heavy_modules_imported(measure_import(module_name)) for module_name in entry_points}
+
+    # --- Assert ---
+    assert heavy == {module_name: [] for module_name in entry_points}, f"Heavy modules imported at startup: {heavy}"
+
+    print("Assert: Checks passed!")
+
+
+def test_parser_globals_load_on_first_access(monkeypatch):
+    """
+    Tests that the parsers' model and skill globals are built on first
+    access and that both parsers share one model object.
+    """
+    print("\n--- Testing lazy parser globals ---")
+
+    #---Arrange---
+    nlp = spacy.blank("en")
+    monkeypatch.setitem(lazy_loading._NLP_MODELS, lazy_loading.DEFAULT_NLP_MODEL_NAMES, nlp)
+    lazy_names = [(resume_parser, 'NLP_MODEL_GLOBAL'), (resume_parser, 'TECH_SKILLS_SET_GLOBAL'),
+                  (job_description_parser, 'nlp'), (job_description_parser, 'tech_skills')]
+    for module, name in lazy_names:
+        monkeypatch.delitem(module.__dict__, name, raising=False)
+    loaded_before = [name in module.__dict__ for module, name in lazy_names]
+
+    # --- Act ---
+    try:
+        resume_model = resume_parser.NLP_MODEL_GLOBAL
+        jd_model = job_description_parser.nlp
+        skills_set = resume_parser.TECH_SKILLS_SET_GLOBAL
+        jd_skills = job_description_parser.tech_skills
+        loaded_after = [name in module.__dict__ for module, name in lazy_names]
+    finally:
+        for module, name in lazy_names:
+            module.__dict__.pop(name, None)
+
+    # --- Assert ---
+    assert loaded_before == [False] * 4, "Nothing should be loaded before it is first used"
+    assert loaded_after == [True] * 4, "Loaded values should be kept on the module"
+    assert resume_model is nlp and jd_model is nlp, "Both parsers should share the same model"
+    assert skills_set == set(resume_parser.load_skills()) and jd_skills == job_description_parser.load_skills()
+
+    print("Assert: Checks passed!")
@@ -0,0 +1,156 @@
+import time
+import spacy
+
+import matcher
+import skill_vocab
+from match_cache import code_fingerprint, MatchResultCache, scoring_fingerprint
+from matcher import calculate_match_score, calculate_match_scores, clear_jd_profile_cache, clear_token_cache
+from synthetic_corpus import generate_jds, generate_resumes
+from title_vector_store import TitleVectorStore
+from title_vectors import attach_title_vector_store
+
+
+def test_cache_tiers_count_hits_and_keep_results(load_data, tmp_path):
+    """
+    Tests that the first lookup misses, a repeat hits memory, a new cache on
+    the same file hits disk, and every path returns calculate_match_score's result.
+    """
+    print("\n--- Testing MatchResultCache tiers ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_01.json', 'resumes')
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 6)]
+    cache_path = str(tmp_path / 'matches.sqlite3')
+
+    # --- Act ---
+    with MatchResultCache(cache_path) as cache:
+        first = cache.get_or_compute(resume_data, jd_list[0], None)
+        repeat = cache.get_or_compute(resume_data, jd_list[0], None)
+        batch = cache.get_or_compute_many(resume_data, jd_list, None)
+        warm_stats = cache.stats.as_dict()
+    with MatchResultCache(cache_path) as reopened:
+        from_disk = reopened.get_or_compute_many(resume_data, jd_list, None)
+        disk_stats = reopened.stats.as_dict()
+
+    # --- Assert ---
+    assert first == repeat == calculate_match_score(resume_data, jd_list[0], None)
+    assert batch == from_disk == calculate_match_scores(resume_data, jd_list, None)
+    assert warm_stats['misses'] == 1 + 4 and warm_stats['memory_hits'] == 2
+    assert disk_stats['disk_hits'] == 5 and disk_stats['misses'] == 0 and disk_stats['hit_rate'] == 1.0
+
+    print("Assert: Checks passed!")
+
+
+def test_cache_invalidates_on_weight_or_skills_change(load_data, tmp_path, monkeypatch):
+    """
+    Tests that changing a weight or skills.json changes the fingerprint and
+    that the rows of the old fingerprint are dropped instead of served.
+    """
+    print("\n--- Testing MatchResultCache invalidation ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_01.json', 'resumes')
+    jd_data = load_data('job_01.json', 'job_descriptions')
+    cache_path = str(tmp_path / 'matches.sqlite3')
+    with MatchResultCache(cache_path) as cache:
+        cache.get_or_compute(resume_data, jd_data, None)
+    original_fingerprint = scoring_fingerprint(None)
+    edited_skills = tmp_path / 'skills.json'
+    with open(skill_vocab.SKILLS_JSON_PATH, 'r', encoding='utf-8') as f:
+        edited_skills.write_text(f.read().rstrip() + '\n\n', encoding='utf-8')
+
+    # --- Act ---
+    monkeypatch.setattr(skill_vocab, 'SKILLS_JSON_PATH', str(edited_skills))
+    skills_fingerprint = scoring_fingerprint(None)
+    monkeypatch.setattr(matcher, 'KEYWORD_WEIGHT', 0.25)
+    with MatchResultCache(cache_path) as reweighted:
+        result = reweighted.get_or_compute(resume_data, jd_data, None)
+        stats = reweighted.stats.as_dict()
+        stored_rows = reweighted._connection.execute("SELECT COUNT(*) FROM match_results").fetchone()[0]
+
+    # --- Assert ---
+    assert skills_fingerprint != original_fingerprint, "Editing skills.json should change the fingerprint"
+    assert stats['misses'] == 1 and stats['disk_hits'] == 0, "A result of the old weights must not be served"
+    assert result == calculate_match_score(resume_data, jd_data, None)
+    assert stored_rows == 1, "Only the row of the current fingerprint should remain"
+
+    print("Assert: Checks passed!")
+
+
+def make_named_model(name):
+    nlp = spacy.blank("en")
+    nlp.meta['name'] = name
+    return nlp
+
+
+def test_models_share_one_cache_file(load_data, tmp_path):
+    """
+    Tests that two models scoring into the same cache file keep each
+    other's rows, that a fingerprint survives its model being freed, and
+    that attaching a float16 TitleVectorStore changes the fingerprint.
+    """
+    print("\n--- Testing MatchResultCache with two models on one file ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_01.json', 'resumes')
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 4)]
+    cache_path = str(tmp_path / 'matches.sqlite3')
+    first_model = make_named_model('first')
+    second_model = make_named_model('second')
+
+    # --- Act ---
+    with MatchResultCache(cache_path) as cache:
+        cache.get_or_compute_many(resume_data, jd_list, first_model)
+        cache.get_or_compute_many(resume_data, jd_list, second_model)
+        plain_fingerprint = cache._fingerprint(first_model)
+        attach_title_vector_store(first_model, TitleVectorStore(str(tmp_path / 'titles'), first_model))
+        store_fingerprint = cache._fingerprint(first_model)
+        attach_title_vector_store(first_model, None)
+    with MatchResultCache(cache_path) as reopened:
+        reopened.get_or_compute_many(resume_data, jd_list, first_model)
+        reopened.get_or_compute_many(resume_data, jd_list, make_named_model('second'))
+        stats = reopened.stats.as_dict()
+        stored_rows = reopened._connection.execute("SELECT COUNT(*) FROM match_results WHERE fingerprint = ?",
+                                                   (code_fingerprint(),)).fetchone()[0]
+
+    # --- Assert ---
+    assert stats['disk_hits'] == 6 and stats['misses'] == 0, "Neither model should drop the other's rows"
+    assert stored_rows == 6
+    assert store_fingerprint != plain_fingerprint, "An attached float16 store should change the fingerprint"
+    assert scoring_fingerprint(make_named_model('first')) == plain_fingerprint, "Equal models should share a fingerprint"
+
+    print("Assert: Checks passed!")
+
+
+def test_cached_call_is_faster_than_scoring(tmp_path):
+    """
+    Tests that a get_or_compute_many call served entirely from disk takes
+    less time than scoring the same pairs without the cache.
+    """
+    print("\n--- Testing MatchResultCache hit cost for 2000 synthetic JDs ---")
+
+    #---Arrange---
+    parsed_jds = generate_jds(2000, seed=3)
+    resume_data = generate_resumes(1, seed=4)[0]
+    cache_path = str(tmp_path / 'matches.sqlite3')
+    clear_jd_profile_cache()
+    clear_token_cache()
+    start = time.perf_counter()
+    expected = calculate_match_scores(resume_data, parsed_jds, None)
+    compute_seconds = time.perf_counter() - start
+    with MatchResultCache(cache_path) as cache:
+        cache.get_or_compute_many(resume_data, parsed_jds, None)
+
+    # --- Act ---
+    with MatchResultCache(cache_path) as reopened:
+        start = time.perf_counter()
+        results = reopened.get_or_compute_many(resume_data, parsed_jds, None)
+        cached_seconds = time.perf_counter() - start
+        stats = reopened.stats.as_dict()
+
+    # --- Assert ---
+    assert results == expected
+    assert stats['disk_hits'] == len(parsed_jds) and stats['misses'] == 0
+    assert cached_seconds < compute_seconds, f"All hits took {cached_seconds:.3f}s, scoring took {compute_seconds:.3f}s"
+
+    print("Assert: Checks passed!")
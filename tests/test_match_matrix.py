@@ -0,0 +1,33 @@
+import numpy as np
+
+from matcher import calculate_match_score
+from match_matrix import calculate_score_matrix, COMPONENT_NAMES
+
+
+def test_score_matrix_equals_pairwise_scores(load_data):
+    """
+    Tests that every cell of the all-pairs score matrix (and of each
+    component matrix) equals the float32 of the single-pair matcher result.
+    """
+    print("\n--- Testing calculate_score_matrix for resume_01..resume_07 vs job_01..job_11 ---")
+
+    #---Arrange---
+    resume_list = [load_data(f'resume_{i:02d}.json', 'resumes') for i in range(1, 8)]
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 12)]
+    detail_keys = {'skill': 'skill_details', 'experience': 'experience_details', 'education': 'education_details',
+                   'title': 'title_details', 'keyword': 'keyword_details'}
+
+    # --- Act ---
+    scores, components = calculate_score_matrix(resume_list + [None], jd_list, None, return_components=True)
+
+    # --- Assert ---
+    assert scores.shape == (len(resume_list) + 1, len(jd_list)) and scores.dtype == np.float32
+    for i, resume_data in enumerate(resume_list):
+        for j, jd_data in enumerate(jd_list):
+            results = calculate_match_score(resume_data, jd_data, None)
+            assert scores[i, j] == np.float32(results['score']), f"Score mismatch for resume {i}, JD {j}"
+            for name in COMPONENT_NAMES:
+                assert components[name][i, j] == np.float32(results[detail_keys[name]]['score']), f"{name} mismatch for resume {i}, JD {j}"
+    assert not scores[-1].any(), "Missing resume should get an all-zero row"
+
+    print("Assert: Checks passed!")
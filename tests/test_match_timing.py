@@ -0,0 +1,81 @@
+import numpy as np
+
+from matcher import calculate_match_score, calculate_match_scores, score_matches, top_k_matches
+from match_matrix import calculate_score_matrix
+from match_timing import enable_match_timing, disable_match_timing, get_match_timing_stats, MATCH_COMPONENTS
+
+
+def test_timing_counts_components_only_when_enabled(load_data):
+    """
+    Tests that enabled timing adds a 'timings' entry and cumulative per
+    component counters, and that disabled timing leaves results untouched.
+    """
+    print("\n--- Testing per-component match timing ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_01.json', 'resumes')
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 6)]
+    plain_results = calculate_match_scores(resume_data, jd_list, None)
+
+    # --- Act ---
+    enable_match_timing()
+    try:
+        timed_results = calculate_match_scores(resume_data, jd_list, None)
+    finally:
+        disable_match_timing()
+    untimed_result = calculate_match_score(resume_data, jd_list[0], None)
+
+    # --- Assert ---
+    stats = get_match_timing_stats().as_dict()
+    for component in MATCH_COMPONENTS:
+        assert stats[component]['calls'] == len(jd_list), f"Call count mismatch for {component}"
+        assert stats[component]['total_seconds'] >= 0.0
+    for timed, plain in zip(timed_results, plain_results):
+        timings = timed.pop('timings')
+        assert set(timings) == set(MATCH_COMPONENTS)
+        assert timings['total'] >= sum(timings[c] for c in MATCH_COMPONENTS if c != 'total') - 1e-9
+        assert timed == plain, "Timing should not change the scores"
+    assert 'timings' not in untimed_result, "Disabled timing should not add a timings entry"
+
+    print("Assert: Checks passed!")
+
+
+def test_batch_paths_record_timings(load_data):
+    """
+    Tests that score_matches, top_k_matches and calculate_score_matrix add
+    their batch sizes to the per-component counters.
+    """
+    print("\n--- Testing batch path timing ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_01.json', 'resumes')
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 6)]
+    expected_scores = score_matches(resume_data, jd_list, None)
+    expected_top = top_k_matches(resume_data, jd_list, 2, None)
+
+    # --- Act ---
+    enable_match_timing()
+    try:
+        timed_scores = score_matches(resume_data, jd_list, None)
+        score_stats = {component: stats['calls'] for component, stats in get_match_timing_stats().as_dict().items()}
+        get_match_timing_stats().reset()
+        calculate_score_matrix([resume_data, resume_data], jd_list, None)
+        matrix_stats = {component: stats['calls'] for component, stats in get_match_timing_stats().as_dict().items()}
+        get_match_timing_stats().reset()
+        timed_top = top_k_matches(resume_data, jd_list, 2, None)
+        top_stats = get_match_timing_stats().as_dict()
+    finally:
+        disable_match_timing()
+
+    # --- Assert ---
+    assert np.array_equal(timed_scores, expected_scores), "Timing should not change the scores"
+    assert score_stats == dict.fromkeys(MATCH_COMPONENTS, len(jd_list))
+    assert matrix_stats == dict.fromkeys(MATCH_COMPONENTS, 2 * len(jd_list))
+    # The top-k search counts every JD for the bounds, then the two explained winners go through the per-pair path
+    assert top_stats['skill']['calls'] == len(jd_list) + 2
+    assert top_stats['title']['calls'] >= 2 and top_stats['title']['total_seconds'] > 0.0
+    for (timed_index, timed_result), (index, result) in zip(timed_top, expected_top):
+        timed_result.pop('timings')
+        assert timed_index == index and timed_result == result
+
+    print("Assert: Checks passed!")
@@ -3,13 +3,14 @@ import os
 import pytest 
 import sys
 import datetime
+import numpy as np
 
 
 tests_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(tests_dir)
 sys.path.insert(0, project_root)
 
-from matcher import calculate_match_score
+from matcher import calculate_match_score, calculate_match_scores, top_k_matches, iter_matches, score_matches, explain_match, clean_and_tokenize, clean_and_tokenize_many, clear_token_cache, get_jd_profile, clear_jd_profile_cache, JDMatchProfile, ResumeMatchProfile
 
 
 def load_json_data(filename,data_type='resume'):
@@ -713,4 +714,229 @@ def test_specific_resume01_jd11_pair():
     assert actual_results['keyword_details'].get('total_jd_keywords_count') == expected_results['keyword_details'].get('total_jd_keywords_count'), "Total JD keywords count mismatch"
 
 
-    print("Assert: Checks passed!")
\ No newline at end of file
+    print("Assert: Checks passed!")
+
+
+
+def test_batch_scores_match_single_pair_scores():
+    """
+    Tests that calculate_match_scores gives the same results as calling
+    calculate_match_score once per JD.
+    """
+    print("\n--- Testing batch scoring for resume_01 vs job_01..job_05 ---")
+
+    #---Arrange---
+    resume_data = load_json_data('resume_01.json', 'resume')
+    jd_list = [load_json_data(f'job_0{i}.json', 'jd') for i in range(1, 6)]
+
+    # --- Act ---
+    batch_results = calculate_match_scores(resume_data, jd_list, None)
+
+    # --- Assert ---
+    assert len(batch_results) == len(jd_list), "Batch should return one result per JD"
+    for jd_data, batch_result in zip(jd_list, batch_results):
+        assert batch_result == calculate_match_score(resume_data, jd_data, None), f"Batch result differs for JD '{jd_data.get('job_title')}'"
+
+    print("Assert: Checks passed!")
+
+
+def test_jd_profile_is_cached_by_content_hash():
+    """
+    Tests that JDs with the same content share one JDMatchProfile and that
+    scoring with a profile gives the same results as scoring with the dict.
+    """
+    print("\n--- Testing JDMatchProfile cache for job_01 ---")
+
+    #---Arrange---
+    clear_jd_profile_cache()
+    resume_data = load_json_data('resume_01.json', 'resume')
+    jd_data = load_json_data('job_01.json', 'jd')
+    jd_data_copy = load_json_data('job_01.json', 'jd')
+
+    # --- Act ---
+    jd_profile = get_jd_profile(jd_data)
+
+    # --- Assert ---
+    assert isinstance(jd_profile, JDMatchProfile)
+    assert get_jd_profile(jd_data_copy) is jd_profile, "Same JD content should reuse the cached profile"
+    assert calculate_match_score(resume_data, jd_profile, None) == calculate_match_score(resume_data, jd_data, None), "Profile and dict results differ"
+
+    print("Assert: Checks passed!")
+
+
+def test_resume_profile_reuse_matches_dict_results():
+    """
+    Tests that a ResumeMatchProfile built once gives the same results as
+    passing the parsed resume dict, and flattens the experience titles.
+    """
+    print("\n--- Testing ResumeMatchProfile for resume_04 ---")
+
+    #---Arrange---
+    resume_data = load_json_data('resume_04.json', 'resume')
+    jd_list = [load_json_data('job_03.json', 'jd'), load_json_data('job_09.json', 'jd')]
+
+    # --- Act ---
+    resume_profile = ResumeMatchProfile(resume_data)
+
+    # --- Assert ---
+    expected_titles = [str(entry['job_title']) for entry in resume_data.get('experience', []) if entry.get('job_title')]
+    assert resume_profile.titles_checked == expected_titles, "Flattened title list mismatch"
+    for jd_data in jd_list:
+        assert calculate_match_score(resume_profile, jd_data, None) == calculate_match_score(resume_data, jd_data, None), "Profile and dict results differ"
+    assert calculate_match_scores(resume_profile, jd_list, None) == calculate_match_scores(resume_data, jd_list, None), "Batch results differ"
+
+    print("Assert: Checks passed!")
+
+
+def test_top_k_matches_equals_sorted_full_scoring():
+    """
+    Tests that top_k_matches returns the same JDs, order and results as
+    scoring every JD and sorting the full list.
+    """
+    print("\n--- Testing top_k_matches for resume_07 vs job_01..job_11 ---")
+
+    #---Arrange---
+    resume_data = load_json_data('resume_07.json', 'resume')
+    jd_list = [load_json_data(f'job_{i:02d}.json', 'jd') for i in range(1, 12)]
+    all_results = calculate_match_scores(resume_data, jd_list, None)
+    expected_order = sorted(range(len(jd_list)), key=lambda i: all_results[i]['score'], reverse=True)
+
+    for k in (1, 3, len(jd_list) + 5):
+        # --- Act ---
+        top_matches = top_k_matches(resume_data, jd_list, k, None)
+
+        # --- Assert ---
+        assert [jd_index for jd_index, _ in top_matches] == expected_order[:k], f"Top-{k} order mismatch"
+        for jd_index, results in top_matches:
+            assert results == all_results[jd_index], f"Results differ for JD index {jd_index}"
+
+    print("Assert: Checks passed!")
+
+
+
+def test_top_k_keeps_tie_when_title_similarity_exceeds_one(monkeypatch):
+    """
+    Tests that a JD is not pruned when a float32 title similarity a few ULPs
+    above 1.0 lifts the visited JD's score over the 1.0-based bound of an
+    equally scored JD with a lower index.
+    """
+    print("\n--- Testing top_k_matches bound with title similarity above 1.0 ---")
+
+    #---Arrange---
+    import matcher
+    resume_data = load_json_data('resume_07.json', 'resume')
+    jd_data = load_json_data('job_01.json', 'jd')
+    resume_profile = ResumeMatchProfile(resume_data)
+    jd_profile = get_jd_profile(jd_data)
+    keyword_score = matcher._keyword_score_only(resume_profile, jd_profile)
+    above_one = np.nextafter(np.float32(1.0), np.float32(2.0))
+
+    def similarities_above_one(resume_profile, jd_profiles, nlp_model):
+        return [np.full(len(resume_profile.titles_for_scoring), above_one, dtype=np.float32) for _ in jd_profiles]
+
+    # Same JD twice; the second copy gets a looser keyword bound so it is visited first
+    monkeypatch.setattr(matcher, '_batch_title_similarities', similarities_above_one)
+    monkeypatch.setattr(matcher, '_keyword_score_upper_bounds', lambda resume_profile, jd_profiles: np.array([keyword_score, 1.0]))
+
+    # --- Act ---
+    top_matches = top_k_matches(resume_profile, [jd_data, jd_data], 1, None)
+
+    # --- Assert ---
+    assert resume_profile.titles_for_scoring and jd_profile.title_text.strip(), "Both sides need a title"
+    assert [jd_index for jd_index, _ in top_matches] == [0], "The tie should go to the lower index"
+
+    print("Assert: Checks passed!")
+
+
+def test_score_matches_equals_full_results_scores():
+    """
+    Tests that the score-only record array carries the same final and
+    component scores as the full results dicts, and that explain_match
+    gives the full dict back for a single row.
+    """
+    print("\n--- Testing score_matches / explain_match for resume_01 vs job_01..job_11 ---")
+
+    #---Arrange---
+    resume_data = load_json_data('resume_01.json', 'resume')
+    jd_list = [load_json_data(f'job_{i:02d}.json', 'jd') for i in range(1, 12)] + [None]
+    all_results = calculate_match_scores(resume_data, jd_list, None)
+
+    # --- Act ---
+    component_scores = score_matches(resume_data, jd_list, None)
+
+    # --- Assert ---
+    assert len(component_scores) == len(jd_list)
+    for row, results in zip(component_scores[:-1], all_results[:-1]):
+        assert row['score'] == results['score'], "Final score mismatch"
+        assert row['skill'] == results['skill_details']['score']
+        assert row['experience'] == results['experience_details']['score']
+        assert row['education'] == results['education_details']['score']
+        assert row['title'] == results['title_details']['score']
+        assert row['keyword'] == results['keyword_details']['score']
+    assert component_scores[-1]['score'] == 0.0, "Missing JD should get an all-zero row"
+    assert explain_match(resume_data, jd_list[0], None) == all_results[0], "explain_match should give the full results dict"
+
+    print("Assert: Checks passed!")
+
+
+def test_clean_and_tokenize_memo_and_batched_pipe():
+    """
+    Tests that tokens are memoized per text and that the batched nlp.pipe
+    variant gives the same tokens as one clean_and_tokenize call per text.
+    """
+    print("\n--- Testing clean_and_tokenize memo and clean_and_tokenize_many ---")
+
+    #---Arrange---
+    import spacy
+    clear_token_cache()
+    nlp = spacy.blank("en")
+    texts = ["Senior Python Developer!", "Data Analyst (SQL, Tableau)", "", "Senior Python Developer!", None]
+
+    class CollidingText(str):
+        # Same-length texts whose hashes collide must still get their own tokens
+        def __hash__(self):
+            return 1
+
+    # --- Act ---
+    first = clean_and_tokenize("Built REST APIs with Node.js, Express & MongoDB.")
+    second = clean_and_tokenize("Built REST APIs with Node.js, Express & MongoDB.")
+    batched = clean_and_tokenize_many(texts, nlp)
+    colliding = [clean_and_tokenize(CollidingText("python sql")), clean_and_tokenize(CollidingText("golang sql"))]
+
+    # --- Assert ---
+    assert first == {'built', 'rest', 'apis', 'node', 'js', 'express', 'mongodb'}
+    assert first is second, "Second call should come from the memo"
+    clear_token_cache()
+    assert batched == [clean_and_tokenize(text, nlp) for text in texts], "Batched tokens differ from single calls"
+    assert batched[0] is batched[3], "Repeated texts should share one token set"
+    assert colliding == [{'python', 'sql'}, {'golang', 'sql'}], "Colliding hashes should not share a memo entry"
+
+    print("Assert: Checks passed!")
+
+
+def test_iter_matches_snapshots_converge_to_top_k():
+    """
+    Tests that iter_matches yields one best-first snapshot per chunk, that
+    every snapshot is the top k of the JDs scored so far, and that the last
+    one equals top_k_matches.
+    """
+    print("\n--- Testing iter_matches snapshots for resume_01 vs job_01..job_11 ---")
+
+    #---Arrange---
+    resume_data = load_json_data('resume_01.json', 'resume')
+    jd_list = [load_json_data(f'job_{i:02d}.json', 'jd') for i in range(1, 12)] + [None]
+    k = 3
+
+    # --- Act ---
+    snapshots = list(iter_matches(resume_data, jd_list, k, None, chunk_size=4))
+    expected = top_k_matches(resume_data, jd_list, k, None)
+
+    # --- Assert ---
+    assert [snapshot['scored'] for snapshot in snapshots] == [4, 8, 12]
+    for snapshot in snapshots:
+        scored_so_far = jd_list[:snapshot['scored']]
+        assert snapshot['matches'] == top_k_matches(resume_data, scored_so_far, k, None), "Snapshot should be the top k so far"
+    assert snapshots[-1]['matches'] == expected
+    assert list(iter_matches(resume_data, jd_list, 0, None)) == []
+
+    print("Assert: Checks passed!")
@@ -0,0 +1,36 @@
+from matcher import top_k_matches, calculate_match_score
+from parallel_matching import ShardedMatcher
+
+
+def test_sharded_top_k_equals_single_process_top_k(load_data):
+    """
+    Tests that merging the shard top-k lists from the process pool gives the
+    same global top-k as top_k_matches, for a JD corpus and a resume corpus.
+    """
+    print("\n--- Testing ShardedMatcher vs top_k_matches ---")
+
+    #---Arrange---
+    resume_list = [load_data(f'resume_{i:02d}.json', 'resumes') for i in range(1, 8)]
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 12)]
+    resume_data = resume_list[0]
+    subset_indexes = [1, 3, 4, 8, 10]
+
+    # --- Act ---
+    with ShardedMatcher(jd_list, corpus_side='jd', n_workers=2) as jd_matcher:
+        sharded_jd_matches = jd_matcher.top_k(resume_data, 4)
+        sharded_subset_matches = jd_matcher.top_k(resume_data, 2, corpus_indexes=subset_indexes)
+    with ShardedMatcher(resume_list, corpus_side='resume', n_workers=2) as resume_matcher:
+        sharded_resume_matches = resume_matcher.top_k(jd_list[0], 3)
+
+    # --- Assert ---
+    assert sharded_jd_matches == top_k_matches(resume_data, jd_list, 4, None), "JD corpus top-k mismatch"
+    subset_matches = top_k_matches(resume_data, [jd_list[i] for i in subset_indexes], 2, None)
+    assert sharded_subset_matches == [(subset_indexes[i], results) for i, results in subset_matches], "Subset top-k mismatch"
+
+    all_resume_results = [calculate_match_score(resume, jd_list[0], None) for resume in resume_list]
+    expected_resume_order = sorted(range(len(resume_list)), key=lambda i: (-all_resume_results[i]['score'], i))[:3]
+    assert [index for index, _ in sharded_resume_matches] == expected_resume_order, "Resume corpus top-k mismatch"
+    for index, results in sharded_resume_matches:
+        assert results == all_resume_results[index]
+
+    print("Assert: Checks passed!")
@@ -0,0 +1,35 @@
+import numpy as np
+
+from skill_index import SkillIndex
+
+
+def skills_of(parsed):
+    return {str(s).lower() for s in parsed.get('skills', []) if isinstance(s, str)}
+
+
+def test_candidates_match_brute_force_overlap_and_survive_save_load(load_data, tmp_path):
+    """
+    Tests that the candidate set equals the JDs whose skill sets share at
+    least min_overlap skills with the resume, before and after a disk round-trip.
+    """
+    print("\n--- Testing SkillIndex candidates for resume_01 vs job_01..job_11 ---")
+
+    #---Arrange---
+    resume_data = load_data('resume_01.json', 'resumes')
+    jd_list = [load_data(f'job_{i:02d}.json', 'job_descriptions') for i in range(1, 12)] + [None]
+    skill_index = SkillIndex.from_parsed_jds(jd_list)
+    index_path = str(tmp_path / 'skill_index.npz')
+
+    # --- Act ---
+    skill_index.save(index_path)
+    loaded_index = SkillIndex.load(index_path)
+
+    # --- Assert ---
+    for min_overlap in (1, 2, 5):
+        expected = [i for i, jd in enumerate(jd_list) if jd and len(skills_of(resume_data) & skills_of(jd)) >= min_overlap]
+        assert skill_index.candidates(resume_data, min_overlap).tolist() == expected, f"Candidates mismatch for min_overlap={min_overlap}"
+        assert loaded_index.candidates(resume_data, min_overlap).tolist() == expected, "Loaded index gives different candidates"
+    assert loaded_index.n_jds == len(jd_list)
+    assert np.array_equal(skill_index.candidates(resume_data, 0), np.arange(len(jd_list))), "min_overlap=0 should keep every JD"
+
+    print("Assert: Checks passed!")
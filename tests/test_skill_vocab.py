@@ -0,0 +1,108 @@
+import threading
+import time
+import numpy as np
+
+import skill_vocab
+from skill_vocab import SkillVocabulary, get_skill_vocabulary, load_skill_vocabulary, stack_skill_bits, skill_overlap_counts, skill_scores_from_counts
+
+
+def skills_of(parsed):
+    return {str(s).lower() for s in parsed.get('skills', []) if isinstance(s, str)}
+
+
+def test_encode_decode_roundtrip_with_new_skills():
+    """
+    Tests that skills round-trip through the bitset, including skills that
+    are not in skills.json yet (e.g. API tags).
+    """
+    print("\n--- Testing SkillVocabulary encode/decode ---")
+
+    #---Arrange---
+    vocabulary = load_skill_vocabulary()
+    initial_size = len(vocabulary)
+
+    # --- Act ---
+    skill_bits = vocabulary.encode(["Python", "SQL", "Some Brand New Tag"])
+
+    # --- Assert ---
+    assert len(vocabulary) == initial_size + 1, "Unknown skill should be added to the vocabulary"
+    assert sorted(vocabulary.decode(skill_bits)) == ["python", "some brand new tag", "sql"]
+    assert vocabulary.encode(["Unknown Skill"], add_missing=False).sum() == 0, "add_missing=False should drop unknown skills"
+
+    print("Assert: Checks passed!")
+
+
+def test_overlap_counts_match_set_intersection(load_data):
+    """
+    Tests that AND + popcount over the stacked JD bitsets gives the same
+    counts and skill scores as intersecting the string sets.
+    """
+    print("\n--- Testing skill_overlap_counts for resume_01 vs job_01..job_11 ---")
+
+    #---Arrange---
+    vocabulary = SkillVocabulary()
+    resume_skills = skills_of(load_data('resume_01.json', 'resumes'))
+    jd_skill_sets = [skills_of(load_data(f'job_{i:02d}.json', 'job_descriptions')) for i in range(1, 12)]
+    resume_bits = vocabulary.encode(resume_skills)
+    jd_bits_rows = [vocabulary.encode(jd_skills) for jd_skills in jd_skill_sets]
+
+    # --- Act ---
+    jd_skill_matrix = stack_skill_bits(jd_bits_rows, vocabulary.n_words)
+    match_counts = skill_overlap_counts(resume_bits, jd_skill_matrix)
+    skill_scores = skill_scores_from_counts(match_counts, [len(jd_skills) for jd_skills in jd_skill_sets])
+
+    # --- Assert ---
+    for jd_skills, match_count, skill_score in zip(jd_skill_sets, match_counts, skill_scores):
+        expected_count = len(resume_skills & jd_skills)
+        assert match_count == expected_count
+        expected_score = 0.0
+        if jd_skills:
+            expected_score = (expected_count / len(jd_skills)) * (len(jd_skills) / 4 if len(jd_skills) < 4 else 1.0)
+        assert skill_score == expected_score
+    assert isinstance(match_counts, np.ndarray)
+
+    print("Assert: Checks passed!")
+
+
+def test_concurrent_adds_assign_unique_ids(monkeypatch):
+    """
+    Tests that threads making the first get_skill_vocabulary call and then
+    adding overlapping new skills (as AsyncMatcher workers do with API
+    tags) share one vocabulary and never share an ID.
+    """
+    print("\n--- Testing get_skill_vocabulary and encode_ids from 8 threads ---")
+
+    #---Arrange---
+    def slow_load():
+        # Widens the window in which a second thread could build its own vocabulary
+        time.sleep(0.05)
+        return SkillVocabulary()
+
+    monkeypatch.setattr(skill_vocab, '_DEFAULT_VOCABULARY', None)
+    monkeypatch.setattr(skill_vocab, 'load_skill_vocabulary', slow_load)
+    skills = [f"skill {i}" for i in range(2000)]
+    start = threading.Barrier(8)
+    vocabularies = [None] * 8
+
+    def encode_all(worker):
+        start.wait()
+        vocabularies[worker] = get_skill_vocabulary()
+        # Each thread walks the same skills from a different offset so the adds interleave
+        offset = worker * 250
+        vocabularies[worker].encode_ids(skills[offset:] + skills[:offset])
+
+    # --- Act ---
+    threads = [threading.Thread(target=encode_all, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    vocabulary = get_skill_vocabulary()
+
+    # --- Assert ---
+    assert all(worker_vocabulary is vocabulary for worker_vocabulary in vocabularies), "Every thread should get the same vocabulary"
+    assert len(vocabulary) == len(skills), "Every skill should be added exactly once"
+    assert sorted(vocabulary.skill_to_id.values()) == list(range(len(skills)))
+    assert all(vocabulary.id_to_skill[skill_id] == skill for skill, skill_id in vocabulary.skill_to_id.items())
+
+    print("Assert: Checks passed!")
@@ -0,0 +1,41 @@
+import numpy as np
+
+from matcher import ResumeMatchProfile, top_k_matches
+from title_vectors import title_similarity_matrix
+from title_ann import TitleANNIndex
+from synthetic_corpus import generate_jds, make_random_vector_model, diversify_titles
+
+
+def test_exact_probe_equals_brute_force_and_index_feeds_top_k(load_data, tmp_path):
+    """
+    Tests that probing every list gives the brute-force title ranking, that
+    a partial probe only returns true similarities, that a saved index loads
+    back identically, and that its candidates plug into top_k_matches.
+    """
+    print("\n--- Testing TitleANNIndex ---")
+
+    #---Arrange---
+    resume_profile = ResumeMatchProfile(load_data('resume_01.json', 'resumes'))
+    jd_list = diversify_titles(generate_jds(400, seed=3), 150, seed=3)
+    jd_titles = [jd['job_title'] for jd in jd_list]
+    nlp = make_random_vector_model(jd_titles + resume_profile.titles_for_scoring, 16, seed=3)
+    brute_force = np.maximum(title_similarity_matrix(jd_titles, resume_profile.titles_for_scoring, nlp).max(axis=1), 0.0)
+    expected_order = np.lexsort((np.arange(len(jd_list)), -brute_force))[:10]
+
+    # --- Act ---
+    index = TitleANNIndex.from_parsed_jds(jd_list, nlp, n_lists=8, seed=3)
+    exact_ids, exact_similarities = index.search_titles(resume_profile.titles_for_scoring, nlp, 10, n_probe=index.n_lists)
+    probe_ids, probe_similarities = index.search_titles(resume_profile.titles_for_scoring, nlp, 10, n_probe=2)
+    index.save(tmp_path / 'title_ann.npz')
+    loaded = TitleANNIndex.load(tmp_path / 'title_ann.npz')
+    candidate_ids = index.candidates(resume_profile, nlp, 25, n_probe=3)
+    top_matches = top_k_matches(resume_profile, jd_list, 3, nlp, candidate_indexes=candidate_ids)
+
+    # --- Assert ---
+    assert np.allclose(exact_similarities, brute_force[expected_order], atol=1e-6), "Exact probe should match brute force"
+    assert np.allclose(brute_force[probe_ids], probe_similarities, atol=1e-6), "Probed hits should carry their true similarity"
+    assert np.array_equal(loaded.search_titles(resume_profile.titles_for_scoring, nlp, 10, n_probe=2)[0], probe_ids)
+    assert len(candidate_ids) == 25 and np.all(np.diff(candidate_ids) > 0)
+    assert {jd_index for jd_index, _ in top_matches} <= set(candidate_ids.tolist()), "top_k should only score candidates"
+
+    print("Assert: Checks passed!")
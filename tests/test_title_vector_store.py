@@ -0,0 +1,101 @@
+import threading
+import numpy as np
+import pytest
+import spacy
+
+import title_vector_store
+from title_vector_store import TitleVectorStore
+from title_vectors import attach_title_vector_store, title_similarity_matrix, clear_title_vector_cache
+
+
+JD_TITLES = ["Senior Python Developer", "Data Analyst", "Cloud Engineer", "Barista"]
+RESUME_TITLES = ["Software Engineer", "Python Developer", "Data Analyst"]
+
+
+def make_vector_model():
+    # Blank English pipeline with small random word vectors, "Barista" has none
+    nlp = spacy.blank("en")
+    rng = np.random.default_rng(7)
+    for title in JD_TITLES + RESUME_TITLES:
+        for token in nlp(title):
+            if token.text != "Barista":
+                nlp.vocab.set_vector(token.text, rng.normal(size=16).astype(np.float32))
+    return nlp
+
+
+def test_store_persists_and_grows_across_reopen(tmp_path, monkeypatch):
+    """
+    Tests that titles written by one store are read back by a new read-only
+    store (as after a restart), that the vectors file grows past its initial
+    capacity, and that similarities with the store match Doc.similarity.
+    """
+    print("\n--- Testing TitleVectorStore persistence ---")
+
+    #---Arrange---
+    monkeypatch.setattr(title_vector_store, 'TITLE_VECTOR_STORE_INITIAL_CAPACITY', 2)
+    nlp = make_vector_model()
+    clear_title_vector_cache()
+    writer = TitleVectorStore(str(tmp_path), nlp)
+    attach_title_vector_store(nlp, writer)
+
+    # --- Act ---
+    written = title_similarity_matrix(JD_TITLES, RESUME_TITLES, nlp)
+    reader_model = make_vector_model()
+    reader = TitleVectorStore(str(tmp_path), reader_model, read_only=True)
+    attach_title_vector_store(reader_model, reader)
+    read_back = title_similarity_matrix(JD_TITLES, RESUME_TITLES, reader_model)
+    attach_title_vector_store(nlp, None)
+
+    # --- Assert ---
+    assert len(writer) == len(set(JD_TITLES + RESUME_TITLES)) == len(reader)
+    assert writer._vectors.shape[0] >= len(writer), "Vectors file should grow past its initial capacity"
+    assert np.array_equal(written, read_back), "A reopened store should give identical similarities"
+    assert reader.get("Barista")[1] is None, "Titles without vectors are stored as such"
+    assert "  Data Analyst " in reader, "Keys use the normalized title"
+    for i, jd_title in enumerate(JD_TITLES[:3]):
+        for j, resume_title in enumerate(RESUME_TITLES):
+            assert written[i, j] == pytest.approx(nlp(jd_title).similarity(nlp(resume_title)), abs=2e-3)
+    with pytest.raises(RuntimeError):
+        reader.add("New Title", ("New", "Title"), None)
+
+    print("Assert: Checks passed!")
+
+
+def test_concurrent_adds_keep_titles_on_their_rows(tmp_path, monkeypatch):
+    """
+    Tests that threads adding different titles to one store (as Streamlit
+    sessions do) each get their own row, across file growth, and that a
+    reopened store serves every title its own vector.
+    """
+    print("\n--- Testing TitleVectorStore concurrent adds ---")
+
+    #---Arrange---
+    monkeypatch.setattr(title_vector_store, 'TITLE_VECTOR_STORE_INITIAL_CAPACITY', 2)
+    nlp = make_vector_model()
+    store = TitleVectorStore(str(tmp_path), nlp)
+    rng = np.random.default_rng(3)
+    titles = [f"Title {i}" for i in range(200)]
+    vectors = rng.normal(size=(len(titles), 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    start = threading.Barrier(8)
+
+    def add_titles(worker):
+        start.wait()
+        for i in range(worker, len(titles), 8):
+            store.add(titles[i], (titles[i],), vectors[i])
+
+    # --- Act ---
+    threads = [threading.Thread(target=add_titles, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    reopened = TitleVectorStore(str(tmp_path), nlp, read_only=True)
+
+    # --- Assert ---
+    stored_rows = sorted(row for row, _, _ in reopened.rows.values())
+    assert stored_rows == list(range(len(titles))), "Every title should get a row of its own"
+    for title, vector in zip(titles, vectors):
+        assert reopened.get(title)[1] == pytest.approx(vector, abs=2e-3)
+
+    print("Assert: Checks passed!")
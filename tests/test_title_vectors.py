@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+import spacy
+from spacy.language import Language
+
+from title_vectors import (title_similarity_matrix, max_title_similarities, get_title_embedding, clear_title_vector_cache,
+                           set_title_embedding_mode)
+
+
+JD_TITLES = ["Senior Python Developer", "Data Analyst", "Senior Python Developer", "Cloud Engineer"]
+RESUME_TITLES = ["Software Engineer", "Python Developer", "Data Analyst", "Barista"]
+
+
+def make_vector_model():
+    """
+    Blank English pipeline with small random word vectors, enough for
+    Doc.vector and Doc.similarity to work without a downloaded model.
+    """
+    nlp = spacy.blank("en")
+    rng = np.random.default_rng(42)
+    for title in JD_TITLES + RESUME_TITLES:
+        for token in nlp(title):
+            if token.text != "Barista":
+                nlp.vocab.set_vector(token.text, rng.normal(size=16).astype(np.float32))
+    return nlp
+
+
+def test_similarity_matrix_matches_doc_similarity():
+    """
+    Tests that the matrix cosine scores match Doc.similarity for every pair,
+    including the identical-title and missing-vector cases.
+    """
+    print("\n--- Testing title_similarity_matrix vs Doc.similarity ---")
+
+    #---Arrange---
+    clear_title_vector_cache()
+    nlp = make_vector_model()
+
+    # --- Act ---
+    similarities = title_similarity_matrix(JD_TITLES, RESUME_TITLES, nlp)
+
+    # --- Assert ---
+    assert similarities.shape == (len(JD_TITLES), len(RESUME_TITLES))
+    for i, jd_title in enumerate(JD_TITLES):
+        jd_doc = nlp(jd_title)
+        for j, resume_title in enumerate(RESUME_TITLES):
+            resume_doc = nlp(resume_title)
+            expected = 0.0
+            if jd_doc.vector_norm and resume_doc.vector_norm:
+                expected = jd_doc.similarity(resume_doc)
+            assert similarities[i, j] == pytest.approx(expected, abs=1e-5), f"Mismatch for '{jd_title}' vs '{resume_title}'"
+
+    assert similarities[1, 2] == 1.0, "Identical titles should score exactly 1.0"
+    assert not similarities[:, 3].any(), "Title without vectors should score 0.0"
+
+    expected_max = np.maximum(similarities.max(axis=1), 0.0)
+    assert np.allclose(max_title_similarities(JD_TITLES, RESUME_TITLES, nlp), expected_max)
+
+    print("Assert: Checks passed!")
+
+
+def test_title_embedding_is_cached_per_distinct_title():
+    """
+    Tests that a title string is run through the model only once.
+    """
+    print("\n--- Testing title embedding cache ---")
+
+    #---Arrange---
+    clear_title_vector_cache()
+    nlp = make_vector_model()
+
+    # --- Act ---
+    first = get_title_embedding("Data Analyst", nlp)
+    second = get_title_embedding("Data Analyst", nlp)
+
+    # --- Assert ---
+    assert first is second, "Second lookup should come from the cache"
+    assert first[0] == ("Data", "Analyst")
+    assert np.linalg.norm(first[1]) == pytest.approx(1.0, abs=1e-6), "Cached vector should be normalized"
+
+    print("Assert: Checks passed!")
+
+
+PIPELINE_CALLS = []
+
+
+@Language.component("count_title_calls")
+def count_title_calls(doc):
+    PIPELINE_CALLS.append(doc.text)
+    return doc
+
+
+def test_static_mode_skips_pipeline_and_matches_pipeline_mode():
+    """
+    Tests that static-vector title embeddings never run the pipeline
+    components and give the same similarities as the full pipeline.
+    """
+    print("\n--- Testing static vs pipeline title embeddings ---")
+
+    #---Arrange---
+    nlp = make_vector_model()
+    nlp.add_pipe("count_title_calls")
+    titles = JD_TITLES + ["  Senior  Data Analyst ", "Python"]
+    PIPELINE_CALLS.clear()
+
+    # --- Act ---
+    set_title_embedding_mode('static')
+    static_similarities = title_similarity_matrix(titles, RESUME_TITLES, nlp)
+    static_calls = len(PIPELINE_CALLS)
+    set_title_embedding_mode('pipeline')
+    pipeline_similarities = title_similarity_matrix(titles, RESUME_TITLES, nlp)
+    set_title_embedding_mode('static')
+
+    # --- Assert ---
+    assert static_calls == 0, "Static mode should only use the tokenizer"
+    assert len(PIPELINE_CALLS) > 0
+    assert np.allclose(static_similarities, pipeline_similarities, atol=1e-6)
+    with pytest.raises(ValueError):
+        set_title_embedding_mode('transformer')
+
+    print("Assert: Checks passed!")
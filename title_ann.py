@@ -0,0 +1,199 @@
+import logging
+import numpy as np
+
+from matcher import get_resume_profile, get_jd_profile, _uses_title_vectors
+from title_vectors import build_title_matrix
+
+
+# Lists probed per query title unless the caller asks for more (higher = better recall, slower)
+DEFAULT_N_PROBE = 8
+KMEANS_ITERATIONS = 20
+# k-means is trained on at most this many titles per list, as IVF indexes usually do
+KMEANS_TRAINING_POINTS_PER_LIST = 256
+# Rows per block when assigning titles to lists, bounds the (rows, n_lists) score matrix
+ASSIGNMENT_BLOCK_SIZE = 65536
+
+_ORTH_KEY_SEPARATOR = '\x1f'
+
+
+def default_n_lists(n_titles):
+    # Usual IVF sizing: about sqrt(n) lists
+    return max(1, int(round(np.sqrt(n_titles))))
+
+
+def _segment_positions(starts, ends):
+    """Concatenation of arange(start, end) for every segment, without a Python loop."""
+    lengths = ends - starts
+    segment_ends = np.cumsum(lengths)
+    return np.arange(segment_ends[-1] if len(lengths) else 0) + np.repeat(starts - (segment_ends - lengths), lengths)
+
+
+def _nearest_centroids(vectors, centroids):
+    """Index of the most similar centroid for every row, in blocks."""
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), ASSIGNMENT_BLOCK_SIZE):
+        block = vectors[start:start + ASSIGNMENT_BLOCK_SIZE]
+        assignments[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return assignments
+
+
+def spherical_kmeans(vectors, n_clusters, n_iterations=KMEANS_ITERATIONS, seed=0):
+    """
+    k-means on unit vectors with cosine similarity (Lloyd iterations,
+    centroids renormalized every step). Empty clusters are reseeded with
+    random points. Returns the (n_clusters, dim) float32 unit centroids.
+    """
+    rng = np.random.default_rng(seed)
+    n_clusters = min(n_clusters, len(vectors))
+    centroids = vectors[rng.choice(len(vectors), size=n_clusters, replace=False)].copy()
+    for _ in range(n_iterations):
+        assignments = _nearest_centroids(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, vectors)
+        norms = np.linalg.norm(sums, axis=1)
+        empty = norms == 0
+        if empty.any():
+            sums[empty] = vectors[rng.choice(len(vectors), size=int(empty.sum()))]
+            norms[empty] = np.linalg.norm(sums[empty], axis=1)
+        centroids = (sums / norms[:, None]).astype(np.float32)
+    return centroids
+
+
+class TitleANNIndex:
+    """
+    Inverted-file (IVF) approximate nearest neighbour index over the unit
+    title vectors of a JD corpus. Distinct JD titles are partitioned with
+    spherical k-means; a query title only scans the n_probe lists whose
+    centroids are most similar to it. Each title keeps the IDs (positions in
+    the list the index was built from) of the JDs that carry it.
+    Similarities follow title_similarity_matrix: cosine of the unit vectors,
+    1.0 for identical tokens, titles without vectors are never returned.
+    """
+    def __init__(self, centroids, list_offsets, title_vectors, title_orth_keys, jd_offsets, jd_ids, n_jds):
+        self.centroids = centroids
+        # Titles are stored grouped by list: list i owns rows list_offsets[i]:list_offsets[i + 1]
+        self.list_offsets = list_offsets
+        self.title_vectors = title_vectors
+        self.title_orth_keys = title_orth_keys
+        # Title row t is carried by JDs jd_ids[jd_offsets[t]:jd_offsets[t + 1]]
+        self.jd_offsets = jd_offsets
+        self.jd_ids = jd_ids
+        self.n_jds = n_jds
+        self._orth_key_rows = {orth_key: row for row, orth_key in enumerate(title_orth_keys)}
+
+    @classmethod
+    def from_parsed_jds(cls, parsed_jds, nlp_model, n_lists=None, seed=0):
+        if not _uses_title_vectors(nlp_model):
+            raise ValueError("TitleANNIndex needs an nlp model with word vectors")
+        title_jd_ids = {}
+        for jd_id, parsed_jd in enumerate(parsed_jds):
+            if not parsed_jd:
+                continue
+            title_text = get_jd_profile(parsed_jd).title_text
+            if title_text.strip():
+                title_jd_ids.setdefault(title_text, []).append(jd_id)
+
+        titles = list(title_jd_ids)
+        matrix, valid_mask, orth_keys = build_title_matrix(titles, nlp_model)
+        valid_rows = np.flatnonzero(valid_mask)
+        vectors = matrix[valid_rows]
+        n_lists = default_n_lists(len(vectors)) if n_lists is None else n_lists
+        if not len(vectors):
+            return cls(np.zeros((0, matrix.shape[1]), dtype=np.float32), np.zeros(1, dtype=np.int64), vectors, [],
+                       np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32), len(parsed_jds))
+
+        rng = np.random.default_rng(seed)
+        n_training = min(len(vectors), KMEANS_TRAINING_POINTS_PER_LIST * n_lists)
+        training_vectors = vectors[rng.choice(len(vectors), size=n_training, replace=False)]
+        centroids = spherical_kmeans(training_vectors, n_lists, seed=seed)
+
+        assignments = _nearest_centroids(vectors, centroids)
+        order = np.argsort(assignments, kind='stable')
+        list_offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=len(centroids)), out=list_offsets[1:])
+
+        ordered_titles = [titles[valid_rows[row]] for row in order]
+        jd_lengths = [len(title_jd_ids[title]) for title in ordered_titles]
+        jd_offsets = np.zeros(len(ordered_titles) + 1, dtype=np.int64)
+        np.cumsum(jd_lengths, out=jd_offsets[1:])
+        jd_ids = np.array([jd_id for title in ordered_titles for jd_id in title_jd_ids[title]], dtype=np.int32)
+        logging.info(f"TITLE ANN: Indexed {len(ordered_titles)} distinct titles of {len(parsed_jds)} JDs in {len(centroids)} lists.")
+        return cls(centroids, list_offsets, np.ascontiguousarray(vectors[order]),
+                   [orth_keys[valid_rows[row]] for row in order], jd_offsets, jd_ids, len(parsed_jds))
+
+    @property
+    def n_lists(self):
+        return len(self.centroids)
+
+    def __len__(self):
+        return len(self.title_vectors)
+
+    def _probe_rows(self, query_vector, n_probe):
+        """Title rows of the n_probe lists closest to the query (every row when n_probe covers all lists)."""
+        if n_probe >= self.n_lists:
+            return np.arange(len(self.title_vectors))
+        probed_lists = np.argpartition(-(self.centroids @ query_vector), n_probe - 1)[:n_probe]
+        return _segment_positions(self.list_offsets[probed_lists], self.list_offsets[probed_lists + 1])
+
+    def search_titles(self, query_titles, nlp_model, k, n_probe=DEFAULT_N_PROBE):
+        """
+        The k JDs whose title is closest to any of the query titles, as
+        (jd_ids, similarities) arrays, best first with ties going to the lower
+        JD ID. n_probe >= n_lists scans every title (exact search).
+        """
+        if not len(self.title_vectors) or not query_titles or k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        query_matrix, query_valid, query_orth_keys = build_title_matrix(list(query_titles), nlp_model)
+
+        query_rows = np.flatnonzero(query_valid)
+        if not len(query_rows):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        query_vectors = query_matrix[query_rows]
+        query_orth_keys = [query_orth_keys[row] for row in query_rows]
+
+        # Union of the probed lists of every query title, plus the titles with identical tokens
+        candidate_rows = [self._probe_rows(query_vector, n_probe) for query_vector in query_vectors]
+        same_token_rows = {self._orth_key_rows[key] for key in query_orth_keys if key in self._orth_key_rows}
+        rows = np.unique(np.concatenate(candidate_rows + [np.array(sorted(same_token_rows), dtype=np.int64)]))
+
+        # Candidates are scored against every query title, so each gets its true best similarity
+        # (same float64 accumulation and identical-tokens rule as title_similarity_matrix)
+        similarities = (self.title_vectors[rows].astype(np.float64) @ query_vectors.astype(np.float64).T).astype(np.float32)
+        for column, orth_key in enumerate(query_orth_keys):
+            same_tokens_row = self._orth_key_rows.get(orth_key)
+            if same_tokens_row is not None:
+                similarities[np.searchsorted(rows, same_tokens_row), column] = 1.0
+        similarities = similarities.max(axis=1)
+
+        # Every JD carrying a title gets its similarity
+        jd_ids = self.jd_ids[_segment_positions(self.jd_offsets[rows], self.jd_offsets[rows + 1])].astype(np.int64)
+        jd_similarities = np.repeat(similarities, self.jd_offsets[rows + 1] - self.jd_offsets[rows])
+        best = np.lexsort((jd_ids, -jd_similarities))[:k]
+        return jd_ids[best], jd_similarities[best]
+
+    def candidates(self, resume, nlp_model, n_candidates, n_probe=DEFAULT_N_PROBE):
+        """
+        Sorted IDs of the n_candidates JDs whose title is closest to any title
+        the resume is scored with (empty without work experience), for
+        top_k_matches(..., candidate_indexes=...).
+        """
+        resume_profile = get_resume_profile(resume)
+        if not resume_profile.has_experience:
+            return np.zeros(0, dtype=np.int64)
+        jd_ids, _ = self.search_titles(resume_profile.titles_for_scoring, nlp_model, n_candidates, n_probe)
+        return np.sort(jd_ids)
+
+    def save(self, path):
+        """Writes the index as a .npz file (orth keys joined into strings), no pickling."""
+        np.savez_compressed(path, centroids=self.centroids, list_offsets=self.list_offsets,
+                            title_vectors=self.title_vectors, jd_offsets=self.jd_offsets, jd_ids=self.jd_ids,
+                            title_orth_keys=np.array([_ORTH_KEY_SEPARATOR.join(key) for key in self.title_orth_keys], dtype=str),
+                            n_jds=np.array(self.n_jds))
+        logging.info(f"TITLE ANN: Saved {len(self)} titles in {self.n_lists} lists to {path}")
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            orth_keys = [tuple(key.split(_ORTH_KEY_SEPARATOR)) if key else () for key in data['title_orth_keys'].tolist()]
+            return cls(data['centroids'], data['list_offsets'], data['title_vectors'], orth_keys,
+                       data['jd_offsets'], data['jd_ids'], int(data['n_jds']))
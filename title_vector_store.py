@@ -0,0 +1,159 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import unicodedata
+import numpy as np
+
+
+DEFAULT_TITLE_VECTOR_STORE_DIR = 'title_vector_store'
+TITLE_VECTOR_STORE_INITIAL_CAPACITY = 1024
+
+VECTORS_FILENAME = 'vectors.npy'
+INDEX_FILENAME = 'index.jsonl'
+
+
+def normalize_title(title):
+    """Store key text of a title: NFC unicode with surrounding whitespace removed."""
+    return unicodedata.normalize('NFC', title).strip()
+
+
+def title_key(title):
+    return hashlib.blake2b(normalize_title(title).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def model_store_id(nlp_model):
+    # Vectors only make sense for the model that produced them, so every model gets its own folder
+    meta = nlp_model.meta
+    return f"{meta.get('lang', 'xx')}_{meta.get('name', 'model')}-{meta.get('version', '0')}-{nlp_model.vocab.vectors_length}d"
+
+
+class TitleVectorStore:
+    """
+    Title embeddings persisted on disk so they survive restarts. Unit vectors
+    are float16 rows of a memory-mapped .npy file; each index.jsonl line maps
+    the hash of a normalized title to its row along with the orth key used
+    for the identical-tokens rule. New titles are appended: vector row first,
+    then the index line, so a reader never sees an unwritten row.
+    Any number of processes can read the same files through the page cache;
+    only one process should write, though threads of that process (e.g.
+    Streamlit sessions) can share one store. Readers pick up appended titles
+    on a miss.
+    """
+    def __init__(self, directory, nlp_model, model_id=None, read_only=False):
+        self.path = os.path.join(directory, model_id or model_store_id(nlp_model))
+        self.vector_length = nlp_model.vocab.vectors_length
+        self.read_only = read_only
+        self.rows = {}
+        self._next_row = 0
+        self._index_offset = 0
+        self._vectors = None
+        # Guards row assignment, the index file and swapping the vectors file
+        self._lock = threading.RLock()
+        if not read_only:
+            os.makedirs(self.path, exist_ok=True)
+        self.refresh()
+        logging.info(f"TITLE VECTOR STORE: Opened {self.path} with {len(self.rows)} titles.")
+
+    @property
+    def vectors_path(self):
+        return os.path.join(self.path, VECTORS_FILENAME)
+
+    @property
+    def index_path(self):
+        return os.path.join(self.path, INDEX_FILENAME)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, title):
+        return title_key(title) in self.rows
+
+    def refresh(self):
+        """Reads index lines appended since the last call and remaps the vectors file if it grew."""
+        with self._lock:
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    f.seek(self._index_offset)
+                    for line in iter(f.readline, ''):
+                        if not line.endswith('\n'):
+                            break  # Partially written line, read it on the next refresh
+                        entry = json.loads(line)
+                        # Lines without 'row' come from stores written before it was recorded, where it was the line number
+                        row = entry.get('row', self._next_row)
+                        self.rows[entry['key']] = (row, tuple(entry['orth']), entry['has_vector'])
+                        self._next_row = max(self._next_row, row + 1)
+                        self._index_offset = f.tell()
+            if self._vectors is None or self._next_row > self._vectors.shape[0]:
+                self._open_vectors()
+
+    def _open_vectors(self):
+        if os.path.exists(self.vectors_path):
+            self._vectors = np.load(self.vectors_path, mmap_mode='r' if self.read_only else 'r+')
+        elif not self.read_only:
+            self._vectors = np.lib.format.open_memmap(self.vectors_path, mode='w+', dtype=np.float16,
+                                                      shape=(TITLE_VECTOR_STORE_INITIAL_CAPACITY, self.vector_length))
+
+    def _grow(self):
+        # .npy headers have a fixed shape, so a bigger file is written next to the old one and swapped in
+        old_vectors = self._vectors
+        temp_path = self.vectors_path + '.tmp'
+        new_vectors = np.lib.format.open_memmap(temp_path, mode='w+', dtype=np.float16,
+                                                shape=(2 * old_vectors.shape[0], self.vector_length))
+        new_vectors[:old_vectors.shape[0]] = old_vectors
+        new_vectors.flush()
+        del new_vectors
+        # The old file must be unmapped before it is replaced (Windows refuses to replace a mapped file)
+        self._vectors = None
+        del old_vectors
+        os.replace(temp_path, self.vectors_path)
+        self._open_vectors()
+
+    def get(self, title):
+        """(orth_key, unit_vector or None) of a stored title, None when the title is not stored."""
+        key = title_key(title)
+        entry = self.rows.get(key)
+        if entry is None and self.read_only:
+            # The writing process may have appended it since the last look
+            self.refresh()
+            entry = self.rows.get(key)
+        if entry is None:
+            return None
+        row, orth_key, has_vector = entry
+        if not has_vector:
+            return orth_key, None
+        with self._lock:
+            return orth_key, _unit_float32(self._vectors[row])
+
+    def add(self, title, orth_key, unit_vector):
+        """
+        Appends a title and returns its embedding as read back from the store
+        (float16 precision), so stored and fresh titles score the same.
+        """
+        if self.read_only:
+            raise RuntimeError(f"TitleVectorStore at {self.path} is read-only")
+        key = title_key(title)
+        with self._lock:
+            if key in self.rows:
+                return self.get(title)
+
+            row = self._next_row
+            if row >= self._vectors.shape[0]:
+                self._grow()
+            has_vector = unit_vector is not None
+            self._vectors[row] = unit_vector if has_vector else 0.0
+            self._vectors.flush()
+            entry = {'key': key, 'row': row, 'orth': list(orth_key), 'has_vector': has_vector}
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+                self._index_offset = f.tell()
+            self.rows[key] = (row, tuple(orth_key), has_vector)
+            self._next_row = row + 1
+            return self.get(title)
+
+
+def _unit_float32(vector):
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else None
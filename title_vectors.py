@@ -0,0 +1,200 @@
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+import numpy as np
+
+
+# Max number of distinct titles kept per nlp model, least recently used ones are dropped first
+TITLE_VECTOR_CACHE_MAX_SIZE = 100000
+
+# 'static': tokenizer + the static vector table, averaged with NumPy (same values as Doc.vector)
+# 'pipeline': the full nlp pipeline, for models whose vectors come from a tensor or floret n-grams
+TITLE_EMBEDDING_MODES = ('static', 'pipeline')
+TITLE_EMBEDDING_MODE = 'static'
+
+# nlp model -> OrderedDict(title -> (orth_key, unit_vector or None))
+_TITLE_VECTOR_CACHES = weakref.WeakKeyDictionary()
+
+# nlp model -> TitleVectorStore consulted before running the model on a title
+_TITLE_VECTOR_STORES = weakref.WeakKeyDictionary()
+
+# Guards the caches above; titles are embedded outside it, so threads only wait on dict updates
+_TITLE_CACHE_LOCK = threading.RLock()
+
+
+def _get_model_cache(nlp_model):
+    with _TITLE_CACHE_LOCK:
+        model_cache = _TITLE_VECTOR_CACHES.get(nlp_model)
+        if model_cache is None:
+            model_cache = OrderedDict()
+            _TITLE_VECTOR_CACHES[nlp_model] = model_cache
+        return model_cache
+
+
+def clear_title_vector_cache():
+    with _TITLE_CACHE_LOCK:
+        _TITLE_VECTOR_CACHES.clear()
+
+
+def set_title_embedding_mode(mode):
+    global TITLE_EMBEDDING_MODE
+    if mode not in TITLE_EMBEDDING_MODES:
+        raise ValueError(f"mode must be one of {TITLE_EMBEDDING_MODES}, got '{mode}'")
+    TITLE_EMBEDDING_MODE = mode
+    clear_title_vector_cache()
+
+
+def _uses_static_vectors(nlp_model):
+    vectors = nlp_model.vocab.vectors
+    return TITLE_EMBEDDING_MODE == 'static' and vectors.size > 0 and vectors.mode == 'default'
+
+
+def _static_title_embedding(title, nlp_model):
+    """
+    Doc.vector without the pipeline: tokenize only, look the tokens up in the
+    static vector table and average them, tokens without a vector counting as
+    zeros. Returns (orth_key, unit_vector or None) like get_title_embedding.
+    """
+    title_doc = nlp_model.make_doc(title)
+    orth_key = tuple(token.orth_ for token in title_doc)
+    vectors = nlp_model.vocab.vectors
+    vector_keys = title_doc.to_array([vectors.attr]).ravel()
+    vector_rows = np.array([vectors.key2row.get(int(key), -1) for key in vector_keys], dtype=np.int64)
+    vector_rows = vector_rows[vector_rows >= 0]
+    if not len(vector_rows):
+        return orth_key, None
+
+    # float32 running sum over the tokens, then / token count, as Doc.vector does
+    mean_vector = np.add.reduce(vectors.data[vector_rows], axis=0, dtype=np.float32) / np.float32(len(title_doc))
+    norm = np.sqrt(np.dot(mean_vector.astype(np.float64), mean_vector.astype(np.float64)))
+    if not norm:
+        return orth_key, None
+    return orth_key, mean_vector / np.float32(norm)
+
+
+def attach_title_vector_store(nlp_model, store):
+    """
+    Makes get_title_embedding read titles of this model from the persistent
+    store and append the ones it has to compute. None detaches the store.
+    """
+    with _TITLE_CACHE_LOCK:
+        _TITLE_VECTOR_CACHES.pop(nlp_model, None)
+        if store is None:
+            _TITLE_VECTOR_STORES.pop(nlp_model, None)
+        else:
+            _TITLE_VECTOR_STORES[nlp_model] = store
+
+
+def get_title_vector_store(nlp_model):
+    """The TitleVectorStore attached to nlp_model, or None."""
+    if nlp_model is None:
+        return None
+    with _TITLE_CACHE_LOCK:
+        return _TITLE_VECTOR_STORES.get(nlp_model)
+
+
+def get_title_embedding(title, nlp_model):
+    """
+    Embeds a title once (static vectors or the full pipeline, see
+    TITLE_EMBEDDING_MODE) and caches the result, also in
+    the model's persistent TitleVectorStore when one is attached.
+    Returns (orth_key, unit_vector). orth_key is the tuple of token texts,
+    used for spaCy's "identical tokens means similarity 1.0" rule.
+    unit_vector is the L2 normalized doc vector, or None when the doc has no
+    vector or a zero vector.
+    """
+    model_cache = _get_model_cache(nlp_model)
+    with _TITLE_CACHE_LOCK:
+        cached = model_cache.get(title)
+        if cached is not None:
+            model_cache.move_to_end(title)
+            return cached
+        store = _TITLE_VECTOR_STORES.get(nlp_model)
+
+    cached = store.get(title) if store is not None else None
+    if cached is None:
+        if _uses_static_vectors(nlp_model):
+            orth_key, unit_vector = _static_title_embedding(title, nlp_model)
+        else:
+            title_doc = nlp_model(title)
+            orth_key = tuple(token.orth_ for token in title_doc)
+            unit_vector = None
+            if title_doc.has_vector and title_doc.vector_norm:
+                unit_vector = np.asarray(title_doc.vector, dtype=np.float32) / np.float32(title_doc.vector_norm)
+        cached = (orth_key, unit_vector) if store is None else store.add(title, orth_key, unit_vector)
+
+    with _TITLE_CACHE_LOCK:
+        model_cache[title] = cached
+        while len(model_cache) > TITLE_VECTOR_CACHE_MAX_SIZE:
+            model_cache.popitem(last=False)
+    return cached
+
+
+def build_title_matrix(titles, nlp_model):
+    """
+    Stacks the cached unit vectors of the titles into one float32 matrix.
+    Returns (matrix, valid_mask, orth_keys). Rows of titles without a usable
+    vector are zeros and marked False in valid_mask.
+    """
+    embeddings = [get_title_embedding(title, nlp_model) for title in titles]
+    vector_length = nlp_model.vocab.vectors_length
+    for _, unit_vector in embeddings:
+        if unit_vector is not None:
+            vector_length = unit_vector.shape[0]
+            break
+
+    matrix = np.zeros((len(titles), vector_length), dtype=np.float32)
+    valid_mask = np.zeros(len(titles), dtype=bool)
+    for row, (_, unit_vector) in enumerate(embeddings):
+        if unit_vector is not None:
+            matrix[row] = unit_vector
+            valid_mask[row] = True
+    orth_keys = [orth_key for orth_key, _ in embeddings]
+    return matrix, valid_mask, orth_keys
+
+
+def title_similarity_matrix(jd_titles, resume_titles, nlp_model, resume_title_matrix=None):
+    """
+    Cosine similarity of every JD title against every resume title, as a
+    (len(jd_titles), len(resume_titles)) float32 matrix computed with one
+    matrix product. Follows Doc.similarity: pairs with identical tokens score
+    1.0 and pairs where either side has no vector score 0.0.
+    resume_title_matrix can be passed to reuse an already built
+    build_title_matrix(resume_titles, nlp_model) result.
+    """
+    if not jd_titles or not resume_titles:
+        return np.zeros((len(jd_titles), len(resume_titles)), dtype=np.float32)
+
+    jd_matrix, jd_valid, jd_keys = build_title_matrix(jd_titles, nlp_model)
+    if resume_title_matrix is None:
+        resume_title_matrix = build_title_matrix(resume_titles, nlp_model)
+    resume_matrix, resume_valid, resume_keys = resume_title_matrix
+
+    # Accumulate in float64 so a title pair gets the same float32 score whether it is
+    # computed alone or inside a bigger matrix (BLAS blocking differs with the shape)
+    similarities = (jd_matrix.astype(np.float64) @ resume_matrix.astype(np.float64).T).astype(np.float32)
+
+    # Doc.similarity returns exactly 1.0 when both titles have the same tokens
+    key_ids = {}
+    jd_key_ids = np.array([key_ids.setdefault(key, len(key_ids)) for key in jd_keys])
+    resume_key_ids = np.array([key_ids.setdefault(key, len(key_ids)) for key in resume_keys])
+    similarities[jd_key_ids[:, None] == resume_key_ids[None, :]] = 1.0
+
+    both_valid = jd_valid[:, None] & resume_valid[None, :]
+    similarities[~both_valid] = 0.0
+
+    if not both_valid.all():
+        logging.warning(f"TITLE VECTORS: {int((~both_valid).sum())} title pair(s) have missing/zero vectors, scored as 0.")
+    return similarities
+
+
+def max_title_similarities(jd_titles, resume_titles, nlp_model):
+    """
+    Best resume title similarity for every JD title (max over the columns of
+    title_similarity_matrix), never below 0.
+    """
+    if not resume_titles:
+        return np.zeros(len(jd_titles), dtype=np.float32)
+    similarities = title_similarity_matrix(jd_titles, resume_titles, nlp_model)
+    return np.maximum(similarities.max(axis=1), 0.0)